@@ -0,0 +1,16 @@
+# django_app/__shared/cache.py
+
+from django.core.cache import caches
+from django.core.cache.backends.dummy import DummyCache
+from django.core.cache.backends.locmem import LocMemCache
+
+
+class CacheUtils:
+    @staticmethod
+    def is_shared(alias='default'):
+        """Whether every worker process reads and writes the same entries under this alias.
+
+        A LocMemCache lives in one process, so a write in one worker could never invalidate what
+        the others hold; caches that must be invalidated stay off on such a backend.
+        """
+        return not isinstance(caches[alias], (LocMemCache, DummyCache))
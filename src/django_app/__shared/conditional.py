@@ -0,0 +1,50 @@
+# django_app/__shared/conditional.py
+
+import hashlib
+
+from django.db.models import Count, Max
+from django.utils.cache import get_conditional_response
+from django.utils.http import http_date
+
+
+class ConditionalUtils:
+    @staticmethod
+    def validators(queryset, last_modified='updated_at'):
+        """Newest modification time and row count of a filtered queryset, in one aggregate query.
+
+        The count doubles as the exact total of a list page, so lists pay nothing extra for it.
+        """
+        result = queryset.order_by().aggregate(last_modified=Max(last_modified), count=Count('pk'))
+        return {'last_modified': result['last_modified'], 'count': result['count']}
+
+    @staticmethod
+    def is_conditional(request):
+        """Whether the request carries validators from an earlier response to check against."""
+        return request is not None and any(
+            header in request.headers for header in ('If-None-Match', 'If-Modified-Since', 'If-Match', 'If-Unmodified-Since')
+        )
+
+    @staticmethod
+    def etag(*parts):
+        """Strong ETag over everything that shapes a representation (validators, query, media type)."""
+        digest = hashlib.md5(repr(parts).encode(), usedforsecurity=False).hexdigest()
+        return f'"{digest}"'
+
+    @staticmethod
+    def not_modified(request, etag, last_modified=None):
+        """A 304 (or 412) response when the request's validators still match, else None.
+
+        Checked before serialization, so an unchanged resource costs only the validator lookup.
+        """
+        timestamp = int(last_modified.timestamp()) if last_modified else None
+        response = get_conditional_response(request, etag=etag, last_modified=timestamp)
+        if response is None:
+            return None
+        return ConditionalUtils.with_validators(response, etag, last_modified)
+
+    @staticmethod
+    def with_validators(response, etag, last_modified=None):
+        response['ETag'] = etag
+        if last_modified:
+            response['Last-Modified'] = http_date(last_modified.timestamp())
+        return response
@@ -25,11 +25,26 @@ class ConfigService(BaseSettings):
         raise ValueError("DATABASE_URL must be set for production environment.")
 
     
+    # Cache Settings
+    CACHE_URL: str = ""  # e.g. redis://localhost:6379/0; per-process memory cache when empty, which keeps the place and user caches off
+    PLACE_CACHE_TIMEOUT: int = 300  # Seconds a cached place lookup lives, 0 disables it; needs a shared CACHE_URL
+    USER_CACHE_TIMEOUT: int = 60  # Seconds a user resolved from a JWT stays cached, 0 disables it; needs a shared CACHE_URL
+    USER_CACHE_LOCAL_TIMEOUT: int = 5  # Seconds each worker reuses a resolved user without asking the cache
+
+    @property
+    def CACHE_CONFIG(self) -> dict:
+        if self.CACHE_URL.startswith(("redis://", "rediss://")):
+            return {"BACKEND": "django.core.cache.backends.redis.RedisCache", "LOCATION": self.CACHE_URL}
+        return {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"}
+
     # JWT Settings
     JWT_SECRET_KEY: str = ""
     JWT_ACCESS_TOKEN_LIFETIME_MINUTES: int = 5
     JWT_REFRESH_TOKEN_LIFETIME_DAYS: int = 1
     JWT_ALGORITHM: str = "HS256"
+    TOKEN_BLACKLIST_SYNC_INTERVAL: int = 0  # Seconds between reads of new blacklist rows, 0 checks the database every time
+    TOKEN_WRITE_FLUSH_INTERVAL: float = 1  # Seconds token rows wait to be batch-inserted, 0 writes them inline
+    PASSWORD_HASHING_WORKERS: int = 0  # Processes hashing passwords in bulk user creation, 0 hashes inline
     
     # CORS Settings
     CORS_ALLOW_ALL_ORIGINS: bool = True
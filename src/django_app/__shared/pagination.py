@@ -0,0 +1,53 @@
+# django_app/__shared/pagination.py
+
+import json
+
+from django.db import connections
+
+COUNT_STRATEGIES = ('exact', 'estimated', 'capped', 'none')
+COUNT_CAP = 10000
+# Planner estimates below this are replaced with an exact count, which is cheap at that size
+ESTIMATE_EXACT_THRESHOLD = 1000
+
+
+class CountUtils:
+    @staticmethod
+    def count(queryset, strategy='exact', cap=COUNT_CAP):
+        """Count a queryset with the given strategy, returning (total, strategy actually used)."""
+        queryset = queryset.order_by()
+        if strategy == 'none':
+            return None, 'none'
+        if strategy == 'capped':
+            total = queryset[:cap + 1].count()
+            if total > cap:
+                return cap, 'capped'
+            return total, 'exact'
+        if strategy == 'estimated':
+            estimate = CountUtils.estimate(queryset)
+            if estimate is not None and estimate >= ESTIMATE_EXACT_THRESHOLD:
+                return estimate, 'estimated'
+        return queryset.count(), 'exact'
+
+    @staticmethod
+    def estimate(queryset):
+        """Row estimate from the Postgres planner, or None when it is unavailable."""
+        connection = connections[queryset.db]
+        if connection.vendor != 'postgresql':
+            return None
+
+        with connection.cursor() as cursor:
+            if not queryset.query.has_filters():
+                cursor.execute(
+                    "SELECT reltuples::bigint FROM pg_class WHERE oid = %s::regclass",
+                    [queryset.model._meta.db_table]
+                )
+                row = cursor.fetchone()
+                # reltuples is -1 until the table has been vacuumed or analyzed
+                return row[0] if row and row[0] >= 0 else None
+
+            sql, params = queryset.query.sql_with_params()
+            cursor.execute(f"EXPLAIN (FORMAT JSON) {sql}", params)
+            plan = cursor.fetchone()[0]
+            if isinstance(plan, str):
+                plan = json.loads(plan)
+            return int(plan[0]['Plan']['Plan Rows'])
@@ -0,0 +1,29 @@
+# django_app/__shared/parsers.py
+
+from django.conf import settings
+from rest_framework.exceptions import ParseError
+from rest_framework.parsers import JSONParser
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - orjson is optional, DRF's stdlib parser is the fallback
+    orjson = None
+
+
+class ORJSONParser(JSONParser):
+    """JSONParser backed by orjson; like DRF's strict mode, NaN and Infinity are rejected."""
+
+    def parse(self, stream, media_type=None, parser_context=None):
+        if orjson is None:
+            return super().parse(stream, media_type, parser_context)
+
+        parser_context = parser_context or {}
+        encoding = parser_context.get('encoding', settings.DEFAULT_CHARSET)
+        try:
+            data = stream.read()
+            # orjson reads UTF-8 bytes directly; other charsets are decoded to str first
+            if encoding.lower().replace('-', '') != 'utf8':
+                data = data.decode(encoding)
+            return orjson.loads(data)
+        except (ValueError, UnicodeDecodeError) as exc:
+            raise ParseError(f'JSON parse error - {exc}')
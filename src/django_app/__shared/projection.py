@@ -0,0 +1,43 @@
+# django_app/__shared/projection.py
+
+import re
+from functools import lru_cache
+
+# ModelSerializer sources like get_status_display read the underlying status column
+DISPLAY_SOURCE = re.compile(r'get_(\w+)_display')
+
+
+class ProjectionUtils:
+    @staticmethod
+    @lru_cache(maxsize=None)
+    def _columns(serializer_class, fields):
+        meta = serializer_class.Meta
+        concrete = {field.name for field in meta.model._meta.concrete_fields}
+        declared = getattr(meta, 'field_sources', {})
+
+        columns = []
+        for name, field in serializer_class().fields.items():
+            if fields is not None and name not in fields:
+                continue
+            if name in declared:
+                columns.extend(declared[name])
+                continue
+            attr = field.source.split('.')[0]
+            match = DISPLAY_SOURCE.fullmatch(attr)
+            if match:
+                attr = match.group(1)
+            if attr not in concrete:
+                # Method fields and '*' sources cannot be traced to columns without a declaration
+                return None
+            columns.append(attr)
+        return tuple(dict.fromkeys(columns))
+
+    @staticmethod
+    def columns(serializer_class, fields=None):
+        """Model columns a ModelSerializer reads to render `fields` (all of them by default).
+
+        Fields map through their source, with get_FOO_display read as FOO; fields whose source is
+        not a column (SerializerMethodField...) are declared in Meta.field_sources as
+        {name: (columns...)}. Returns None when a field cannot be traced, meaning load every column.
+        """
+        return ProjectionUtils._columns(serializer_class, tuple(fields) if fields is not None else None)
@@ -0,0 +1,43 @@
+# django_app/__shared/renderers.py
+
+import json
+
+from rest_framework.renderers import JSONRenderer
+from rest_framework.utils.encoders import JSONEncoder
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - orjson is optional, DRF's stdlib renderer is the fallback
+    orjson = None
+
+_encoder = JSONEncoder()
+
+
+def orjson_default(obj):
+    """Encode what orjson does not know natively (Decimal, GEOS geometries, lazy strings...).
+
+    UUIDs, datetimes, dates and times never get here. Geometries become GeoJSON objects;
+    anything else gets the same treatment as under DRF's JSONEncoder.
+    """
+    if getattr(obj, 'geom_type', None) == 'Point':
+        return {'type': 'Point', 'coordinates': list(obj.coords)}
+    if hasattr(obj, 'geojson'):
+        return json.loads(obj.geojson)
+    return _encoder.default(obj)
+
+
+class ORJSONRenderer(JSONRenderer):
+    """JSONRenderer backed by orjson; falls back to the stdlib implementation when orjson is missing."""
+    options = orjson.OPT_NON_STR_KEYS if orjson else 0
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if orjson is None:
+            return super().render(data, accepted_media_type, renderer_context)
+        if data is None:
+            return b''
+
+        options = self.options
+        # orjson only indents by two spaces, which any requested indent is mapped to
+        if self.get_indent(accepted_media_type, renderer_context or {}):
+            options |= orjson.OPT_INDENT_2
+        return orjson.dumps(data, default=orjson_default, option=options)
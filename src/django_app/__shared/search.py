@@ -0,0 +1,23 @@
+# django_app/__shared/search.py
+
+from django.contrib.postgres.search import TrigramSimilarity
+from django.db import connections
+from django.db.models.functions import Greatest
+
+
+class SearchUtils:
+    @staticmethod
+    def is_postgres(queryset):
+        return connections[queryset.db].vendor == 'postgresql'
+
+    @staticmethod
+    def annotate_similarity(queryset, fields, query):
+        """Annotate `similarity` as the best pg_trgm similarity of `query` across `fields`.
+
+        The substring filter itself stays an `icontains` lookup, which Postgres serves from the
+        UPPER(column) gin_trgm_ops indexes. Other backends get the queryset back unannotated.
+        """
+        if not SearchUtils.is_postgres(queryset):
+            return queryset
+        scores = [TrigramSimilarity(field, query) for field in fields]
+        return queryset.annotate(similarity=scores[0] if len(scores) == 1 else Greatest(*scores))
@@ -0,0 +1,30 @@
+# django_app/__shared/serializers.py
+
+from rest_framework import serializers
+
+
+class SparseFieldsMixin:
+    """Serializer mixin accepting fields=[...] to render only those fields."""
+
+    def __init__(self, *args, fields=None, **kwargs):
+        super().__init__(*args, **kwargs)
+        if fields is not None:
+            for name in set(self.fields) - set(fields):
+                self.fields.pop(name)
+
+
+class SparseFieldsField(serializers.CharField):
+    """Comma separated sparse fieldset (?fields=id,name), checked against the allowed names."""
+
+    def __init__(self, allowed, **kwargs):
+        self.allowed = tuple(allowed)
+        super().__init__(**kwargs)
+
+    def to_internal_value(self, data):
+        names = [name.strip() for name in super().to_internal_value(data).split(',') if name.strip()]
+        unknown = [name for name in names if name not in self.allowed]
+        if unknown:
+            raise serializers.ValidationError(f"Unknown fields: {', '.join(unknown)}. Available: {', '.join(self.allowed)}")
+        if not names:
+            raise serializers.ValidationError("At least one field is required")
+        return list(dict.fromkeys(names))
@@ -10,11 +10,16 @@ from dj_rest_auth.registration.views import (
 
 from dj_rest_auth.jwt_auth import get_refresh_view
 
+from .serializers import CustomTokenRefreshSerializer
+
 # TokenObtainPairView, TokenRefreshView, TokenVerifyView, LoginView, LogoutView, PasswordChangeView, UserDetailsView, PasswordResetView, PasswordResetConfirmView, RegisterView, VerifyEmailView, ResendEmailVerificationView
 
 # JWT Authentication views
 TokenObtainPairView = TokenObtainPairView
-TokenRefreshView = get_refresh_view
+class TokenRefreshView(get_refresh_view()):
+    # dj_rest_auth's view hardcodes its serializer instead of reading TOKEN_REFRESH_SERIALIZER
+    serializer_class = CustomTokenRefreshSerializer
+
 TokenVerifyView = TokenVerifyView
 
 # Authentication views
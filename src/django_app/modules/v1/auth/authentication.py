@@ -0,0 +1,40 @@
+# django_app/modules/v1/auth/authentication.py
+
+from django.utils.translation import gettext_lazy as _
+from rest_framework_simplejwt.authentication import JWTAuthentication
+from rest_framework_simplejwt.exceptions import AuthenticationFailed, InvalidToken
+from rest_framework_simplejwt.settings import api_settings
+from rest_framework_simplejwt.utils import get_md5_hash_password
+
+from django_app.modules.v1.users.cache import UserCache
+
+class CachedJWTAuthentication(JWTAuthentication):
+    """JWTAuthentication that resolves the token's user through UserCache.
+
+    Token validation is unchanged; only the per-request user lookup is cached. The cache is
+    keyed by primary key and retired on every change to the user, so the active and password
+    checks below run on a current copy of the user.
+    """
+
+    def get_user(self, validated_token):
+        if api_settings.USER_ID_FIELD not in ('id', 'pk'):
+            return super().get_user(validated_token)
+        try:
+            user_id = validated_token[api_settings.USER_ID_CLAIM]
+        except KeyError as e:
+            raise InvalidToken(_('Token contained no recognizable user identification')) from e
+
+        user_cache = UserCache()
+        user, version = user_cache.lookup(user_id)
+        if user is None:
+            # Runs the same checks, so only users that pass them are cached
+            user = super().get_user(validated_token)
+            user_cache.store(user, version)
+            return user
+
+        if api_settings.CHECK_USER_IS_ACTIVE and not user.is_active:
+            raise AuthenticationFailed(_('User is inactive'), code='user_inactive')
+        if api_settings.CHECK_REVOKE_TOKEN:
+            if validated_token.get(api_settings.REVOKE_TOKEN_CLAIM) != get_md5_hash_password(user.password):
+                raise AuthenticationFailed(_("The user's password has been changed."), code='password_changed')
+        return user
@@ -0,0 +1,197 @@
+# django_app/modules/v1/auth/blacklist.py
+
+import atexit
+import threading
+import time
+from datetime import timedelta
+
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.db import connection, transaction
+from django.utils import timezone
+from rest_framework_simplejwt.settings import api_settings
+from rest_framework_simplejwt.token_blacklist.models import BlacklistedToken, OutstandingToken
+from rest_framework_simplejwt.utils import datetime_from_epoch
+
+# Seconds between reads of newly blacklisted tokens. 0 (the default) checks the database on
+# every lookup, so a token revoked on any worker is refused everywhere at once
+TOKEN_BLACKLIST_SYNC_INTERVAL = getattr(settings, 'TOKEN_BLACKLIST_SYNC_INTERVAL', 0)
+# Seconds queued OutstandingToken rows wait before they are written. 0 writes every row immediately
+TOKEN_WRITE_FLUSH_INTERVAL = getattr(settings, 'TOKEN_WRITE_FLUSH_INTERVAL', 1)
+# Queued rows that trigger a flush without waiting for the interval
+TOKEN_WRITE_BATCH_SIZE = 500
+# Rows blacklisted this recently are read again on every sync, so a batch another worker
+# commits out of id order is still picked up
+SYNC_LAG = timedelta(seconds=60)
+
+class BlacklistCache:
+    """Per-process set of blacklisted refresh token jtis, in front of the database check.
+
+    Tokens this worker blacklists are refused without a query. With the default sync interval
+    of 0 every other jti is checked against the database, so revocation stays strict. A
+    positive interval reads new blacklist rows by id at most that often instead, and a token
+    blacklisted by another worker can then still pass here for up to the interval. Entries
+    leave the set when their token expires, since expired tokens fail validation anyway.
+    """
+
+    def __init__(self, sync_interval=TOKEN_BLACKLIST_SYNC_INTERVAL):
+        self.sync_interval = sync_interval
+        self._lock = threading.Lock()
+        # jti -> expires_at
+        self._jtis = {}
+        self._last_id = 0
+        self._synced_at = None
+        self._pruned_at = time.monotonic()
+
+    def contains(self, jti) -> bool:
+        if jti in self._jtis:
+            return True
+        if not self.sync_interval:
+            return BlacklistedToken.objects.filter(token__jti=jti).exists()
+        self.sync()
+        return jti in self._jtis
+
+    def add(self, jti, expires_at) -> None:
+        with self._lock:
+            self._jtis[jti] = expires_at
+            self._prune()
+
+    def sync(self, force=False) -> None:
+        if not force and not self._stale():
+            return
+        with self._lock:
+            # Another thread may have synced while this one waited for the lock
+            if not force and not self._stale():
+                return
+            now = timezone.now()
+            settled = now - SYNC_LAG
+            rows = (
+                BlacklistedToken.objects
+                .filter(id__gt=self._last_id, token__expires_at__gt=now)
+                .order_by('id')
+                .values_list('id', 'token__jti', 'token__expires_at', 'blacklisted_at')
+            )
+            for row_id, jti, expires_at, blacklisted_at in rows:
+                self._jtis[jti] = expires_at
+                if blacklisted_at < settled:
+                    self._last_id = max(self._last_id, row_id)
+            self._prune()
+            self._synced_at = time.monotonic()
+
+    def _prune(self):
+        # Called with the lock held
+        if time.monotonic() - self._pruned_at > SYNC_LAG.total_seconds():
+            now = timezone.now()
+            self._jtis = {jti: expires_at for jti, expires_at in self._jtis.items() if expires_at > now}
+            self._pruned_at = time.monotonic()
+
+    def _stale(self):
+        return self._synced_at is None or time.monotonic() - self._synced_at >= self.sync_interval
+
+class TokenWriteBuffer:
+    """Write-behind queue for OutstandingToken inserts.
+
+    Queued rows are written as bulk inserts in one transaction, on a timer thread, once
+    TOKEN_WRITE_BATCH_SIZE rows are waiting or TOKEN_WRITE_FLUSH_INTERVAL seconds after the
+    first one, and at interpreter exit. Keeping the writes off the request thread also keeps
+    them out of a request transaction that might roll back. A failed flush is queued again.
+
+    Blacklisting is never deferred: the BlacklistedToken row, and the OutstandingToken row it
+    points to if that is still queued here or in another worker, are written before the call
+    returns, so a revoked token is refused everywhere and survives a killed process.
+    """
+
+    def __init__(self, flush_interval=TOKEN_WRITE_FLUSH_INTERVAL, batch_size=TOKEN_WRITE_BATCH_SIZE):
+        self.flush_interval = flush_interval
+        self.batch_size = batch_size
+        self._lock = threading.Lock()
+        # jti -> OutstandingToken fields
+        self._outstanding = {}
+        self._timer = None
+
+    def outstand(self, token) -> None:
+        row = TokenWriteBuffer._row(token)
+        if not self.flush_interval:
+            self._write([row], set())
+            return
+        with self._lock:
+            self._outstanding.setdefault(row['jti'], row)
+            if len(self._outstanding) >= self.batch_size:
+                self._schedule(0)
+            elif self._timer is None:
+                self._schedule(self.flush_interval)
+
+    def blacklist(self, token) -> None:
+        row = TokenWriteBuffer._row(token)
+        with self._lock:
+            # Written below; the queued copy would only be ignored as a conflict
+            self._outstanding.pop(row['jti'], None)
+        self._write([row], {row['jti']})
+
+    def flush(self) -> None:
+        with self._lock:
+            outstanding = self._outstanding
+            self._outstanding = {}
+            if self._timer is not None:
+                self._timer.cancel()
+                self._timer = None
+        if not outstanding:
+            return
+        try:
+            self._write(list(outstanding.values()), set())
+        except Exception as e:
+            print(f"Error in token write flush: {str(e)}")
+            with self._lock:
+                for jti, row in outstanding.items():
+                    self._outstanding.setdefault(jti, row)
+                self._schedule(self.flush_interval or 1)
+
+    def _schedule(self, delay):
+        # Called with the lock held
+        if self._timer is not None:
+            if delay:
+                return
+            self._timer.cancel()
+        self._timer = threading.Timer(delay, self._flush_in_thread)
+        self._timer.daemon = True
+        self._timer.start()
+
+    def _flush_in_thread(self):
+        try:
+            self.flush()
+        finally:
+            # The timer thread opened its own connection
+            connection.close()
+
+    @staticmethod
+    def _write(rows, blacklisted):
+        User = get_user_model()
+        user_ids = {row['user_id'] for row in rows if row['user_id'] is not None}
+        # Like simplejwt, a token whose user no longer exists is stored without one
+        existing = set(User.objects.filter(pk__in=user_ids).values_list('pk', flat=True)) if user_ids else set()
+        with transaction.atomic():
+            OutstandingToken.objects.bulk_create(
+                [OutstandingToken(**{**row, 'user_id': row['user_id'] if row['user_id'] in existing else None}) for row in rows],
+                ignore_conflicts=True
+            )
+            if blacklisted:
+                token_ids = OutstandingToken.objects.filter(jti__in=blacklisted).order_by().values_list('id', flat=True)
+                BlacklistedToken.objects.bulk_create(
+                    [BlacklistedToken(token_id=token_id) for token_id in token_ids],
+                    ignore_conflicts=True
+                )
+
+    @staticmethod
+    def _row(token):
+        user_id = token.payload.get(api_settings.USER_ID_CLAIM)
+        return {
+            'jti': token[api_settings.JTI_CLAIM],
+            'user_id': get_user_model()._meta.pk.to_python(user_id) if user_id is not None else None,
+            'token': str(token),
+            'created_at': token.current_time,
+            'expires_at': datetime_from_epoch(token['exp']),
+        }
+
+blacklist_cache = BlacklistCache()
+token_writes = TokenWriteBuffer()
+atexit.register(token_writes.flush)
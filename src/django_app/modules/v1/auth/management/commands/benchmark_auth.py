@@ -0,0 +1,231 @@
+# django_app/modules/v1/auth/management/commands/benchmark_auth.py
+
+import json
+import time
+import tracemalloc
+import uuid
+
+from allauth.account.models import EmailAddress
+from django.contrib.auth import get_user_model
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection
+from django.test import Client, override_settings
+from django.test.utils import CaptureQueriesContext, setup_test_environment, teardown_test_environment
+from django.urls import reverse
+from rest_framework_simplejwt.token_blacklist.models import OutstandingToken
+
+from django_app.modules.v1.auth.blacklist import token_writes
+
+User = get_user_model()
+
+ENDPOINTS = ('login', 'token', 'token_refresh', 'token_verify', 'registration')
+# Every user the benchmark creates starts with this, so cleanup never touches real accounts
+USERNAME_PREFIX = '_benchauth_'
+PASSWORD = 'Bench@2024-pass'
+
+class Command(BaseCommand):
+    help = 'Measures latency percentiles, queries and allocations per request for the auth endpoints, in process against a throwaway test database'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--requests',
+            type=int,
+            default=50,
+            help='Timed requests per endpoint',
+        )
+        parser.add_argument(
+            '--warmup',
+            type=int,
+            default=5,
+            help='Untimed requests per endpoint before measuring',
+        )
+        parser.add_argument(
+            '--allocation-requests',
+            type=int,
+            default=10,
+            help='Requests per endpoint traced with tracemalloc, in a pass of their own so tracing does not skew latency',
+        )
+        parser.add_argument(
+            '--endpoints',
+            nargs='+',
+            choices=ENDPOINTS,
+            default=list(ENDPOINTS),
+            help='Endpoints to run',
+        )
+        parser.add_argument(
+            '--live',
+            action='store_true',
+            help='Run against the configured database and cache instead of a throwaway test database; '
+                 'the benchmark users are deleted afterwards',
+        )
+        parser.add_argument(
+            '--output',
+            type=str,
+            help='Write the results as JSON, to use later as a --baseline',
+        )
+        parser.add_argument(
+            '--baseline',
+            type=str,
+            help='JSON results of an earlier run; exits with an error when p95 latency or queries regress',
+        )
+        parser.add_argument(
+            '--tolerance',
+            type=float,
+            default=0.25,
+            help='Allowed p95 latency growth over the baseline, as a fraction (default: 0.25)',
+        )
+
+    def handle(self, *args, **options):
+        if options['requests'] < 1:
+            raise CommandError('--requests must be at least 1')
+        if options['warmup'] < 0 or options['allocation_requests'] < 0:
+            raise CommandError('--warmup and --allocation-requests cannot be negative')
+
+        if options['live']:
+            results = self._benchmark(options)
+        else:
+            # A fresh database, and a local cache so no cached user of the real database is
+            # served for a test user that happens to get the same id
+            setup_test_environment()
+            old_name = connection.creation.create_test_db(verbosity=0, autoclobber=True, serialize=False)
+            try:
+                with override_settings(CACHES={'default': {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache'}}):
+                    results = self._benchmark(options)
+            finally:
+                connection.creation.destroy_test_db(old_name, verbosity=0)
+                teardown_test_environment()
+
+        self.stdout.write(f"{connection.vendor}, {options['requests']} requests per endpoint")
+        self.stdout.write(f"{'endpoint':<14}{'p50 ms':>9}{'p95 ms':>9}{'p99 ms':>9}{'max ms':>9}{'queries':>9}{'peak KiB':>10}")
+        for name, result in results.items():
+            self.stdout.write(
+                f"{name:<14}{result['p50_ms']:9.2f}{result['p95_ms']:9.2f}{result['p99_ms']:9.2f}"
+                f"{result['max_ms']:9.2f}{result['queries']:9.1f}{result['peak_kib']:10.1f}"
+            )
+
+        if options['output']:
+            with open(options['output'], 'w') as file:
+                json.dump({'vendor': connection.vendor, 'results': results}, file, indent=2)
+        if options['baseline']:
+            self._compare(results, options['baseline'], options['tolerance'])
+
+    def _benchmark(self, options):
+        # No mail leaves the process, and allauth's per-IP limits would throttle the runs
+        with override_settings(
+            EMAIL_BACKEND='django.core.mail.backends.locmem.EmailBackend',
+            ACCOUNT_RATE_LIMITS=False,
+            ALLOWED_HOSTS=['testserver'],
+        ):
+            self.client = Client()
+            user = self._create_user()
+            try:
+                return {name: self._run(name, user, options) for name in options['endpoints']}
+            finally:
+                self._cleanup()
+
+    def _run(self, name, user, options):
+        request = getattr(self, f'_request_{name}')
+        state = {'user': user}
+        for _ in range(options['warmup']):
+            request(state)
+        token_writes.flush()
+
+        latencies, queries = [], []
+        for _ in range(options['requests']):
+            with CaptureQueriesContext(connection) as context:
+                started = time.perf_counter()
+                request(state)
+                latencies.append((time.perf_counter() - started) * 1000)
+                # Token rows are written behind the response; count their inserts with the
+                # request that queued them, outside the timed part
+                token_writes.flush()
+            queries.append(len(context))
+
+        peaks = []
+        tracemalloc.start()
+        try:
+            for _ in range(options['allocation_requests']):
+                tracemalloc.reset_peak()
+                baseline, _ = tracemalloc.get_traced_memory()
+                request(state)
+                peaks.append(tracemalloc.get_traced_memory()[1] - baseline)
+        finally:
+            tracemalloc.stop()
+
+        latencies.sort()
+        return {
+            'p50_ms': Command._percentile(latencies, 50),
+            'p95_ms': Command._percentile(latencies, 95),
+            'p99_ms': Command._percentile(latencies, 99),
+            'max_ms': latencies[-1],
+            'queries': sum(queries) / len(queries),
+            'peak_kib': max(peaks) / 1024 if peaks else 0.0,
+        }
+
+    def _request_login(self, state):
+        self._post('rest_login', {'email': state['user'].email, 'password': PASSWORD})
+
+    def _request_token(self, state):
+        self._post('token_obtain_pair', {'username': state['user'].username, 'password': PASSWORD})
+
+    def _request_token_refresh(self, state):
+        # Rotation blacklists each refresh token, so every request uses the one the last returned
+        if 'refresh' not in state:
+            state['refresh'] = self._post('token_obtain_pair', {'username': state['user'].username, 'password': PASSWORD})['refresh']
+        state['refresh'] = self._post('token_refresh', {'refresh': state['refresh']})['refresh']
+
+    def _request_token_verify(self, state):
+        if 'access' not in state:
+            state['access'] = self._post('token_obtain_pair', {'username': state['user'].username, 'password': PASSWORD})['access']
+        self._post('token_verify', {'token': state['access']})
+
+    def _request_registration(self, state):
+        username = f'{USERNAME_PREFIX}{uuid.uuid4().hex[:12]}'
+        self._post('rest_register', {
+            'username': username,
+            'email': f'{username}@example.com',
+            'password1': PASSWORD,
+            'password2': PASSWORD,
+        })
+
+    def _post(self, url_name, data):
+        response = self.client.post(reverse(url_name), data, content_type='application/json')
+        if response.status_code >= 400:
+            raise CommandError(f'{url_name} answered {response.status_code}: {response.content[:300]!r}')
+        return response.json() if response.content else {}
+
+    def _create_user(self):
+        username = f'{USERNAME_PREFIX}{uuid.uuid4().hex[:12]}'
+        user = User.objects.create_user(username=username, email=f'{username}@example.com', password=PASSWORD)
+        # Mandatory email verification would refuse the login otherwise
+        EmailAddress.objects.create(user=user, email=user.email, verified=True, primary=True)
+        return user
+
+    def _cleanup(self):
+        # Write the queued token rows first so none is left pointing at a deleted user
+        token_writes.flush()
+        users = User.objects.filter(username__startswith=USERNAME_PREFIX)
+        OutstandingToken.objects.filter(user__in=users).delete()
+        users.delete()
+
+    def _compare(self, results, path, tolerance):
+        with open(path) as file:
+            baseline = json.load(file)['results']
+        regressions = []
+        for name, result in results.items():
+            previous = baseline.get(name)
+            if previous is None:
+                continue
+            if result['p95_ms'] > previous['p95_ms'] * (1 + tolerance):
+                regressions.append(f"{name}: p95 {previous['p95_ms']:.2f} -> {result['p95_ms']:.2f} ms")
+            if result['queries'] > previous['queries']:
+                regressions.append(f"{name}: queries {previous['queries']:.1f} -> {result['queries']:.1f}")
+        if regressions:
+            raise CommandError('Regressions against the baseline:\n' + '\n'.join(regressions))
+        self.stdout.write(self.style.SUCCESS(f'No regressions against {path}'))
+
+    @staticmethod
+    def _percentile(sorted_values, percent):
+        # Nearest-rank percentile
+        index = max(0, min(len(sorted_values) - 1, round(percent / 100 * len(sorted_values)) - 1))
+        return sorted_values[index]
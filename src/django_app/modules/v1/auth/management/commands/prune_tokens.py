@@ -0,0 +1,54 @@
+# django_app/modules/v1/auth/management/commands/prune_tokens.py
+
+import time
+
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from django.utils import timezone
+from rest_framework_simplejwt.token_blacklist.models import OutstandingToken
+
+class Command(BaseCommand):
+    help = 'Deletes expired outstanding and blacklisted tokens in bounded batches'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--batch-size',
+            type=int,
+            default=1000,
+            help='Tokens deleted per transaction (default: 1000)',
+        )
+        parser.add_argument(
+            '--sleep',
+            type=float,
+            default=0.0,
+            help='Seconds to pause between batches (default: 0)',
+        )
+        parser.add_argument(
+            '--dry-run',
+            action='store_true',
+            help='Report what would be removed without deleting anything',
+        )
+
+    def handle(self, *args, **options):
+        now = timezone.now()
+        expired = OutstandingToken.objects.filter(expires_at__lte=now)
+        if options['dry_run']:
+            self.stdout.write(f'Would delete {expired.count()} expired tokens')
+            return
+
+        batch_size = options['batch_size']
+        last_id, deleted = 0, 0
+        while True:
+            # Walks the primary key: expired tokens are the oldest ids, so each batch is found at
+            # the start of the index and no batch rescans what the previous ones covered
+            ids = list(expired.filter(id__gt=last_id).order_by('id').values_list('id', flat=True)[:batch_size])
+            if not ids:
+                break
+            with transaction.atomic():
+                # Cascades to the BlacklistedToken rows of the batch
+                OutstandingToken.objects.filter(id__in=ids).delete()
+            last_id, deleted = ids[-1], deleted + len(ids)
+            if options['sleep']:
+                time.sleep(options['sleep'])
+
+        self.stdout.write(self.style.SUCCESS(f'Deleted {deleted} expired tokens'))
@@ -1,8 +1,17 @@
 # django_app/modules/v1/auth/serializers.py
 
+from dj_rest_auth.jwt_auth import CookieTokenRefreshSerializer
 from dj_rest_auth.serializers import PasswordResetSerializer
 from allauth.account.utils import user_pk_to_url_str
 from django.conf import settings
+from django.utils.translation import gettext_lazy as _
+from rest_framework.exceptions import ValidationError
+from rest_framework_simplejwt.serializers import TokenBlacklistSerializer, TokenObtainPairSerializer, TokenVerifySerializer
+from rest_framework_simplejwt.settings import api_settings
+from rest_framework_simplejwt.tokens import UntypedToken
+
+from .blacklist import blacklist_cache
+from .tokens import RefreshToken
 
 def custom_url_generator(request, user, temp_key):
     uid = user_pk_to_url_str(user)
@@ -12,4 +21,19 @@ class CustomPasswordResetSerializer(PasswordResetSerializer):
     def get_email_options(self):
         return {
           'url_generator': custom_url_generator
-        }
\ No newline at end of file
+        }
+class CustomTokenObtainPairSerializer(TokenObtainPairSerializer):
+    token_class = RefreshToken
+
+class CustomTokenRefreshSerializer(CookieTokenRefreshSerializer):
+    token_class = RefreshToken
+
+class CustomTokenBlacklistSerializer(TokenBlacklistSerializer):
+    token_class = RefreshToken
+
+class CustomTokenVerifySerializer(TokenVerifySerializer):
+    def validate(self, attrs):
+        token = UntypedToken(attrs['token'])
+        if api_settings.BLACKLIST_AFTER_ROTATION and blacklist_cache.contains(token.get(api_settings.JTI_CLAIM)):
+            raise ValidationError(_('Token is blacklisted'))
+        return {}
@@ -0,0 +1,33 @@
+# django_app/modules/v1/auth/tokens.py
+
+from django.utils.translation import gettext_lazy as _
+from rest_framework_simplejwt.exceptions import TokenError
+from rest_framework_simplejwt.settings import api_settings
+from rest_framework_simplejwt.tokens import BlacklistMixin, RefreshToken as BaseRefreshToken
+from rest_framework_simplejwt.utils import datetime_from_epoch
+
+from .blacklist import blacklist_cache, token_writes
+
+class RefreshToken(BaseRefreshToken):
+    """RefreshToken that checks the blacklist through BlacklistCache and queues its
+    OutstandingToken/BlacklistedToken rows on TokenWriteBuffer instead of writing them inline.
+    """
+
+    def check_blacklist(self) -> None:
+        if blacklist_cache.contains(self.payload[api_settings.JTI_CLAIM]):
+            raise TokenError(_('Token is blacklisted'))
+
+    def blacklist(self) -> None:
+        token_writes.blacklist(self)
+        # Written before returning, so every worker refuses the token from now on
+        blacklist_cache.add(self.payload[api_settings.JTI_CLAIM], datetime_from_epoch(self.payload['exp']))
+
+    def outstand(self) -> None:
+        token_writes.outstand(self)
+
+    @classmethod
+    def for_user(cls, user):
+        # Skip BlacklistMixin.for_user, which inserts the OutstandingToken row inline
+        token = super(BlacklistMixin, cls).for_user(user)
+        token_writes.outstand(token)
+        return token
@@ -34,5 +34,5 @@ urlpatterns = [
     # JWT Authentication endpoints
     re_path(r'^token/?$', TokenObtainPairView.as_view(), name='token_obtain_pair'),
     re_path(r'^token/verify/?$', TokenVerifyView.as_view(), name='token_verify'),
-    re_path(r'^token/refresh/?$', TokenRefreshView().as_view(), name='token_refresh'),
+    re_path(r'^token/refresh/?$', TokenRefreshView.as_view(), name='token_refresh'),
 ]
@@ -1,27 +1,42 @@
 # django_app/modules/v1/places/api.py
 
+from dataclasses import fields as dataclass_fields
 from typing import List, Type, Union, Any
+from django.http import HttpResponse, StreamingHttpResponse
 from rest_framework.response import Response
 from rest_framework import status, viewsets
 from rest_framework.decorators import action
 from rest_framework.serializers import Serializer
 from rest_framework.permissions import IsAuthenticated
+from rest_framework.settings import api_settings
 from dependency_injector.wiring import inject, Provide
+from django_app.__shared.conditional import ConditionalUtils
+from django_app.__shared.projection import ProjectionUtils
+from django_app.__shared.renderers import ORJSONRenderer
 from .container import PlaceContainer
 from .serializers import (
     PaginationRequestSerializer,
     PaginationResponseSerializer,
     PlaceCreateRequestSerializer,
     PlaceCreateResponseSerializer,
+    PlaceCreateManyResponseSerializer,
     PlaceExistsResponseSerializer,
+    PlaceFieldsRequestSerializer,
     PlaceFilterRequestSerializer,
     PlaceResponseSerializer,
+    GeoJSONRequestSerializer,
     PlaceSearchRequestSerializer,
     PlaceUpdateRequestSerializer,
     PlaceIdSerializer,
     PlaceSerializer,
     NearbyPlacesRequestSerializer,
     WithinBoxRequestSerializer,
+    KNearestRequestSerializer,
+    PlaceNearestResponseSerializer,
+    PlaceTileRequestSerializer,
+    ClustersRequestSerializer,
+    PlaceClusterResponseSerializer,
+    PlaceExportRequestSerializer,
     PlaceGeoFeatureSerializer
 )
 
@@ -41,8 +56,16 @@ from .use_cases import (
     ExistsByIdUseCase,
     ExistsByIdsUseCase,
     NearbyPlacesUseCase,
-    WithinBoxUseCase
+    WithinBoxUseCase,
+    KNearestUseCase,
+    TileUseCase,
+    ClustersUseCase,
+    ExportUseCase,
+    FilterFeaturesUseCase,
+    NearbyFeaturesUseCase,
+    WithinBoxFeaturesUseCase
 )
+from .renderers import NDJSONRenderer, CSVRenderer, GeoJSONRenderer, MVTRenderer
 from .repositories import PlaceRepository
 
 class PlaceViewSet(viewsets.ModelViewSet):
@@ -52,17 +75,15 @@ class PlaceViewSet(viewsets.ModelViewSet):
         validated_data = self._validated_data(PlaceSerializer, request.query_params)
         input_param = find_one_use_case.Input(**validated_data)
         output = find_one_use_case.execute(input_param)
-        data = self._to_response(PlaceResponseSerializer, output)
-        return Response(data, status=status.HTTP_200_OK)
+        return self._place_response(request, output.place)
 
     @action(detail=False, methods=['get'], permission_classes=[IsAuthenticated])
     @inject
     def find_all(self, request, find_all_use_case: FindAllUseCase = Provide[PlaceContainer.find_all_use_case]):
-        validated_data = self._validated_data(PaginationRequestSerializer, request.query_params)
+        validated_data = self._validated_data(PaginationRequestSerializer, request.query_params, context={'request': request})
         input_param = find_all_use_case.Input(**validated_data)
         output = find_all_use_case.execute(input_param)
-        data = self._to_response(PaginationResponseSerializer, output)
-        return Response(data, status=status.HTTP_200_OK)
+        return self._list_response(request, output)
 
     @action(detail=False, methods=["post"], permission_classes=[IsAuthenticated])
     @inject
@@ -79,7 +100,7 @@ class PlaceViewSet(viewsets.ModelViewSet):
         validated_data = self._validated_data(PlaceCreateRequestSerializer, request.data, many=True)
         input_data = create_many_use_case.Input(places=validated_data)
         output = create_many_use_case.execute(input_data)
-        data = self._to_response(PlaceCreateResponseSerializer, output, many=True)
+        data = self._to_response(PlaceCreateManyResponseSerializer, output)
         return Response(data, status=status.HTTP_201_CREATED)
 
     @action(detail=False, methods=["put"], permission_classes=[IsAuthenticated])
@@ -119,29 +140,45 @@ class PlaceViewSet(viewsets.ModelViewSet):
     @action(detail=False, methods=["get"], permission_classes=[IsAuthenticated])
     @inject
     def search(self, request, search_use_case: SearchUseCase = Provide[PlaceContainer.search_use_case]):
-        validated_data = self._validated_data(PlaceSearchRequestSerializer, request.query_params)
+        validated_data = self._validated_data(PlaceSearchRequestSerializer, request.query_params, context={'request': request})
         input_data = search_use_case.Input(**validated_data)
         output = search_use_case.execute(input_data)
-        data = self._to_response(PaginationResponseSerializer, output)
-        return Response(data, status=status.HTTP_200_OK)
+        return self._list_response(request, output)
 
-    @action(detail=False, methods=["get"], permission_classes=[IsAuthenticated])
+    @action(detail=False, methods=["get"], permission_classes=[IsAuthenticated], renderer_classes=[*api_settings.DEFAULT_RENDERER_CLASSES, GeoJSONRenderer])
     @inject
-    def filter(self, request, filter_use_case: FilterUseCase = Provide[PlaceContainer.filter_use_case]):
-        validated_data = self._validated_data(PlaceFilterRequestSerializer, request.query_params)
+    def filter(self, request, filter_use_case: FilterUseCase = Provide[PlaceContainer.filter_use_case], filter_features_use_case: FilterFeaturesUseCase = Provide[PlaceContainer.filter_features_use_case]):
+        validated_data = self._validated_data(PlaceFilterRequestSerializer, request.query_params, context={'request': request})
+        if request.accepted_renderer.format == 'geojson':
+            return self._feature_response(request, filter_features_use_case, validated_data)
         input_data = filter_use_case.Input(**validated_data)
         output = filter_use_case.execute(input_data)
-        data = self._to_response(PaginationResponseSerializer, output)
-        return Response(data, status=status.HTTP_200_OK)
+        return self._list_response(request, output)
+
+    @action(detail=False, methods=["get"], permission_classes=[IsAuthenticated], renderer_classes=[NDJSONRenderer, CSVRenderer, GeoJSONRenderer])
+    @inject
+    def export(self, request, export_use_case: ExportUseCase = Provide[PlaceContainer.export_use_case]):
+        validated_data = self._validated_data(PlaceExportRequestSerializer, request.query_params)
+        input_data = export_use_case.Input(**validated_data)
+        output = export_use_case.execute(input_data)
+        # Rows are encoded as they come off the database cursor, so the body is never held in memory
+        renderer = request.accepted_renderer
+        response = StreamingHttpResponse(renderer.stream(output.rows), content_type=f'{renderer.media_type}; charset={renderer.charset}', status=status.HTTP_200_OK)
+        response['Content-Disposition'] = f'attachment; filename="places.{renderer.format}"'
+        return response
 
     @action(detail=False, methods=["get"], permission_classes=[IsAuthenticated])
     @inject
     def find_by_id(self, request, find_by_id_use_case: FindByIdUseCase = Provide[PlaceContainer.find_by_id_use_case]):
         validated_data = self._validated_data(PlaceIdSerializer, request.query_params)
-        input_data = find_by_id_use_case.Input(**validated_data)
+        fields = self._validated_data(PlaceFieldsRequestSerializer, request.query_params).get('fields')
+        columns = ProjectionUtils.columns(PlaceResponseSerializer, fields)
+        if columns:
+            # The validator is read even when it is not rendered
+            columns = (*columns, 'updated_at')
+        input_data = find_by_id_use_case.Input(**validated_data, columns=columns)
         output = find_by_id_use_case.execute(input_data)
-        data = self._to_response(PlaceResponseSerializer, output)
-        return Response(data, status=status.HTTP_200_OK)
+        return self._place_response(request, output.place, fields=fields)
 
     @action(detail=False, methods=["get"], permission_classes=[IsAuthenticated])
     @inject
@@ -171,24 +208,96 @@ class PlaceViewSet(viewsets.ModelViewSet):
         return Response(data, status=status.HTTP_200_OK)
     
     # Geo-specific actions
-    @action(detail=False, methods=["get"], permission_classes=[IsAuthenticated])
+    @action(detail=False, methods=["get"], permission_classes=[IsAuthenticated], renderer_classes=[*api_settings.DEFAULT_RENDERER_CLASSES, GeoJSONRenderer])
     @inject
-    def nearby(self, request, nearby_places_use_case: NearbyPlacesUseCase = Provide[PlaceContainer.nearby_places_use_case]):
-        validated_data = self._validated_data(NearbyPlacesRequestSerializer, request.query_params)
+    def nearby(self, request, nearby_places_use_case: NearbyPlacesUseCase = Provide[PlaceContainer.nearby_places_use_case], nearby_features_use_case: NearbyFeaturesUseCase = Provide[PlaceContainer.nearby_features_use_case]):
+        validated_data = self._validated_data(NearbyPlacesRequestSerializer, request.query_params, context={'request': request})
+        if request.accepted_renderer.format == 'geojson':
+            return self._feature_response(request, nearby_features_use_case, validated_data)
         input_data = nearby_places_use_case.Input(**validated_data)
         output = nearby_places_use_case.execute(input_data)
-        data = self._to_response(PaginationResponseSerializer, output)
-        return Response(data, status=status.HTTP_200_OK)
+        return self._list_response(request, output)
     
-    @action(detail=False, methods=["get"], permission_classes=[IsAuthenticated])
+    @action(detail=False, methods=["get"], permission_classes=[IsAuthenticated], renderer_classes=[*api_settings.DEFAULT_RENDERER_CLASSES, GeoJSONRenderer])
     @inject
-    def within_box(self, request, within_box_use_case: WithinBoxUseCase = Provide[PlaceContainer.within_box_use_case]):
-        validated_data = self._validated_data(WithinBoxRequestSerializer, request.query_params)
+    def within_box(self, request, within_box_use_case: WithinBoxUseCase = Provide[PlaceContainer.within_box_use_case], within_box_features_use_case: WithinBoxFeaturesUseCase = Provide[PlaceContainer.within_box_features_use_case]):
+        validated_data = self._validated_data(WithinBoxRequestSerializer, request.query_params, context={'request': request})
+        if request.accepted_renderer.format == 'geojson':
+            return self._feature_response(request, within_box_features_use_case, validated_data)
         input_data = within_box_use_case.Input(**validated_data)
         output = within_box_use_case.execute(input_data)
-        data = self._to_response(PaginationResponseSerializer, output)
+        return self._list_response(request, output)
+
+    @action(detail=False, methods=["get"], permission_classes=[IsAuthenticated])
+    @inject
+    def k_nearest(self, request, k_nearest_use_case: KNearestUseCase = Provide[PlaceContainer.k_nearest_use_case]):
+        validated_data = self._validated_data(KNearestRequestSerializer, request.query_params)
+        input_data = k_nearest_use_case.Input(**validated_data)
+        output = k_nearest_use_case.execute(input_data)
+        data = self._to_response(PlaceNearestResponseSerializer, output.places, many=True)
+        return Response(data, status=status.HTTP_200_OK)
+
+    # MVTRenderer lets clients send Accept: application/vnd.mapbox-vector-tile; the tile itself is always sent as is
+    @action(detail=False, methods=["get"], permission_classes=[IsAuthenticated], renderer_classes=[MVTRenderer, *api_settings.DEFAULT_RENDERER_CLASSES], url_path=r'tiles/(?P<z>\d+)/(?P<x>\d+)/(?P<y>\d+)\.mvt')
+    @inject
+    def tiles(self, request, z, x, y, tile_use_case: TileUseCase = Provide[PlaceContainer.tile_use_case]):
+        data = request.query_params.copy()
+        data.update({'z': z, 'x': x, 'y': y})
+        validated_data = self._validated_data(PlaceTileRequestSerializer, data)
+        input_data = tile_use_case.Input(**validated_data)
+        output = tile_use_case.execute(input_data)
+        return HttpResponse(output.tile, content_type='application/vnd.mapbox-vector-tile', status=status.HTTP_200_OK)
+
+    @action(detail=False, methods=["get"], permission_classes=[IsAuthenticated])
+    @inject
+    def clusters(self, request, clusters_use_case: ClustersUseCase = Provide[PlaceContainer.clusters_use_case]):
+        validated_data = self._validated_data(ClustersRequestSerializer, request.query_params)
+        input_data = clusters_use_case.Input(**validated_data)
+        output = clusters_use_case.execute(input_data)
+        data = self._to_response(PlaceClusterResponseSerializer, output.clusters, many=True)
         return Response(data, status=status.HTTP_200_OK)
 
+    def _feature_response(self, request, use_case, validated_data) -> StreamingHttpResponse:
+        """Stream every matching place as a FeatureCollection; pagination parameters do not apply."""
+        validated_data = {**validated_data, **self._validated_data(GeoJSONRequestSerializer, request.query_params)}
+        names = {field.name for field in dataclass_fields(use_case.Input)}
+        input_data = use_case.Input(**{key: value for key, value in validated_data.items() if key in names})
+        output = use_case.execute(input_data)
+        renderer = request.accepted_renderer
+        return StreamingHttpResponse(renderer.stream(output.rows), content_type=f'{renderer.media_type}; charset={renderer.charset}', status=status.HTTP_200_OK)
+
+    def _place_response(self, request, place, fields=None) -> HttpResponse:
+        """Serialize one place, or answer 304 if the client's copy is still current."""
+        etag = ConditionalUtils.etag('place', place.id, place.updated_at, fields, request.accepted_renderer.media_type)
+        not_modified = ConditionalUtils.not_modified(request, etag, place.updated_at)
+        if not_modified is not None:
+            return not_modified
+        data = self._to_response(PlaceResponseSerializer, place, fields=fields)
+        return ConditionalUtils.with_validators(Response(data, status=status.HTTP_200_OK), etag, place.updated_at)
+
+    def _list_response(self, request, output) -> HttpResponse:
+        validators = output.validators
+        etag = None
+        if validators is not None:
+            # The query string covers page, sort, fields and filters; the validators cover the data
+            etag = ConditionalUtils.etag('places', validators['last_modified'], validators['count'], request.get_full_path(), request.accepted_renderer.media_type)
+            not_modified = ConditionalUtils.not_modified(request, etag, validators['last_modified'])
+            if not_modified is not None:
+                return not_modified
+
+        data = self._to_response(PaginationResponseSerializer, output)
+        if output.items_json is None:
+            response = Response(data, status=status.HTTP_200_OK)
+        else:
+            # Splice the JSON array built by Postgres into the envelope without decoding it
+            data.pop('items')
+            envelope = ORJSONRenderer().render(data)
+            body = b'{"items":' + output.items_json + b',' + envelope[1:]
+            response = HttpResponse(body, content_type='application/json', status=status.HTTP_200_OK)
+        if etag is not None:
+            ConditionalUtils.with_validators(response, etag, validators['last_modified'])
+        return response
+
     @staticmethod
     def _validated_data(serializer_class: Type[Serializer], data: dict[str, Any] | List[dict[str, Any]] | Any, **kwargs) -> Any:
         serializer = serializer_class(data=data, **kwargs)
@@ -7,3 +7,6 @@ class PlacesConfig(AppConfig):
     name = 'django_app.modules.v1.places'
     label = 'places' 
     verbose_name = 'Places'
+
+    def ready(self):
+        from . import signals  # noqa: F401
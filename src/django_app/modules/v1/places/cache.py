@@ -0,0 +1,125 @@
+# django_app/modules/v1/places/cache.py
+
+import threading
+import uuid
+from typing import Any, Optional, Tuple
+
+from django.conf import settings
+from django.core.cache import caches
+from django.db import transaction
+
+from django_app.__shared.cache import CacheUtils
+
+# Seconds a cached place stays valid; writes invalidate earlier. 0 disables the cache, and so
+# does a per-process backend (LocMem), where a write could not reach the other workers
+PLACE_CACHE_TIMEOUT = getattr(settings, 'PLACE_CACHE_TIMEOUT', 300)
+PLACE_CACHE_ALIAS = getattr(settings, 'PLACE_CACHE_ALIAS', 'default')
+# Bump when the cached entry layout changes so old entries are never read
+PLACE_CACHE_PREFIX = 'places:v2'
+# Lookups a worker counts locally before adding them to the shared hit/miss counters
+STATS_FLUSH_EVERY = 100
+
+# Unique columns a single place can be cached under
+LOOKUP_FIELDS = ('id', 'uuid', 'slug')
+
+class PlaceCache:
+    """Read-through cache of single place rows, for a backend shared by all workers.
+
+    A row is stored once, under its id, tagged with the place's version: a random token read
+    before the row was loaded and dropped whenever the place is written. An entry is only
+    served while its tag is still the current version, so a row loaded just before a write
+    commits can never be cached as current. The uuid and slug keys hold only the id, and a
+    pointer is trusted only while the row it leads to still carries that uuid/slug.
+    """
+
+    # Hit/miss counts of this process not yet added to the shared counters
+    _pending = {'hits': 0, 'misses': 0}
+    _pending_lock = threading.Lock()
+
+    def __init__(self, alias=PLACE_CACHE_ALIAS, timeout=PLACE_CACHE_TIMEOUT):
+        self.alias = alias
+        self.timeout = timeout
+
+    @property
+    def enabled(self):
+        return self.timeout != 0 and CacheUtils.is_shared(self.alias)
+
+    @property
+    def backend(self):
+        return caches[self.alias]
+
+    def lookup(self, field, value) -> Tuple[Optional[dict], Optional[Tuple[Any, str]]]:
+        """Return (row, None) on a hit, or (None, token) to pass to store() with the row loaded on a miss."""
+        backend = self.backend
+        place_id = value if field == 'id' else backend.get(self._key(field, value))
+        if place_id is None:
+            self._count('misses')
+            return None, None
+
+        version_key, entry_key = self._key('version', place_id), self._key('id', place_id)
+        values = backend.get_many([version_key, entry_key])
+        version, entry = values.get(version_key), values.get(entry_key)
+        if version is not None and entry is not None and entry[0] == version and str(entry[1][field]) == str(value):
+            self._count('hits')
+            return entry[1], None
+
+        self._count('misses')
+        if version is None:
+            # A lapsed version only costs a miss: no entry can carry a token made after it
+            version = uuid.uuid4().hex
+            if not backend.add(version_key, version, timeout=self.timeout):
+                version = backend.get(version_key)
+        return None, (place_id, version)
+
+    def store(self, row, token) -> None:
+        """Cache a row loaded from the database after lookup() returned `token`.
+
+        The uuid/slug pointers are always written, since they are checked on read. The row
+        itself is only cached under the version read before it was loaded, and only when the
+        lookup already knew its id.
+        """
+        entries = {
+            self._key('uuid', row['uuid']): row['id'],
+            self._key('slug', row['slug']): row['id'],
+        }
+        if token is not None and token[1] is not None and str(token[0]) == str(row['id']):
+            entries[self._key('id', row['id'])] = (token[1], row)
+        self.backend.set_many(entries, timeout=self.timeout)
+
+    def invalidate(self, place_ids):
+        """Retire cached rows once the current transaction commits (immediately outside one)."""
+        keys = [self._key(kind, place_id) for place_id in place_ids for kind in ('version', 'id')]
+        if keys:
+            transaction.on_commit(lambda: self.backend.delete_many(keys))
+
+    def stats(self):
+        """Shared hit/miss counters; each worker adds its counts every STATS_FLUSH_EVERY lookups."""
+        counters = self.backend.get_many([self._key('stats', 'hits'), self._key('stats', 'misses')])
+        hits = counters.get(self._key('stats', 'hits'), 0)
+        misses = counters.get(self._key('stats', 'misses'), 0)
+        return {'hits': hits, 'misses': misses, 'hit_rate': hits / (hits + misses) if hits + misses else None}
+
+    def reset_stats(self):
+        self.backend.delete_many([self._key('stats', 'hits'), self._key('stats', 'misses')])
+
+    def _count(self, name):
+        # Counted in process memory; the shared counters only see a write once per batch
+        with self._pending_lock:
+            self._pending[name] += 1
+            if self._pending['hits'] + self._pending['misses'] < STATS_FLUSH_EVERY:
+                return
+            pending = dict(self._pending)
+            self._pending.update(hits=0, misses=0)
+        for counter, delta in pending.items():
+            if not delta:
+                continue
+            key = self._key('stats', counter)
+            try:
+                self.backend.incr(key, delta)
+            except ValueError:
+                if not self.backend.add(key, delta, timeout=None):
+                    self.backend.incr(key, delta)
+
+    @staticmethod
+    def _key(field, value):
+        return f'{PLACE_CACHE_PREFIX}:{field}:{value}'
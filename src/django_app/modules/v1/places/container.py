@@ -18,7 +18,14 @@ from .use_cases import (
     ExistsByIdUseCase,
     ExistsByIdsUseCase,
     NearbyPlacesUseCase,
-    WithinBoxUseCase
+    WithinBoxUseCase,
+    KNearestUseCase,
+    TileUseCase,
+    ClustersUseCase,
+    ExportUseCase,
+    FilterFeaturesUseCase,
+    NearbyFeaturesUseCase,
+    WithinBoxFeaturesUseCase
 )
 
 class PlaceContainer(containers.DeclarativeContainer):
@@ -38,7 +45,14 @@ class PlaceContainer(containers.DeclarativeContainer):
     find_by_ids_use_case = providers.Factory(FindByIdsUseCase, repository=place_repository)
     exists_by_id_use_case = providers.Factory(ExistsByIdUseCase, repository=place_repository)
     exists_by_ids_use_case = providers.Factory(ExistsByIdsUseCase, repository=place_repository)
+    export_use_case = providers.Factory(ExportUseCase, repository=place_repository)
+    filter_features_use_case = providers.Factory(FilterFeaturesUseCase, repository=place_repository)
     
     # Geo-specific use cases
     nearby_places_use_case = providers.Factory(NearbyPlacesUseCase, repository=place_repository)
-    within_box_use_case = providers.Factory(WithinBoxUseCase, repository=place_repository)
\ No newline at end of file
+    within_box_use_case = providers.Factory(WithinBoxUseCase, repository=place_repository)
+    nearby_features_use_case = providers.Factory(NearbyFeaturesUseCase, repository=place_repository)
+    within_box_features_use_case = providers.Factory(WithinBoxFeaturesUseCase, repository=place_repository)
+    k_nearest_use_case = providers.Factory(KNearestUseCase, repository=place_repository)
+    tile_use_case = providers.Factory(TileUseCase, repository=place_repository)
+    clusters_use_case = providers.Factory(ClustersUseCase, repository=place_repository)
@@ -0,0 +1,91 @@
+# django_app/modules/v1/places/management/commands/benchmark_json.py
+
+import datetime
+import io
+import random
+import time
+import uuid
+from decimal import Decimal
+
+from django.core.management.base import BaseCommand
+from rest_framework.parsers import JSONParser
+from rest_framework.renderers import JSONRenderer
+from django_app.__shared.parsers import ORJSONParser
+from django_app.__shared.renderers import ORJSONRenderer, orjson
+
+class Command(BaseCommand):
+    help = 'Compares the stdlib and orjson DRF renderer/parser on place list pages'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--rows',
+            type=int,
+            default=1000,
+            help='Places per page',
+        )
+        parser.add_argument(
+            '--iterations',
+            type=int,
+            default=200,
+            help='Times each page is rendered and parsed',
+        )
+
+    def _build_page(self, rows):
+        """A list response shaped like PlaceRepository pages: values() rows with raw UUIDs and datetimes."""
+        rng = random.Random(42)
+        now = datetime.datetime.now(datetime.timezone.utc)
+        items = [
+            {
+                'id': index,
+                'uuid': uuid.UUID(int=rng.getrandbits(128)),
+                'name': f"Place {index}",
+                'slug': f"place-{index}",
+                'description': 'Cold drinks, warm food and a long bar along the window. ' * 2,
+                'address': f"{rng.randint(1, 999)} Main Street",
+                'city': 'Lisbon',
+                'state': 'Lisbon',
+                'country': 'Portugal',
+                'postal_code': '1100-148',
+                'website': f"https://place-{index}.example.com",
+                'phone': '+351 21 000 0000',
+                'email': f"hello@place-{index}.example.com",
+                'type': rng.randint(0, 11),
+                'status': rng.randint(0, 1),
+                'created_at': now - datetime.timedelta(seconds=rng.randint(0, 10 ** 7)),
+                'updated_at': now,
+                'latitude': 38.7 + rng.random() / 10,
+                'longitude': -9.1 - rng.random() / 10,
+                'rating': Decimal(f"{rng.randint(10, 50) / 10:.1f}"),
+                'type_display': 'Bar',
+                'status_display': 'Active',
+            }
+            for index in range(1, rows + 1)
+        ]
+        return {'items': items, 'total': rows * 10, 'current_page': 1, 'per_page': rows, 'last_page': 10, 'has_next': True}
+
+    def _time(self, iterations, func):
+        started = time.perf_counter()
+        for _ in range(iterations):
+            func()
+        return (time.perf_counter() - started) / iterations * 1000
+
+    def handle(self, *args, **options):
+        rows = options['rows']
+        iterations = options['iterations']
+        if orjson is None:
+            self.stdout.write(self.style.WARNING('orjson is not installed; ORJSON classes fall back to the stdlib'))
+
+        page = self._build_page(rows)
+        body = JSONRenderer().render(page)
+        self.stdout.write(f"Page of {rows} places, {len(body) / 1024:,.0f} KiB, {iterations} iterations")
+
+        results = (
+            ('render', JSONRenderer(), ORJSONRenderer(), lambda renderer: renderer.render(page)),
+            ('parse', JSONParser(), ORJSONParser(), lambda parser: parser.parse(io.BytesIO(body), parser_context={})),
+        )
+        for name, stdlib, fast, run in results:
+            stdlib_ms = self._time(iterations, lambda: run(stdlib))
+            fast_ms = self._time(iterations, lambda: run(fast))
+            self.stdout.write(
+                f"{name:<7} stdlib {stdlib_ms:8.3f} ms   orjson {fast_ms:8.3f} ms   {stdlib_ms / fast_ms:5.1f}x"
+            )
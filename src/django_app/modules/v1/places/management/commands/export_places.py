@@ -0,0 +1,82 @@
+# django_app/modules/v1/places/management/commands/export_places.py
+
+import sys
+
+from django.core.management.base import BaseCommand, CommandError
+from django_app.modules.v1.places.renderers import NDJSONRenderer, CSVRenderer, GeoJSONRenderer
+from django_app.modules.v1.places.repositories import PlaceRepository, EXPORT_CHUNK_SIZE
+
+RENDERERS = {renderer.format: renderer for renderer in (NDJSONRenderer, CSVRenderer, GeoJSONRenderer)}
+
+class Command(BaseCommand):
+    help = 'Streams places to a file or stdout as NDJSON, CSV or GeoJSON'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--format',
+            type=str,
+            choices=sorted(RENDERERS),
+            default='ndjson',
+            help='Output format',
+        )
+        parser.add_argument(
+            '--output',
+            type=str,
+            default='-',
+            help='File to write to, or - for stdout',
+        )
+        parser.add_argument(
+            '--filter',
+            action='append',
+            default=[],
+            metavar='FIELD=VALUE',
+            help='PlaceFilter criterion, e.g. city=Lisbon or type=2 (repeatable)',
+        )
+        parser.add_argument(
+            '--bbox',
+            type=float,
+            nargs=4,
+            metavar=('MIN_LAT', 'MIN_LNG', 'MAX_LAT', 'MAX_LNG'),
+            help='Only export places inside this bounding box',
+        )
+        parser.add_argument(
+            '--chunk-size',
+            type=int,
+            default=EXPORT_CHUNK_SIZE,
+            help='Rows fetched per database round trip',
+        )
+
+    def _parse_filters(self, raw_filters):
+        filters = {}
+        for item in raw_filters:
+            key, sep, value = item.partition('=')
+            if not sep or not key:
+                raise CommandError(f"Invalid filter '{item}', expected FIELD=VALUE")
+            # Repeated keys accumulate, which is how the multiple choice filters take several values
+            filters.setdefault(key, []).append(value)
+        return {key: values if key in ('type', 'status') else values[-1] for key, values in filters.items()}
+
+    def handle(self, *args, **options):
+        filters = self._parse_filters(options['filter'])
+        renderer = RENDERERS[options['format']]()
+        rows = PlaceRepository().export(filters=filters, bbox=options['bbox'], chunk_size=options['chunk_size'])
+
+        exported = 0
+
+        def counted(rows):
+            nonlocal exported
+            for row in rows:
+                exported += 1
+                yield row
+
+        to_stdout = options['output'] == '-'
+        output = sys.stdout if to_stdout else open(options['output'], 'w', encoding=renderer.charset, newline='')
+        try:
+            for chunk in renderer.stream(counted(rows)):
+                output.write(chunk)
+        finally:
+            if not to_stdout:
+                output.close()
+
+        # Report on stderr so it never ends up inside an export piped from stdout
+        self.stderr.write(self.style.SUCCESS(f"Exported {exported} places"))
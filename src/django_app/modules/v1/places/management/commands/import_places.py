@@ -0,0 +1,177 @@
+# django_app/modules/v1/places/management/commands/import_places.py
+
+import csv
+import json
+import os
+import time
+from itertools import islice
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection
+from django_app.modules.v1.places.repositories import PlaceRepository
+
+# Input fields passed on to the repository; anything else in a row (ids, timestamps...) is ignored
+IMPORT_FIELDS = (
+    'uuid', 'name', 'slug', 'description', 'address', 'city', 'state', 'country', 'postal_code',
+    'latitude', 'longitude', 'website', 'phone', 'email', 'type', 'status',
+)
+FORMATS = ('csv', 'ndjson', 'geojson')
+
+class Command(BaseCommand):
+    help = 'Bulk imports places from CSV, NDJSON or GeoJSON through COPY, with a resumable checkpoint'
+
+    def add_arguments(self, parser):
+        parser.add_argument('path', type=str, help='File to import')
+        parser.add_argument(
+            '--format',
+            type=str,
+            choices=FORMATS,
+            help='Input format (default: guessed from the file extension)',
+        )
+        parser.add_argument(
+            '--chunk-size',
+            type=int,
+            default=10000,
+            help='Rows validated, copied and committed together',
+        )
+        parser.add_argument(
+            '--checkpoint',
+            type=str,
+            help='Checkpoint file (default: <path>.checkpoint.json)',
+        )
+        parser.add_argument(
+            '--resume',
+            action='store_true',
+            help='Continue after the last committed chunk recorded in the checkpoint',
+        )
+        parser.add_argument(
+            '--errors',
+            type=str,
+            help='Write rejected rows as NDJSON ({"record", "error"}) to this file',
+        )
+
+    def _guess_format(self, path):
+        extension = os.path.splitext(path)[1].lower().lstrip('.')
+        if extension in ('json', 'geojson'):
+            return 'geojson'
+        if extension in ('ndjson', 'jsonl', 'geojsonl', 'geojsons'):
+            return 'ndjson'
+        if extension in ('csv', 'txt'):
+            return 'csv'
+        raise CommandError(f"Cannot guess the format of '{path}', pass --format")
+
+    def _read_rows(self, file, file_format):
+        """Yield raw rows one at a time; only a GeoJSON FeatureCollection has to be parsed whole."""
+        if file_format == 'csv':
+            yield from csv.DictReader(file)
+        elif file_format == 'ndjson':
+            # One object or GeoJSON Feature per line (GeoJSONSeq files included)
+            for line in file:
+                line = line.strip().lstrip('\x1e')
+                if line:
+                    yield json.loads(line)
+        else:
+            document = json.load(file)
+            yield from document.get('features', []) if document.get('type') == 'FeatureCollection' else [document]
+
+    def _normalize(self, row):
+        """Flatten GeoJSON features and map empty CSV cells to None."""
+        if row.get('type') == 'Feature':
+            geometry = row.get('geometry') or {}
+            row = dict(row.get('properties') or {})
+            if geometry.get('type') == 'Point':
+                row['longitude'], row['latitude'] = geometry['coordinates'][:2]
+        return {key: None if row[key] == '' else row[key] for key in IMPORT_FIELDS if key in row}
+
+    def _fingerprint(self, path):
+        stat = os.stat(path)
+        return {'path': os.path.abspath(path), 'size': stat.st_size, 'mtime': stat.st_mtime}
+
+    def _load_checkpoint(self, checkpoint_path, fingerprint):
+        try:
+            with open(checkpoint_path, encoding='utf-8') as file:
+                checkpoint = json.load(file)
+        except FileNotFoundError:
+            return None
+        if checkpoint.get('file') != fingerprint:
+            raise CommandError(f"Checkpoint {checkpoint_path} was written for a different version of the file")
+        return checkpoint
+
+    def _save_checkpoint(self, checkpoint_path, checkpoint):
+        # Write then rename, so an interrupted run never leaves a truncated checkpoint behind
+        temporary_path = f'{checkpoint_path}.tmp'
+        with open(temporary_path, 'w', encoding='utf-8') as file:
+            json.dump(checkpoint, file)
+        os.replace(temporary_path, checkpoint_path)
+
+    def handle(self, *args, **options):
+        if connection.vendor != 'postgresql':
+            raise CommandError('import_places loads through COPY and requires PostgreSQL')
+
+        path = options['path']
+        if not os.path.exists(path):
+            raise CommandError(f"File not found: {path}")
+        file_format = options['format'] or self._guess_format(path)
+        chunk_size = options['chunk_size']
+        checkpoint_path = options['checkpoint'] or f'{path}.checkpoint.json'
+        fingerprint = self._fingerprint(path)
+
+        checkpoint = {'file': fingerprint, 'record': 0, 'inserted': 0, 'skipped': 0, 'invalid': 0, 'done': False}
+        if options['resume']:
+            saved = self._load_checkpoint(checkpoint_path, fingerprint)
+            if saved and saved['done']:
+                self.stdout.write(self.style.WARNING(f"{path} was already imported completely"))
+                return
+            if saved:
+                checkpoint = saved
+                self.stdout.write(f"Resuming after record {checkpoint['record']}")
+
+        place_repo = PlaceRepository()
+        errors_file = open(options['errors'], 'a' if options['resume'] else 'w', encoding='utf-8') if options['errors'] else None
+        started = time.monotonic()
+        processed = 0
+
+        try:
+            with open(path, encoding='utf-8', newline='') as file:
+                rows = self._read_rows(file, file_format)
+                # Records already committed by an earlier run are read but not loaded again
+                record = checkpoint['record']
+                for _ in islice(rows, record):
+                    pass
+
+                while True:
+                    chunk = list(islice(rows, chunk_size))
+                    if not chunk:
+                        break
+                    result = place_repo.copy_many([self._normalize(row) for row in chunk])
+
+                    if errors_file:
+                        for error in result['errors']:
+                            errors_file.write(json.dumps({'record': record + error['index'] + 1, 'error': error['error']}) + '\n')
+                        errors_file.flush()
+
+                    record += len(chunk)
+                    processed += len(chunk)
+                    checkpoint.update(
+                        record=record,
+                        inserted=checkpoint['inserted'] + result['inserted'],
+                        skipped=checkpoint['skipped'] + result['skipped'],
+                        invalid=checkpoint['invalid'] + len(result['errors']),
+                    )
+                    self._save_checkpoint(checkpoint_path, checkpoint)
+
+                    rate = processed / max(time.monotonic() - started, 1e-6)
+                    self.stdout.write(
+                        f"{record} records: {checkpoint['inserted']} inserted, {checkpoint['skipped']} skipped, "
+                        f"{checkpoint['invalid']} invalid ({rate:,.0f} rows/s)"
+                    )
+        finally:
+            if errors_file:
+                errors_file.close()
+
+        checkpoint['done'] = True
+        self._save_checkpoint(checkpoint_path, checkpoint)
+        self.stdout.write(self.style.SUCCESS(
+            f"Import completed: {checkpoint['inserted']} inserted, {checkpoint['skipped']} skipped, "
+            f"{checkpoint['invalid']} invalid"
+        ))
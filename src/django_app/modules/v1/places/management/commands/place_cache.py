@@ -0,0 +1,31 @@
+# django_app/modules/v1/places/management/commands/place_cache.py
+
+from django.core.management.base import BaseCommand
+from django_app.modules.v1.places.cache import PLACE_CACHE_ALIAS, PLACE_CACHE_TIMEOUT, PlaceCache
+
+class Command(BaseCommand):
+    help = 'Shows the hit/miss counters of the single-place read-through cache'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--reset',
+            action='store_true',
+            help='Zero the counters after printing them',
+        )
+
+    def handle(self, *args, **options):
+        place_cache = PlaceCache()
+        if not place_cache.enabled:
+            self.stdout.write(self.style.WARNING(
+                'The place cache is disabled: PLACE_CACHE_TIMEOUT is 0 or CACHE_URL does not point at a shared backend'
+            ))
+
+        stats = place_cache.stats()
+        hit_rate = f"{stats['hit_rate']:.1%}" if stats['hit_rate'] is not None else 'n/a'
+        self.stdout.write(
+            f"cache '{PLACE_CACHE_ALIAS}', timeout {PLACE_CACHE_TIMEOUT}s: "
+            f"{stats['hits']} hits, {stats['misses']} misses, hit rate {hit_rate}"
+        )
+        if options['reset']:
+            place_cache.reset_stats()
+            self.stdout.write(self.style.SUCCESS('Counters reset'))
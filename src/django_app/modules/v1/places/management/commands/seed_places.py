@@ -0,0 +1,225 @@
+# django_app/modules/v1/places/management/commands/seed_places.py
+
+import math
+import multiprocessing
+import os
+import random
+import time
+from faker import Faker
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connections
+from django.utils.text import slugify
+from django_app.modules.v1.places.models import Place
+from django_app.modules.v1.places.repositories import PlaceRepository
+
+# (city, state, country, latitude, longitude, relative weight, spread in km)
+CITY_HOTSPOTS = (
+    ('New York', 'NY', 'United States', 40.7128, -74.0060, 20, 12),
+    ('Los Angeles', 'CA', 'United States', 34.0522, -118.2437, 14, 20),
+    ('Chicago', 'IL', 'United States', 41.8781, -87.6298, 9, 12),
+    ('Austin', 'TX', 'United States', 30.2672, -97.7431, 5, 10),
+    ('Mexico City', 'CDMX', 'Mexico', 19.4326, -99.1332, 14, 15),
+    ('São Paulo', 'SP', 'Brazil', -23.5505, -46.6333, 16, 18),
+    ('Rio de Janeiro', 'RJ', 'Brazil', -22.9068, -43.1729, 9, 12),
+    ('Buenos Aires', 'CABA', 'Argentina', -34.6037, -58.3816, 10, 12),
+    ('London', 'England', 'United Kingdom', 51.5074, -0.1278, 15, 14),
+    ('Paris', 'Île-de-France', 'France', 48.8566, 2.3522, 12, 9),
+    ('Berlin', 'Berlin', 'Germany', 52.5200, 13.4050, 9, 10),
+    ('Madrid', 'Madrid', 'Spain', 40.4168, -3.7038, 8, 9),
+    ('Lisbon', 'Lisbon', 'Portugal', 38.7223, -9.1393, 5, 7),
+    ('Rome', 'Lazio', 'Italy', 41.9028, 12.4964, 7, 8),
+    ('Istanbul', 'Istanbul', 'Turkey', 41.0082, 28.9784, 12, 16),
+    ('Lagos', 'Lagos', 'Nigeria', 6.5244, 3.3792, 9, 14),
+    ('Cairo', 'Cairo', 'Egypt', 30.0444, 31.2357, 10, 12),
+    ('Mumbai', 'Maharashtra', 'India', 19.0760, 72.8777, 16, 14),
+    ('Tokyo', 'Tokyo', 'Japan', 35.6762, 139.6503, 20, 16),
+    ('Seoul', 'Seoul', 'South Korea', 37.5665, 126.9780, 12, 11),
+    ('Bangkok', 'Bangkok', 'Thailand', 13.7563, 100.5018, 10, 12),
+    ('Sydney', 'NSW', 'Australia', -33.8688, 151.2093, 8, 15),
+)
+
+# Sparse countryside between the hotspots: (country, min_lat, min_lng, max_lat, max_lng)
+RURAL_REGIONS = (
+    ('United States', 33.0, -110.0, 45.0, -80.0),
+    ('Brazil', -25.0, -55.0, -5.0, -40.0),
+    ('France', 43.5, -1.0, 49.5, 6.0),
+    ('Spain', 37.0, -7.0, 43.0, 2.0),
+    ('Germany', 48.0, 7.0, 54.0, 14.0),
+    ('India', 12.0, 74.0, 27.0, 86.0),
+    ('Australia', -37.0, 140.0, -27.0, 152.0),
+)
+RURAL_SHARE = 0.12
+
+# Relative frequency of each type and status, roughly what a nightlife directory looks like
+TYPE_WEIGHTS = {
+    Place.PlaceType.BAR: 20,
+    Place.PlaceType.PUB: 9,
+    Place.PlaceType.RESTAURANT: 26,
+    Place.PlaceType.CAFE: 17,
+    Place.PlaceType.NIGHTCLUB: 5,
+    Place.PlaceType.BREWERY: 4,
+    Place.PlaceType.WINERY: 2,
+    Place.PlaceType.FOOD_TRUCK: 4,
+    Place.PlaceType.COCKTAIL_BAR: 5,
+    Place.PlaceType.SPORTS_BAR: 4,
+    Place.PlaceType.LOUNGE: 3,
+    Place.PlaceType.ROOFTOP_BAR: 1,
+}
+STATUS_WEIGHTS = {
+    Place.PlaceStatus.ACTIVE: 90,
+    Place.PlaceStatus.INACTIVE: 10,
+}
+
+KM_PER_DEGREE = 111.32
+
+# Distinct Faker values drawn per chunk for each text column
+FAKER_POOL_SIZE = 500
+
+# Faker instance of the current worker process, re-seeded for every chunk
+_fake = None
+
+def _generate_chunk(seed, chunk_index, start, size):
+    """Build `size` place rows; the output depends only on the seed and the chunk index."""
+    global _fake
+    if _fake is None:
+        _fake = Faker()
+    chunk_seed = seed * 1_000_003 + chunk_index
+    _fake.seed_instance(chunk_seed)
+    rng = random.Random(chunk_seed)
+
+    hotspot_weights = [hotspot[5] for hotspot in CITY_HOTSPOTS]
+    types, type_weights = list(TYPE_WEIGHTS), list(TYPE_WEIGHTS.values())
+    statuses, status_weights = list(STATUS_WEIGHTS), list(STATUS_WEIGHTS.values())
+
+    # Faker is slow per call, so each chunk draws small pools once and samples them with rng;
+    # slugs, coordinates and the type/status mix stay unique or random per row
+    pool_size = min(size, FAKER_POOL_SIZE)
+    last_names = [_fake.last_name() for _ in range(pool_size)]
+    sentences = [_fake.sentence(nb_words=12) for _ in range(pool_size)]
+    addresses = [_fake.street_address() for _ in range(pool_size)]
+    rural_cities = [_fake.city() for _ in range(pool_size)]
+    postcodes = [_fake.postcode() for _ in range(pool_size)]
+    urls = [_fake.url() for _ in range(pool_size)]
+    phones = [_fake.phone_number()[:50] for _ in range(pool_size)]
+    emails = [_fake.email() for _ in range(pool_size)]
+
+    rows = []
+    for offset in range(size):
+        if rng.random() < RURAL_SHARE:
+            country, min_lat, min_lng, max_lat, max_lng = rng.choice(RURAL_REGIONS)
+            latitude, longitude = rng.uniform(min_lat, max_lat), rng.uniform(min_lng, max_lng)
+            city, state = rng.choice(rural_cities), None
+        else:
+            city, state, country, lat, lng, _, spread = rng.choices(CITY_HOTSPOTS, weights=hotspot_weights)[0]
+            # Gaussian scatter around the city centre, corrected for longitude shrinking with latitude
+            latitude = lat + rng.gauss(0, spread / KM_PER_DEGREE)
+            longitude = lng + rng.gauss(0, spread / (KM_PER_DEGREE * math.cos(math.radians(lat))))
+
+        place_type = rng.choices(types, weights=type_weights)[0]
+        name = f"{rng.choice(last_names)}'s {place_type.label}"
+        rows.append({
+            'name': name,
+            # The global row number keeps slugs unique across chunks and workers without a lookup
+            'slug': f"{slugify(name)[:200]}-{start + offset:x}",
+            'description': rng.choice(sentences),
+            'address': rng.choice(addresses),
+            'city': city,
+            'state': state,
+            'country': country,
+            'postal_code': rng.choice(postcodes),
+            'website': rng.choice(urls) if rng.random() < 0.6 else None,
+            'phone': rng.choice(phones) if rng.random() < 0.7 else None,
+            'email': rng.choice(emails) if rng.random() < 0.4 else None,
+            'type': place_type,
+            'status': rng.choices(statuses, weights=status_weights)[0],
+            'latitude': max(-90.0, min(90.0, latitude)),
+            'longitude': (longitude + 180.0) % 360.0 - 180.0,
+        })
+    return rows
+
+def _seed_chunk(args):
+    """Generate and write one chunk; runs in a worker process with its own database connection."""
+    seed, chunk_index, start, size, use_copy = args
+    rows = _generate_chunk(seed, chunk_index, start, size)
+    place_repo = PlaceRepository()
+    if use_copy:
+        result = place_repo.copy_many(rows)
+        return size, result['inserted'], len(result['errors'])
+    result = place_repo.create_many(rows)
+    return size, len(result['places']), len(result['errors'])
+
+class Command(BaseCommand):
+    help = 'Seeds the database with synthetic, spatially clustered places for local benchmarks'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--count',
+            type=int,
+            default=1000,
+            help='Number of places to generate',
+        )
+        parser.add_argument(
+            '--seed',
+            type=int,
+            default=42,
+            help='Random seed; the same seed and count always produce the same places',
+        )
+        parser.add_argument(
+            '--workers',
+            type=int,
+            default=os.cpu_count() or 1,
+            help='Worker processes generating and writing chunks in parallel',
+        )
+        parser.add_argument(
+            '--chunk-size',
+            type=int,
+            default=10000,
+            help='Places generated and written per transaction',
+        )
+
+    def handle(self, *args, **options):
+        count = options['count']
+        seed = options['seed']
+        chunk_size = options['chunk_size']
+        workers = max(1, options['workers'])
+        if count < 1 or chunk_size < 1:
+            raise CommandError('--count and --chunk-size must be positive')
+
+        # COPY through the staging table on PostgreSQL, bulk_create everywhere else
+        use_copy = connections['default'].vendor == 'postgresql'
+        tasks = [
+            (seed, chunk_index, start, min(chunk_size, count - start), use_copy)
+            for chunk_index, start in enumerate(range(0, count, chunk_size))
+        ]
+
+        self.stdout.write(self.style.SUCCESS(
+            f"Seeding {count} places in {len(tasks)} chunks with {workers} workers (seed {seed})"
+        ))
+        started = time.monotonic()
+        generated = inserted = invalid = 0
+
+        if workers == 1:
+            results = map(_seed_chunk, tasks)
+            pool = None
+        else:
+            # Forked workers must not share the parent's socket, so they each open their own connection
+            connections.close_all()
+            pool = multiprocessing.get_context('fork').Pool(workers)
+            results = pool.imap_unordered(_seed_chunk, tasks)
+
+        try:
+            for size, chunk_inserted, chunk_invalid in results:
+                generated += size
+                inserted += chunk_inserted
+                invalid += chunk_invalid
+                rate = generated / max(time.monotonic() - started, 1e-6)
+                self.stdout.write(f"{generated}/{count} generated, {inserted} inserted ({rate:,.0f} rows/s)")
+        finally:
+            if pool:
+                pool.close()
+                pool.join()
+
+        if invalid:
+            self.stdout.write(self.style.WARNING(f"{invalid} generated places failed validation"))
+        self.stdout.write(self.style.SUCCESS(f"Place seeding completed: {inserted} places created"))
@@ -0,0 +1,43 @@
+# Generated by Django 5.2 on 2026-10-18 12:00
+
+import django.db.models.functions.text
+from django.contrib.postgres.indexes import GinIndex, OpClass
+from django.contrib.postgres.operations import AddIndexConcurrently, TrigramExtension
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+    # CREATE INDEX CONCURRENTLY cannot run inside a transaction
+    atomic = False
+
+    dependencies = [
+        ('places', '0002_enable_postgis_extension'),
+    ]
+
+    operations = [
+        TrigramExtension(),
+        AddIndexConcurrently(
+            model_name='place',
+            index=GinIndex(OpClass(django.db.models.functions.text.Upper('name'), name='gin_trgm_ops'), name='places_name_trgm'),
+        ),
+        AddIndexConcurrently(
+            model_name='place',
+            index=GinIndex(OpClass(django.db.models.functions.text.Upper('description'), name='gin_trgm_ops'), name='places_description_trgm'),
+        ),
+        AddIndexConcurrently(
+            model_name='place',
+            index=GinIndex(OpClass(django.db.models.functions.text.Upper('address'), name='gin_trgm_ops'), name='places_address_trgm'),
+        ),
+        AddIndexConcurrently(
+            model_name='place',
+            index=GinIndex(OpClass(django.db.models.functions.text.Upper('city'), name='gin_trgm_ops'), name='places_city_trgm'),
+        ),
+        AddIndexConcurrently(
+            model_name='place',
+            index=GinIndex(OpClass(django.db.models.functions.text.Upper('state'), name='gin_trgm_ops'), name='places_state_trgm'),
+        ),
+        AddIndexConcurrently(
+            model_name='place',
+            index=GinIndex(OpClass(django.db.models.functions.text.Upper('country'), name='gin_trgm_ops'), name='places_country_trgm'),
+        ),
+    ]
@@ -0,0 +1,86 @@
+# Generated by Django 5.2 on 2026-10-18 12:00
+
+import django.contrib.postgres.search
+from django.contrib.postgres.indexes import GinIndex
+from django.contrib.postgres.operations import AddIndexConcurrently
+from django.db import migrations
+
+# Rows updated per statement while backfilling; each statement commits on its own
+BACKFILL_BATCH_SIZE = 5000
+
+# Same weights as the search: name over location over free text. Separate statements, so
+# nothing has to split the dollar-quoted function body
+CREATE_TRIGGER = [
+    """
+    CREATE OR REPLACE FUNCTION places_search_vector_update() RETURNS trigger AS $$
+    BEGIN
+        NEW.search_vector :=
+            setweight(to_tsvector('english', coalesce(NEW.name, '')), 'A')
+            || setweight(to_tsvector('english', coalesce(NEW.city, '') || ' ' || coalesce(NEW.state, '') || ' ' || coalesce(NEW.country, '')), 'B')
+            || setweight(to_tsvector('english', coalesce(NEW.address, '')), 'C')
+            || setweight(to_tsvector('english', coalesce(NEW.description, '')), 'D');
+        RETURN NEW;
+    END
+    $$ LANGUAGE plpgsql
+    """,
+    """
+    CREATE TRIGGER places_search_vector
+    BEFORE INSERT OR UPDATE ON places
+    FOR EACH ROW EXECUTE FUNCTION places_search_vector_update()
+    """,
+]
+
+DROP_TRIGGER = [
+    'DROP TRIGGER IF EXISTS places_search_vector ON places',
+    'DROP FUNCTION IF EXISTS places_search_vector_update()',
+]
+
+
+def backfill_search_vector(apps, schema_editor):
+    """Fill search_vector for the rows that existed before the trigger, in short batches.
+
+    A no-op update fires the trigger, so the expression lives in one place. The migration is
+    not atomic, so every batch commits and only locks its own rows.
+    """
+    last_id = 0
+    with schema_editor.connection.cursor() as cursor:
+        while True:
+            cursor.execute(
+                """
+                UPDATE places SET name = name
+                WHERE id IN (
+                    SELECT id FROM places WHERE id > %s AND search_vector IS NULL ORDER BY id LIMIT %s
+                )
+                RETURNING id
+                """,
+                [last_id, BACKFILL_BATCH_SIZE]
+            )
+            ids = [row[0] for row in cursor.fetchall()]
+            if not ids:
+                break
+            last_id = max(ids)
+
+
+class Migration(migrations.Migration):
+    # CREATE INDEX CONCURRENTLY cannot run inside a transaction, and the backfill commits per batch.
+    # Locks: the nullable ADD COLUMN and CREATE TRIGGER only hold their table lock for a catalog
+    # change, with no rewrite; the backfill takes row locks one batch at a time
+    atomic = False
+
+    dependencies = [
+        ('places', '0003_place_trigram_indexes'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='place',
+            name='search_vector',
+            field=django.contrib.postgres.search.SearchVectorField(editable=False, null=True),
+        ),
+        migrations.RunSQL(CREATE_TRIGGER, reverse_sql=DROP_TRIGGER),
+        migrations.RunPython(backfill_search_vector, migrations.RunPython.noop),
+        AddIndexConcurrently(
+            model_name='place',
+            index=GinIndex(fields=['search_vector'], name='places_search_vector_idx'),
+        ),
+    ]
@@ -3,6 +3,16 @@
 import uuid
 from django.contrib.gis.db import models
 from django.contrib.gis.geos import Point
+from django.contrib.postgres.indexes import GinIndex, OpClass
+from django.contrib.postgres.search import SearchVectorField
+from django.db.models.functions import Upper
+
+# Columns searched with icontains; Django compiles that to UPPER(col) LIKE UPPER(%s),
+# so the trigram indexes are built on UPPER(col) to be usable by those queries.
+TRIGRAM_SEARCH_FIELDS = ('name', 'description', 'address', 'city', 'state', 'country')
+
+# Text search configuration used for both the stored vector and incoming queries
+FULL_TEXT_CONFIG = 'english'
 
 class Place(models.Model):
     class PlaceStatus(models.IntegerChoices):
@@ -45,6 +55,11 @@ class Place(models.Model):
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
+    # Set by the places_search_vector trigger on every write (migration 0004); weights rank name
+    # over location over free text. A plain column rather than a GeneratedField, since adding a
+    # stored generated column rewrites the whole table under an exclusive lock
+    search_vector = SearchVectorField(null=True, editable=False)
+
     def __str__(self):
         return f'{self.name} ({self.get_type_display()})'
     
@@ -59,3 +74,9 @@ class Place(models.Model):
 
     class Meta:
         db_table = 'places'
+        indexes = [
+            GinIndex(OpClass(Upper(field), name='gin_trgm_ops'), name=f'places_{field}_trgm')
+            for field in TRIGRAM_SEARCH_FIELDS
+        ] + [
+            GinIndex(fields=['search_vector'], name='places_search_vector_idx'),
+        ]
@@ -0,0 +1,96 @@
+# django_app/modules/v1/places/renderers.py
+
+import csv
+import datetime
+import json
+
+from rest_framework.renderers import BaseRenderer
+
+from django_app.__shared.renderers import ORJSONRenderer
+
+from .utils import json_default
+
+class StreamingRenderer(BaseRenderer):
+    """Renderer that can also encode an iterator of row dicts incrementally for StreamingHttpResponse."""
+    charset = 'utf-8'
+
+    def stream(self, rows):
+        raise NotImplementedError()
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if isinstance(data, dict):
+            data = data.get('items', [data])
+        return b''.join(chunk.encode(self.charset) for chunk in self.stream(data))
+
+class NDJSONRenderer(StreamingRenderer):
+    media_type = 'application/x-ndjson'
+    format = 'ndjson'
+
+    def stream(self, rows):
+        for row in rows:
+            yield json.dumps(row, default=json_default) + '\n'
+
+class CSVRenderer(StreamingRenderer):
+    media_type = 'text/csv'
+    format = 'csv'
+
+    class _Echo:
+        """File-like object whose write() hands back the line, so csv.writer can feed a generator."""
+        def write(self, value):
+            return value
+
+    def stream(self, rows):
+        writer = None
+        for row in rows:
+            if writer is None:
+                writer = csv.DictWriter(self._Echo(), fieldnames=list(row))
+                yield writer.writerow(dict(zip(row, row)))
+            # ISO 8601 timestamps so CSV and JSON exports carry identical values
+            yield writer.writerow({
+                key: value.isoformat() if isinstance(value, (datetime.datetime, datetime.date)) else value
+                for key, value in row.items()
+            })
+
+class GeoJSONRenderer(StreamingRenderer):
+    """FeatureCollection of Point features.
+
+    Rows either carry latitude/longitude, or a 'geometry' string already encoded as GeoJSON by
+    the database, which is written out as is.
+    """
+    media_type = 'application/geo+json'
+    format = 'geojson'
+
+    def stream(self, rows):
+        yield '{"type":"FeatureCollection","features":['
+        separator = ''
+        for row in rows:
+            properties = dict(row)
+            geometry = properties.pop('geometry', None)
+            if geometry is None:
+                longitude = properties.pop('longitude', None)
+                latitude = properties.pop('latitude', None)
+                geometry = json.dumps({'type': 'Point', 'coordinates': [longitude, latitude]}) if longitude is not None else 'null'
+            yield (
+                f'{separator}{{"type":"Feature","id":{json.dumps(properties.get("id"), default=json_default)},'
+                f'"geometry":{geometry},"properties":{json.dumps(properties, default=json_default)}}}'
+            )
+            separator = ','
+        yield ']}'
+
+class MVTRenderer(BaseRenderer):
+    """Mapbox Vector Tiles, passed through as the bytes PostGIS built.
+
+    Anything else reaching it is an error payload, which is written as JSON instead.
+    """
+    media_type = 'application/vnd.mapbox-vector-tile'
+    format = 'mvt'
+    charset = None
+    render_style = 'binary'
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if isinstance(data, (bytes, bytearray, memoryview)):
+            return bytes(data)
+        response = (renderer_context or {}).get('response')
+        if response is not None:
+            response['Content-Type'] = ORJSONRenderer.media_type
+        return ORJSONRenderer().render(data)
@@ -1,19 +1,102 @@
 # django_app/modules/v1/places/repositories.py
 
-from django.contrib.gis.db.models.functions import Distance
+from django.contrib.gis.db.models.functions import AsGeoJSON, Distance
 from django.contrib.gis.geos import Point, Polygon
 from django.contrib.gis.measure import D
+from django.contrib.postgres.search import SearchQuery, SearchRank
+from django.core.exceptions import ValidationError
+from django.db import DatabaseError, connections, transaction
 from django.db.models import Q, F
+from django.db.models.expressions import RawSQL
+from django.utils import timezone
 from django.utils.text import slugify
+import io
+import json
 import uuid
+from collections import defaultdict
 from typing import List, Dict, Any, Optional
 
-from .models import Place
+from django_app.__shared.conditional import ConditionalUtils
+from django_app.__shared.pagination import CountUtils
+from django_app.__shared.search import SearchUtils
+
+from .cache import LOOKUP_FIELDS, PlaceCache
+from .filters import PlaceFilter
+from .models import Place, FULL_TEXT_CONFIG
+from .utils import CursorUtils, GeoUtils, datetime_representation
+
+# Rows per INSERT/UPDATE statement in create_many and update_many
+BULK_BATCH_SIZE = 1000
+
+# Columns update_many may write; identifiers, timestamps and generated columns are excluded
+UPDATABLE_FIELDS = frozenset(
+    field.name for field in Place._meta.concrete_fields
+    if field.editable and not field.primary_key and not field.generated
+)
+
+# Vector tile geometry resolution and the clip buffer around each tile, in tile units
+TILE_EXTENT = 4096
+TILE_BUFFER = 64
+
+# Attributes encoded in tiles from each zoom level up; low zooms only carry what is needed to style points
+TILE_ZOOM_ATTRIBUTES = (
+    (0, ('id', 'type')),
+    (10, ('id', 'type', 'status', 'name')),
+    (14, ('id', 'uuid', 'type', 'status', 'name', 'slug', 'city')),
+)
+
+# Columns loaded by copy_many through the staging table; the rest are set by the database or the merge
+COPY_FIELDS = (
+    'uuid', 'name', 'slug', 'description', 'address', 'city', 'state', 'country', 'postal_code',
+    'location', 'website', 'phone', 'email', 'type', 'status',
+)
+COPY_STAGING_TABLE = 'places_copy_staging'
+
+# Columns of list rows, read with values() so list endpoints never build Place instances or touch GEOS
+LIST_FIELDS = (
+    'id', 'uuid', 'name', 'slug', 'description', 'address', 'city', 'state', 'country', 'postal_code',
+    'website', 'phone', 'email', 'type', 'status', 'created_at', 'updated_at',
+)
+# Choice labels looked up once instead of calling get_FOO_display per row
+TYPE_LABELS = {value: str(label) for value, label in Place.PlaceType.choices}
+STATUS_LABELS = {value: str(label) for value, label in Place.PlaceStatus.choices}
+# Timestamp columns of list rows, written in the same format as PlaceResponseSerializer
+DATETIME_FIELDS = ('created_at', 'updated_at')
+# Every key a list row carries, i.e. the names accepted by ?fields= on every list endpoint
+LIST_ROW_FIELDS = (*LIST_FIELDS, 'type_display', 'status_display', 'latitude', 'longitude')
+# Annotations only some endpoints add to their rows, so only their ?fields= accepts them
+NEARBY_ROW_FIELDS = (*LIST_ROW_FIELDS, 'distance')
+SEARCH_ROW_FIELDS = (*LIST_ROW_FIELDS, 'similarity', 'rank')
+
+# Columns written by export, in output order; coordinates are computed in the database
+EXPORT_FIELDS = (
+    'id', 'uuid', 'name', 'slug', 'description', 'address', 'city', 'state', 'country', 'postal_code',
+    'latitude', 'longitude', 'website', 'phone', 'email', 'type', 'status', 'created_at', 'updated_at',
+)
+# Rows fetched per round trip from the server-side cursor during export
+EXPORT_CHUNK_SIZE = 2000
+# Default decimal places of GeoJSON coordinates; 6 is about 10 cm
+GEOJSON_PRECISION = 6
+
+# Side of a cluster grid cell in screen pixels (256px tiles), and a hard cap on cells per response
+CLUSTER_CELL_PX = 60
+MAX_CLUSTERS = 2000
 
 class PlaceRepository:
-    def find_one(self, params):
-        """Find a single place based on filter parameters."""
+    def __init__(self, cache=None):
+        self.cache = cache or PlaceCache()
+
+    def find_one(self, params, columns=None):
+        """Find a single place based on filter parameters, loading only `columns` when given.
+
+        A lookup by exactly one of id, uuid or slug goes through the cache, which always holds
+        whole rows, so `columns` only narrows the other lookups.
+        """
         try:
+            lookups = [(field, getattr(params, field)) for field in LOOKUP_FIELDS if getattr(params, field) is not None]
+            if self.cache.enabled and len(lookups) == 1 and params.name is None:
+                return self._cached_lookup(*lookups[0])
+
             filters = {}
             if params.id is not None:
                 filters['id'] = params.id
@@ -24,12 +107,13 @@ class PlaceRepository:
             if params.name is not None:
                 filters['name'] = params.name
                 
-            return Place.objects.filter(**filters).first()
+            queryset = Place.objects.only(*columns) if columns else Place.objects.all()
+            return queryset.filter(**filters).first()
         except Exception as e:
             print(f"Error in find_one: {str(e)}")
             return None
 
-    def find_all(self, page=1, per_page=10, sort='id', sort_dir='asc', filters=None):
+    def find_all(self, page=1, per_page=10, sort='id', sort_dir='asc', filters=None, pagination='offset', after=None, before=None, count='exact', assembly='python', fields=None):
         """Find all places with pagination and sorting."""
         try:
             queryset = Place.objects.all()
@@ -43,35 +127,10 @@ class PlaceRepository:
                 if filter_dict:
                     queryset = queryset.filter(**filter_dict)
             
-            # Apply sorting
-            sort_field = sort
-            if sort_dir.lower() == 'desc':
-                sort_field = f'-{sort_field}'
-            queryset = queryset.order_by(sort_field)
-            
-            # Apply pagination
-            total = queryset.count()
-            offset = (page - 1) * per_page
-            items = queryset[offset:offset + per_page]
-            
-            last_page = (total + per_page - 1) // per_page  # Ceiling division
-            
-            return {
-                'items': items,
-                'total': total,
-                'current_page': page,
-                'per_page': per_page,
-                'last_page': last_page
-            }
+            return self._paginate_queryset(queryset, page, per_page, sort, sort_dir, pagination, after, before, count=count, assembly=assembly, fields=fields)
         except Exception as e:
             print(f"Error in find_all: {str(e)}")
-            return {
-                'items': [],
-                'total': 0,
-                'current_page': page,
-                'per_page': per_page,
-                'last_page': 0
-            }
+            return self._empty_page(page, per_page)
 
     def create_one(self, data):
         """Create a new place."""
@@ -96,14 +155,124 @@ class PlaceRepository:
             print(f"Error in create_one: {str(e)}")
             return None
 
-    def create_many(self, data_list):
-        """Create multiple places."""
-        created_places = []
-        for data in data_list:
-            place = self.create_one(data)
-            if place:
-                created_places.append(place)
-        return created_places
+    def create_many(self, data_list, batch_size=BULK_BATCH_SIZE):
+        """Create multiple places in bulk, reporting the rows that could not be created."""
+        errors = []
+        rows = []
+        for index, data in enumerate(data_list):
+            try:
+                rows.append((index, self._build_place(data)))
+            except (TypeError, ValueError, ValidationError) as e:
+                errors.append({'index': index, 'error': str(e)})
+
+        rows = self._resolve_slugs(rows, errors)
+
+        places = []
+        with transaction.atomic():
+            for start in range(0, len(rows), batch_size):
+                chunk = rows[start:start + batch_size]
+                try:
+                    with transaction.atomic():
+                        Place.objects.bulk_create([place for _, place in chunk])
+                    places.extend(place for _, place in chunk)
+                except DatabaseError:
+                    # Retry the failing chunk row by row so one bad row does not sink its neighbours
+                    for index, place in chunk:
+                        try:
+                            with transaction.atomic():
+                                place.save(force_insert=True)
+                            places.append(place)
+                        except DatabaseError as e:
+                            errors.append({'index': index, 'error': str(e)})
+
+        return {'places': places, 'errors': sorted(errors, key=lambda error: error['index'])}
+
+    def copy_many(self, data_list):
+        """Validate places and load them with COPY into a staging table merged by one INSERT ... SELECT.
+
+        Much faster than create_many for large imports, and PostgreSQL only. Slugs that are already
+        taken, or repeated within the batch, get a random suffix instead of failing the row; rows whose
+        uuid already exists are skipped, so loading the same batch twice is harmless. A row that still
+        collides on its slug, e.g. with a concurrent insert, is reported as an error.
+        """
+        errors = []
+        places = []
+        for index, data in enumerate(data_list):
+            try:
+                place = self._build_place(data)
+            except (TypeError, ValueError, ValidationError) as e:
+                errors.append({'index': index, 'error': str(e)})
+                continue
+            if not place.slug:
+                # Leave room for the collision suffix within the 250 character column
+                place.slug = slugify(place.name)[:240] or 'place'
+            places.append((index, place))
+
+        if not places:
+            return {'inserted': 0, 'skipped': 0, 'errors': errors}
+
+        # COPY text format: tab separated, with \N for NULL so None and '' stay distinct
+        buffer = io.StringIO()
+        for index, place in places:
+            values = [index, *(place.location.ewkt if name == 'location' else getattr(place, name) for name in COPY_FIELDS)]
+            buffer.write('\t'.join(self._copy_text(value) for value in values) + '\n')
+        buffer.seek(0)
+
+        columns = ', '.join(COPY_FIELDS)
+        table = Place._meta.db_table
+        now = timezone.now()
+        # ON COMMIT DELETE ROWS empties the staging table at the end of every batch transaction;
+        # seq is the row's index in data_list
+        with transaction.atomic(), connections[Place.objects.db].cursor() as cursor:
+            cursor.execute(f"""
+                CREATE TEMP TABLE IF NOT EXISTS {COPY_STAGING_TABLE} ON COMMIT DELETE ROWS
+                AS SELECT 0::bigint AS seq, {columns} FROM {table} WITH NO DATA
+            """)
+            cursor.copy_expert(f"COPY {COPY_STAGING_TABLE} (seq, {columns}) FROM STDIN WITH (FORMAT text, NULL '\\N')", buffer)
+
+            cursor.execute(f"SELECT p.uuid FROM {table} p JOIN {COPY_STAGING_TABLE} s ON s.uuid = p.uuid")
+            existing = {row[0] for row in cursor.fetchall()}
+
+            # The first row of each slug keeps it when it is free; any other row gets a suffix.
+            # ON CONFLICT skips existing uuids; the rows it skips for their slug are told apart below
+            select_columns = ', '.join(
+                f"""CASE WHEN s.slug_rank = 1 AND NOT EXISTS (SELECT 1 FROM {table} p WHERE p.slug = s.slug)
+                         THEN s.slug ELSE left(s.slug, 240) || '-' || left(md5(random()::text), 8) END"""
+                if name == 'slug' else f's.{name}'
+                for name in COPY_FIELDS
+            )
+            cursor.execute(f"""
+                INSERT INTO {table} ({columns}, created_at, updated_at)
+                SELECT {select_columns}, %s, %s
+                FROM (
+                    SELECT *, row_number() OVER (PARTITION BY slug ORDER BY seq) AS slug_rank
+                    FROM {COPY_STAGING_TABLE}
+                ) AS s
+                ORDER BY s.seq
+                ON CONFLICT DO NOTHING
+                RETURNING uuid
+            """, (now, now))
+            inserted = {row[0] for row in cursor.fetchall()}
+
+        skipped = 0
+        seen = set()
+        for index, place in places:
+            if place.uuid in existing or place.uuid in seen:
+                skipped += 1
+            elif place.uuid in inserted:
+                seen.add(place.uuid)
+            else:
+                errors.append({'index': index, 'error': f'slug {place.slug!r} conflicts with an existing place'})
+                seen.add(place.uuid)
+
+        return {'inserted': len(inserted), 'skipped': skipped, 'errors': sorted(errors, key=lambda error: error['index'])}
+
+    @staticmethod
+    def _copy_text(value):
+        """A value as a COPY text format field: backslash escapes, and \\N for NULL."""
+        if value is None:
+            return '\\N'
+        return str(value).replace('\\', '\\\\').replace('\t', '\\t').replace('\n', '\\n').replace('\r', '\\r')
 
     def update_one(self, place_id, data):
         """Update a place by ID."""
@@ -122,6 +291,7 @@ class PlaceRepository:
                     setattr(place, key, value)
             
             place.save()
+            self.cache.invalidate([place.id])
             return place
         except Place.DoesNotExist:
             return None
@@ -129,22 +299,46 @@ class PlaceRepository:
             print(f"Error in update_one: {str(e)}")
             return None
 
-    def update_many(self, places_data):
-        """Update multiple places."""
-        updated_places = []
-        for place_data in places_data:
-            place_id = place_data.pop('id', None)
-            if place_id:
-                place = self.update_one(place_id, place_data)
-                if place:
-                    updated_places.append(place)
-        return updated_places
+    def update_many(self, places_data, batch_size=BULK_BATCH_SIZE):
+        """Update multiple places with one fetch and one bulk UPDATE per set of changed fields."""
+        try:
+            changes = {}
+            for place_data in places_data:
+                data = dict(place_data)
+                place_id = data.pop('id', None)
+                if place_id:
+                    changes.setdefault(place_id, {}).update(data)
+
+            places = Place.objects.in_bulk(list(changes))
+            groups = defaultdict(list)
+            now = timezone.now()
+            for place_id, data in changes.items():
+                place = places.get(place_id)
+                if place is None:
+                    continue
+                changed = self._apply_changes(place, data)
+                if changed:
+                    # bulk_update skips auto_now, so stamp it explicitly
+                    place.updated_at = now
+                    groups[frozenset(changed)].append(place)
+
+            with transaction.atomic():
+                for fields, group in groups.items():
+                    Place.objects.bulk_update(group, fields=[*sorted(fields), 'updated_at'], batch_size=batch_size)
+            # bulk_update sends no signals, so the cached rows are dropped here
+            self.cache.invalidate([place.id for group in groups.values() for place in group])
+
+            return [places[place_id] for place_id in changes if place_id in places]
+        except Exception as e:
+            print(f"Error in update_many: {str(e)}")
+            return []
 
     def remove_one(self, place_id):
         """Remove a place by ID."""
         try:
             place = Place.objects.get(id=place_id)
             place.delete()
+            self.cache.invalidate([place_id])
             return True
         except Place.DoesNotExist:
             return False
@@ -156,111 +350,81 @@ class PlaceRepository:
         """Remove multiple places by IDs."""
         try:
             Place.objects.filter(id__in=place_ids).delete()
+            self.cache.invalidate(place_ids)
             return True
         except Exception as e:
             print(f"Error in remove_many: {str(e)}")
             return False
 
-    def search(self, query, field, page=1, per_page=10, sort='id', sort_dir='asc'):
-        """Search places by a specific field."""
+    def search(self, query, field, page=1, per_page=10, sort='id', sort_dir='asc', pagination='offset', after=None, before=None, count='exact', assembly='python', fields=None):
+        """Search places by a specific field, optionally ranked by trigram similarity."""
         try:
+            # Served by the UPPER(field) gin_trgm_ops index on Postgres
             filter_kwargs = {f"{field}__icontains": query}
             queryset = Place.objects.filter(**filter_kwargs)
-            
-            # Apply sorting
+
+            # Best matches first; backends without pg_trgm fall back to id ordering
             sort_field = sort
-            if sort_dir.lower() == 'desc':
-                sort_field = f'-{sort_field}'
-            queryset = queryset.order_by(sort_field)
-            
-            # Apply pagination
-            total = queryset.count()
-            offset = (page - 1) * per_page
-            items = queryset[offset:offset + per_page]
-            
-            last_page = (total + per_page - 1) // per_page  # Ceiling division
-            
-            return {
-                'items': items,
-                'total': total,
-                'current_page': page,
-                'per_page': per_page,
-                'last_page': last_page
-            }
+            if sort == 'similarity':
+                queryset = SearchUtils.annotate_similarity(queryset, [field], query)
+                sort_field, sort_dir = ('similarity', 'desc') if SearchUtils.is_postgres(queryset) else ('id', sort_dir)
+
+            return self._paginate_queryset(queryset, page, per_page, sort, sort_dir, pagination, after, before, count=count, sort_field=sort_field, assembly=assembly, fields=fields)
         except Exception as e:
             print(f"Error in search: {str(e)}")
-            return {
-                'items': [],
-                'total': 0,
-                'current_page': page,
-                'per_page': per_page,
-                'last_page': 0
-            }
-
-    def filter(self, filters, page=1, per_page=10, sort='id', sort_dir='asc'):
-        """Filter places by multiple criteria."""
+            return self._empty_page(page, per_page)
+
+    def full_text_search(self, query, page=1, per_page=10, sort='rank', sort_dir='desc', pagination='offset', after=None, before=None, count='exact', assembly='python', fields=None):
+        """Search places through the weighted search_vector, ordered by ts_rank."""
         try:
-            queryset = Place.objects.all()
-            
-            # Apply filters
-            if filters:
-                filter_dict = {}
-                for key, value in filters.items():
-                    if value is not None:
-                        filter_dict[key] = value
-                if filter_dict:
-                    queryset = queryset.filter(**filter_dict)
-            
-            # Apply sorting
+            search_query = SearchQuery(query, config=FULL_TEXT_CONFIG, search_type='websearch')
+            queryset = Place.objects.filter(search_vector=search_query)
+
             sort_field = sort
-            if sort_dir.lower() == 'desc':
-                sort_field = f'-{sort_field}'
-            queryset = queryset.order_by(sort_field)
-            
-            # Apply pagination
-            total = queryset.count()
-            offset = (page - 1) * per_page
-            items = queryset[offset:offset + per_page]
-            
-            last_page = (total + per_page - 1) // per_page  # Ceiling division
-            
-            return {
-                'items': items,
-                'total': total,
-                'current_page': page,
-                'per_page': per_page,
-                'last_page': last_page
-            }
+            if sort == 'rank':
+                queryset = queryset.annotate(rank=SearchRank(F('search_vector'), search_query))
+                sort_dir = 'desc'
+
+            return self._paginate_queryset(queryset, page, per_page, sort, sort_dir, pagination, after, before, count=count, sort_field=sort_field, assembly=assembly, fields=fields)
+        except Exception as e:
+            print(f"Error in full_text_search: {str(e)}")
+            return self._empty_page(page, per_page)
+
+    def filter(self, filters, page=1, per_page=10, sort='id', sort_dir='asc', pagination='offset', after=None, before=None, count='exact', assembly='python', fields=None):
+        """Filter places by multiple criteria."""
+        try:
+            queryset = self._filter_queryset(filters)
+            return self._paginate_queryset(queryset, page, per_page, sort, sort_dir, pagination, after, before, count=count, assembly=assembly, fields=fields)
         except Exception as e:
             print(f"Error in filter: {str(e)}")
-            return {
-                'items': [],
-                'total': 0,
-                'current_page': page,
-                'per_page': per_page,
-                'last_page': 0
-            }
-
-    def find_by_id(self, place_id):
-        """Find a place by ID."""
+            return self._empty_page(page, per_page)
+
+    def find_by_id(self, place_id, columns=None):
+        """Find a place by ID through the cache; `columns` narrows the query when caching is off."""
         try:
-            return Place.objects.get(id=place_id)
+            if self.cache.enabled:
+                return self._cached_lookup('id', place_id)
+            queryset = Place.objects.only(*columns) if columns else Place.objects.all()
+            return queryset.get(id=place_id)
         except Place.DoesNotExist:
             return None
         except Exception as e:
             print(f"Error in find_by_id: {str(e)}")
             return None
 
-    def find_by_ids(self, place_ids):
-        """Find multiple places by IDs."""
+    def find_by_ids(self, place_ids, columns=None):
+        """Find multiple places by IDs, loading only `columns` when given."""
         try:
-            return list(Place.objects.filter(id__in=place_ids))
+            queryset = Place.objects.only(*columns) if columns else Place.objects.all()
+            return list(queryset.filter(id__in=place_ids))
         except Exception as e:
             print(f"Error in find_by_ids: {str(e)}")
             return []
 
     def exists_by_id(self, place_id):
-        """Check if a place exists by ID."""
+        """Check if a place exists by ID; a cached row answers without a query."""
+        if self.cache.enabled and self.cache.lookup('id', place_id)[0] is not None:
+            return True
         return Place.objects.filter(id=place_id).exists()
 
     def exists_by_ids(self, place_ids):
@@ -276,80 +440,483 @@ class PlaceRepository:
 
     # Geo-specific methods
     
-    def g_near(self, latitude, longitude, radius=5000, page=1, per_page=10, sort='id', sort_dir='asc'):
+    def g_near(self, latitude, longitude, radius=5000, page=1, per_page=10, sort='id', sort_dir='asc', pagination='offset', after=None, before=None, count='exact', assembly='python', fields=None):
         """Find places near a point within a radius (in meters)."""
         try:
-            point = Point(longitude, latitude, srid=4326)
-            queryset = Place.objects.filter(location__distance_lte=(point, D(m=radius)))
-            
-            # Add distance annotation
-            queryset = queryset.annotate(distance=Distance('location', point))
-            
-            # Apply sorting (default to distance if not specified)
+            queryset = self._near_queryset(latitude, longitude, radius)
+            # Default to distance ordering if no sort was specified
             sort_field = 'distance' if sort == 'id' else sort
-            if sort_dir.lower() == 'desc' and sort_field == 'distance':
-                sort_field = '-distance'
-            elif sort_dir.lower() == 'desc':
-                sort_field = f'-{sort_field}'
-            queryset = queryset.order_by(sort_field)
-            
-            # Apply pagination
-            total = queryset.count()
-            offset = (page - 1) * per_page
-            items = queryset[offset:offset + per_page]
-            
-            last_page = (total + per_page - 1) // per_page  # Ceiling division
-            
-            return {
-                'items': items,
-                'total': total,
-                'current_page': page,
-                'per_page': per_page,
-                'last_page': last_page
-            }
+            return self._paginate_queryset(queryset, page, per_page, sort, sort_dir, pagination, after, before, count=count, sort_field=sort_field, assembly=assembly, fields=fields)
         except Exception as e:
             print(f"Error in g_near: {str(e)}")
-            return {
-                'items': [],
-                'total': 0,
-                'current_page': page,
-                'per_page': per_page,
-                'last_page': 0
-            }
-
-    def g_within_box(self, min_lat, min_lng, max_lat, max_lng, page=1, per_page=10, sort='id', sort_dir='asc'):
+            return self._empty_page(page, per_page)
+
+    def g_within_box(self, min_lat, min_lng, max_lat, max_lng, page=1, per_page=10, sort='id', sort_dir='asc', pagination='offset', after=None, before=None, count='exact', assembly='python', fields=None):
         """Find places within a bounding box."""
         try:
-            # Create polygon from bounding box coordinates
-            bbox = Polygon.from_bbox((min_lng, min_lat, max_lng, max_lat))
-            queryset = Place.objects.filter(location__contained=bbox)
-            
-            # Apply sorting
-            sort_field = sort
-            if sort_dir.lower() == 'desc':
-                sort_field = f'-{sort_field}'
-            queryset = queryset.order_by(sort_field)
-            
-            # Apply pagination
-            total = queryset.count()
-            offset = (page - 1) * per_page
-            items = queryset[offset:offset + per_page]
-            
-            last_page = (total + per_page - 1) // per_page  # Ceiling division
-            
-            return {
-                'items': items,
-                'total': total,
-                'current_page': page,
-                'per_page': per_page,
-                'last_page': last_page
-            }
+            queryset = self._within_box_queryset(min_lat, min_lng, max_lat, max_lng)
+            return self._paginate_queryset(queryset, page, per_page, sort, sort_dir, pagination, after, before, count=count, assembly=assembly, fields=fields)
         except Exception as e:
             print(f"Error in g_within_box: {str(e)}")
-            return {
-                'items': [],
-                'total': 0,
-                'current_page': page,
-                'per_page': per_page,
-                'last_page': 0
-            }
\ No newline at end of file
+            return self._empty_page(page, per_page)
+
+    def filter_features(self, filters, sort='id', sort_dir='asc', precision=GEOJSON_PRECISION):
+        """Yield every place matching the filters as a GeoJSON feature row."""
+        yield from self._feature_rows(self._filter_queryset(filters), sort, sort_dir, precision)
+
+    def g_near_features(self, latitude, longitude, radius=5000, sort='id', sort_dir='asc', precision=GEOJSON_PRECISION):
+        """Yield every place within radius meters of a point as a GeoJSON feature row, nearest first by default."""
+        queryset = self._near_queryset(latitude, longitude, radius)
+        yield from self._feature_rows(queryset, 'distance' if sort == 'id' else sort, sort_dir, precision)
+
+    def g_within_box_features(self, min_lat, min_lng, max_lat, max_lng, sort='id', sort_dir='asc', precision=GEOJSON_PRECISION):
+        """Yield every place within a bounding box as a GeoJSON feature row."""
+        queryset = self._within_box_queryset(min_lat, min_lng, max_lat, max_lng)
+        yield from self._feature_rows(queryset, sort, sort_dir, precision)
+
+    def g_k_nearest(self, latitude, longitude, k=10, max_distance=None, filters=None):
+        """Find the k places closest to a point, optionally within max_distance (in meters)."""
+        try:
+            point = Point(longitude, latitude, srid=4326)
+            queryset = Place.objects.all()
+
+            if filters:
+                queryset = queryset.filter(**{key: value for key, value in filters.items() if value is not None})
+            if max_distance is not None:
+                queryset = queryset.filter(location__dwithin=(point, D(m=max_distance)))
+
+            # Order by the KNN operator so the GiST index on location returns rows nearest first
+            # and the scan stops after k rows, instead of computing and sorting every distance
+            knn = RawSQL(f'"{Place._meta.db_table}"."location" <-> %s::geography', (point.ewkt,))
+            queryset = queryset.annotate(distance=Distance('location', point)).order_by(knn)
+            return list(queryset[:k])
+        except Exception as e:
+            print(f"Error in g_k_nearest: {str(e)}")
+            return []
+
+    def g_tile(self, z, x, y, filters=None):
+        """Render the places inside tile z/x/y as a Mapbox Vector Tile."""
+        try:
+            queryset = Place.objects.all()
+            if filters:
+                queryset = PlaceFilter(filters, queryset=queryset).qs
+
+            attributes = next(attrs for min_zoom, attrs in reversed(TILE_ZOOM_ATTRIBUTES) if z >= min_zoom)
+            inner_sql, inner_params = queryset.values('location', *attributes).query.sql_with_params()
+            columns = ', '.join(f'p.{name}::text AS {name}' if name == 'uuid' else f'p.{name}' for name in attributes)
+
+            # The buffered envelope (in 4326) drives the GiST index on location; ST_AsMVTGeom then
+            # projects to tile coordinates and clips anything beyond the buffer
+            sql = f"""
+                WITH bounds AS (
+                    SELECT ST_TileEnvelope(%s, %s, %s) AS geom,
+                           ST_Transform(ST_TileEnvelope(%s, %s, %s, margin => {TILE_BUFFER / TILE_EXTENT}), 4326)::geography AS search
+                ),
+                mvtgeom AS (
+                    SELECT ST_AsMVTGeom(ST_Transform(p.location::geometry, 3857), bounds.geom, {TILE_EXTENT}, {TILE_BUFFER}, true) AS geom,
+                           {columns}
+                    FROM ({inner_sql}) AS p, bounds
+                    WHERE p.location && bounds.search
+                )
+                SELECT ST_AsMVT(mvtgeom.*, 'places', {TILE_EXTENT}, 'geom') FROM mvtgeom
+            """
+            with connections[queryset.db].cursor() as cursor:
+                cursor.execute(sql, (z, x, y, z, x, y, *inner_params))
+                row = cursor.fetchone()
+            return bytes(row[0]) if row and row[0] else b''
+        except Exception as e:
+            # An empty tile would be cached by clients as "no places here", so fail the request
+            print(f"Error in g_tile: {str(e)}")
+            raise
+
+    def g_cluster(self, min_lat, min_lng, max_lat, max_lng, zoom, filters=None):
+        """Group the places inside a bounding box into grid cells sized for the zoom level."""
+        try:
+            queryset = Place.objects.all()
+            if filters:
+                queryset = PlaceFilter(filters, queryset=queryset).qs
+            inner_sql, inner_params = queryset.values('id', 'type', 'location').query.sql_with_params()
+
+            # Cell size in degrees so that one cell spans CLUSTER_CELL_PX on screen at this zoom
+            size = 360 / (256 * 2 ** zoom) * CLUSTER_CELL_PX
+
+            # Aggregate per (cell, type) first so the per-type breakdown and centroid come from
+            # one pass; centroids are averaged from coordinate sums rather than collected geometries
+            sql = f"""
+                WITH by_type AS (
+                    SELECT floor(ST_X(p.location::geometry) / %s) AS cx,
+                           floor(ST_Y(p.location::geometry) / %s) AS cy,
+                           p.type, COUNT(*) AS n, MIN(p.id) AS min_id,
+                           SUM(ST_X(p.location::geometry)) AS sx,
+                           SUM(ST_Y(p.location::geometry)) AS sy
+                    FROM ({inner_sql}) AS p
+                    WHERE p.location && ST_MakeEnvelope(%s, %s, %s, %s, 4326)::geography
+                    GROUP BY 1, 2, 3
+                )
+                SELECT SUM(sy) / SUM(n) AS latitude,
+                       SUM(sx) / SUM(n) AS longitude,
+                       SUM(n)::bigint AS count,
+                       jsonb_object_agg(type, n) AS types,
+                       CASE WHEN SUM(n) = 1 THEN MIN(min_id) END AS id
+                FROM by_type
+                GROUP BY cx, cy
+                ORDER BY count DESC
+                LIMIT {MAX_CLUSTERS}
+            """
+            with connections[queryset.db].cursor() as cursor:
+                cursor.execute(sql, (size, size, *inner_params, min_lng, min_lat, max_lng, max_lat))
+                rows = cursor.fetchall()
+
+            return [
+                {
+                    'latitude': latitude,
+                    'longitude': longitude,
+                    'count': count,
+                    'types': {int(place_type): n for place_type, n in (json.loads(types) if isinstance(types, str) else types).items()},
+                    'id': place_id
+                }
+                for latitude, longitude, count, types, place_id in rows
+            ]
+        except Exception as e:
+            print(f"Error in g_cluster: {str(e)}")
+            return []
+
+    def export(self, filters=None, bbox=None, chunk_size=EXPORT_CHUNK_SIZE):
+        """Yield places as plain dicts in id order, optionally narrowed by PlaceFilter criteria and a bbox.
+
+        Rows come from a server-side cursor in chunks of `chunk_size` without building model
+        instances, so memory stays flat however many places match. Errors are not swallowed
+        here: a failure mid-stream must not look like a complete export.
+        """
+        queryset = Place.objects.all()
+        if filters:
+            queryset = PlaceFilter(filters, queryset=queryset).qs
+        if bbox:
+            min_lat, min_lng, max_lat, max_lng = bbox
+            queryset = queryset.filter(location__intersects=Polygon.from_bbox((min_lng, min_lat, max_lng, max_lat)))
+
+        queryset = queryset.annotate(latitude=GeoUtils.latitude(), longitude=GeoUtils.longitude())
+        yield from queryset.order_by('id').values(*EXPORT_FIELDS).iterator(chunk_size=chunk_size)
+
+    # Cache helpers
+
+    def _cached_lookup(self, field, value):
+        """Serve a place by a unique column from the cache, filling it from the database on a miss."""
+        row, token = self.cache.lookup(field, value)
+        if row is None:
+            queryset = Place.objects.filter(**{field: value}).annotate(latitude=GeoUtils.latitude(), longitude=GeoUtils.longitude())
+            row = queryset.values(*LIST_FIELDS, 'latitude', 'longitude').first()
+            if row is None:
+                return None
+            self.cache.store(row, token)
+        return self._from_cache_row(row)
+
+    @staticmethod
+    def _from_cache_row(row):
+        """Rebuild a Place from a cached row as if it had been loaded by a query (search_vector stays deferred)."""
+        values = {name: row[name] for name in LIST_FIELDS}
+        values['location'] = Point(row['longitude'], row['latitude'], srid=4326)
+        return Place.from_db(Place.objects.db, list(values), list(values.values()))
+
+    # Query builders shared by the paginated and the GeoJSON variants
+
+    @staticmethod
+    def _filter_queryset(filters):
+        queryset = Place.objects.all()
+        if filters:
+            filter_dict = {key: value for key, value in filters.items() if value is not None}
+            if filter_dict:
+                queryset = queryset.filter(**filter_dict)
+        return queryset
+
+    @staticmethod
+    def _near_queryset(latitude, longitude, radius):
+        point = Point(longitude, latitude, srid=4326)
+        queryset = Place.objects.filter(location__distance_lte=(point, D(m=radius)))
+        return queryset.annotate(distance=Distance('location', point))
+
+    @staticmethod
+    def _within_box_queryset(min_lat, min_lng, max_lat, max_lng):
+        bbox = Polygon.from_bbox((min_lng, min_lat, max_lng, max_lat))
+        return Place.objects.filter(location__contained=bbox)
+
+    @staticmethod
+    def _feature_rows(queryset, sort_field, sort_dir, precision, chunk_size=EXPORT_CHUNK_SIZE):
+        """Yield list rows for a FeatureCollection from a server-side cursor.
+
+        'geometry' holds the text produced by ST_AsGeoJSON, which the renderer writes out
+        without parsing; distance, when annotated, is in meters. As with export, errors are
+        not swallowed so a failed stream is never mistaken for a complete one.
+        """
+        annotations = list(queryset.query.annotations)
+        if sort_field not in (*LIST_FIELDS, *annotations):
+            sort_field = 'id'
+        ordering = f'-{sort_field}' if sort_dir.lower() == 'desc' else sort_field
+        ordering = [ordering] if sort_field == 'id' else [ordering, 'id']
+        queryset = queryset.annotate(geometry=AsGeoJSON('location', precision=precision))
+        rows = queryset.order_by(*ordering).values(*LIST_FIELDS, *annotations, 'geometry')
+        for row in rows.iterator(chunk_size=chunk_size):
+            yield PlaceRepository._to_row(row)
+
+    # Bulk helpers
+
+    @staticmethod
+    def _build_place(data):
+        """Build an unsaved Place from request data, validating fields without touching the database."""
+        data = dict(data)
+        latitude = data.pop('latitude', None)
+        longitude = data.pop('longitude', None)
+        if latitude is None or longitude is None:
+            raise ValueError("Both latitude and longitude must be provided")
+        data['location'] = Point(float(longitude), float(latitude), srid=4326)
+
+        place = Place(**data)
+        place.full_clean(exclude=['slug'], validate_unique=False, validate_constraints=False)
+        return place
+
+    @staticmethod
+    def _apply_changes(place, data):
+        """Set the given values on a place and return the names of the fields that actually changed."""
+        data = dict(data)
+        latitude = data.pop('latitude', None)
+        longitude = data.pop('longitude', None)
+        if latitude is not None and longitude is not None:
+            data['location'] = Point(float(longitude), float(latitude), srid=4326)
+
+        changed = set()
+        for key, value in data.items():
+            if key in UPDATABLE_FIELDS and getattr(place, key) != value:
+                setattr(place, key, value)
+                changed.add(key)
+        return changed
+
+    @staticmethod
+    def _resolve_slugs(rows, errors):
+        """Give every row a unique slug using a single lookup of the candidates already taken.
+
+        Explicit slugs are settled first, so a slug generated for one row can never make another
+        row's explicit request for it fail; generated slugs are then fitted around them.
+        """
+        generated = set()
+        for index, place in rows:
+            if not place.slug:
+                # Leave room for the collision suffix within the 250 character column
+                place.slug = slugify(place.name)[:240] or 'place'
+                generated.add(index)
+        taken = set(Place.objects.filter(slug__in={place.slug for _, place in rows}).values_list('slug', flat=True))
+
+        rejected = set()
+        for index, place in rows:
+            if index in generated:
+                continue
+            # Explicit slugs are kept as given, so a collision is an error for that row
+            if place.slug in taken:
+                errors.append({'index': index, 'error': f"Slug '{place.slug}' already exists"})
+                rejected.add(index)
+            else:
+                taken.add(place.slug)
+
+        for index, place in rows:
+            if index not in generated:
+                continue
+            base = place.slug
+            while place.slug in taken:
+                place.slug = f"{base}-{str(uuid.uuid4())[:8]}"
+            taken.add(place.slug)
+
+        resolved = [(index, place) for index, place in rows if index not in rejected]
+        return resolved
+
+    # Pagination helpers
+
+    def _paginate_queryset(self, queryset, page, per_page, sort, sort_dir, pagination='offset', after=None, before=None, count='exact', sort_field=None, assembly='python', fields=None):
+        """Order and slice a queryset using offset or keyset (cursor) pagination.
+
+        `fields` is a sparse fieldset: only the columns behind those row keys are selected and
+        the items carry exactly those keys, in that order.
+        """
+        sort_field = sort_field or sort
+        validators = None
+        if count == 'exact':
+            # One aggregate gives the exact total and the page's conditional GET validators
+            validators = ConditionalUtils.validators(queryset)
+            total, count_strategy = validators['count'], 'exact'
+        else:
+            total, count_strategy = CountUtils.count(queryset, count)
+        last_page = (total + per_page - 1) // per_page if total is not None else None  # Ceiling division
+        queryset = self._values_rows(queryset, fields, sort_field)
+        in_database = assembly == 'database' and SearchUtils.is_postgres(queryset)
+
+        if pagination == 'cursor':
+            page_data = self._cursor_page(queryset, per_page, sort, sort_dir, after, before, sort_field, in_database, fields)
+        else:
+            prefix = '-' if sort_dir.lower() == 'desc' else ''
+            # id breaks ties so pages neither repeat nor skip rows that share a sort value
+            ordering = [f'{prefix}{sort_field}'] if sort_field == 'id' else [f'{prefix}{sort_field}', f'{prefix}id']
+            offset = (page - 1) * per_page
+            # Fetch one extra row to know whether a next page exists without relying on the count
+            rows, items_json = self._fetch_page(queryset.order_by(*ordering)[offset:offset + per_page + 1], per_page, sort_field, in_database, fields=fields)
+            page_data = {'items': rows[:per_page], 'items_json': items_json, 'has_next': len(rows) > per_page}
+
+        if page_data['items_json'] is None:
+            page_data['items'] = [self._to_row(row, fields) for row in page_data['items']]
+        else:
+            # The rows were only sort keys for has_next and the cursors; the JSON carries the items
+            page_data['items'] = []
+        return {
+            'total': total,
+            'current_page': page,
+            'per_page': per_page,
+            'last_page': last_page,
+            'count_strategy': count_strategy,
+            'validators': validators,
+            **page_data
+        }
+
+    def _fetch_page(self, queryset, per_page, sort_field, in_database, reverse=False, fields=None):
+        """Run a sliced values() page query, returning (rows, items_json).
+
+        In Python mode rows are the full row dicts and items_json is None. In database mode
+        Postgres builds the JSON array of the first per_page rows (reversed if asked) and rows
+        only carry id and the sort key, for has_next and the cursors.
+        """
+        if not in_database:
+            return list(queryset), None
+
+        inner_sql, inner_params = queryset.query.sql_with_params()
+        # JSON member SQL and its parameters per row key
+        members = {name: (f'r."{name}"', ()) for name in (*queryset.query.values_select, *queryset.query.annotation_select)}
+        for name, labels in (('type', TYPE_LABELS), ('status', STATUS_LABELS)):
+            if name in members:
+                cases = ' '.join('WHEN %s THEN %s' for _ in labels)
+                members[f'{name}_display'] = (f'CASE r."{name}" {cases} END', [value for item in labels.items() for value in item])
+        for name in DATETIME_FIELDS:
+            if name in members:
+                # Same text as datetime_representation(): UTC, Z suffix, microseconds only when non-zero
+                utc = f'(r."{name}" AT TIME ZONE \'UTC\')'
+                members[name] = (
+                    f"""to_char({utc}, 'YYYY-MM-DD"T"HH24:MI:SS')
+                       || CASE WHEN date_part('microseconds', {utc})::bigint %% 1000000 = 0 THEN '' ELSE to_char({utc}, '.US') END
+                       || 'Z'""",
+                    ()
+                )
+        pairs, label_params = [], []
+        for name in fields or members:
+            member_sql, member_params = members[name]
+            pairs.append(f"'{name}', {member_sql}")
+            label_params.extend(member_params)
+
+        # n is the page position: the window repeats the inner query's ORDER BY, since an empty
+        # OVER () is free to number the rows in any order. id breaks ties in the sort key
+        ordering = [(name.lstrip('-'), 'DESC' if name.startswith('-') else 'ASC') for name in queryset.query.order_by]
+        if 'id' not in {name for name, _ in ordering}:
+            ordering.append(('id', ordering[0][1] if ordering else 'ASC'))
+        window = ', '.join(f'r."{name}" {direction}' for name, direction in ordering)
+        sql = f"""
+            SELECT coalesce(json_agg(t.doc ORDER BY t.n {'DESC' if reverse else 'ASC'}) FILTER (WHERE t.n <= %s), '[]')::text,
+                   coalesce(json_agg(json_build_array(t.sort_key, t.id) ORDER BY t.n), '[]')::text
+            FROM (
+                SELECT row_number() OVER (ORDER BY {window}) AS n, r."id" AS id, r."{sort_field}" AS sort_key,
+                       json_build_object({', '.join(pairs)}) AS doc
+                FROM ({inner_sql}) AS r
+            ) AS t
+        """
+        with connections[queryset.db].cursor() as cursor:
+            cursor.execute(sql, (per_page, *label_params, *inner_params))
+            items_json, keys_json = cursor.fetchone()
+        rows = [{'id': pk, sort_field: value} for value, pk in json.loads(keys_json)]
+        return rows, items_json.encode()
+
+    @staticmethod
+    def _values_rows(queryset, fields=None, sort_field='id'):
+        """Switch a list queryset to values() rows with coordinates computed by the database.
+
+        Annotations already on the queryset (distance, similarity, rank) are carried into the rows.
+        With a sparse fieldset only the columns behind `fields` are selected, plus id and the
+        sort key that has_next and the cursors need.
+        """
+        if fields is None:
+            queryset = queryset.annotate(latitude=GeoUtils.latitude(), longitude=GeoUtils.longitude())
+            return queryset.values(*LIST_FIELDS, *queryset.query.annotations)
+
+        coordinates = {
+            name: expression
+            for name, expression in (('latitude', GeoUtils.latitude()), ('longitude', GeoUtils.longitude()))
+            if name in fields
+        }
+        queryset = queryset.annotate(**coordinates)
+        # Labels are looked up from the choice columns
+        wanted = {name.removesuffix('_display') for name in fields} | {'id', sort_field}
+        columns = [name for name in LIST_FIELDS if name in wanted]
+        return queryset.values(*columns, *[name for name in queryset.query.annotations if name in wanted])
+
+    @staticmethod
+    def _to_row(row, fields=None):
+        """Finish a values() row: choice labels from the lookup tables, distance in meters.
+
+        With a sparse fieldset a new dict with just those keys is returned, else the row itself.
+        """
+        if 'type' in row:
+            row['type_display'] = TYPE_LABELS.get(row['type'])
+        if 'status' in row:
+            row['status_display'] = STATUS_LABELS.get(row['status'])
+        if 'distance' in row:
+            row['distance'] = row['distance'].m
+        for name in DATETIME_FIELDS:
+            if row.get(name) is not None:
+                row[name] = datetime_representation(row[name])
+        if fields is None:
+            return row
+        return {name: row[name] for name in fields}
+
+    def _cursor_page(self, queryset, per_page, sort, sort_dir, after, before, sort_field, in_database=False, fields=None):
+        """Fetch one page after/before a cursor with an index seek on (sort_field, id)."""
+        desc = sort_dir.lower() == 'desc'
+        backwards = before is not None and after is None
+        # Rows "greater" than the cursor come next when walking forward in asc or backward in desc order
+        greater = desc == backwards
+
+        cursor = after or before
+        if cursor:
+            value, pk = CursorUtils.decode(cursor, sort, sort_dir)
+            if sort_field == 'distance':
+                value = D(m=value)
+            queryset = queryset.filter(self._keyset_q(sort_field, value, pk, greater))
+
+        prefix = '' if greater else '-'
+        ordering = [f'{prefix}{sort_field}'] if sort_field == 'id' else [f'{prefix}{sort_field}', f'{prefix}id']
+        rows, items_json = self._fetch_page(queryset.order_by(*ordering)[:per_page + 1], per_page, sort_field, in_database, reverse=backwards, fields=fields)
+        has_more = len(rows) > per_page
+        rows = rows[:per_page]
+        if backwards:
+            rows.reverse()
+
+        def encode(obj):
+            return CursorUtils.encode(sort, sort_dir, CursorUtils.sort_value(obj, sort_field), obj['id'])
+
+        if backwards:
+            next_cursor = encode(rows[-1]) if rows else None
+            prev_cursor = encode(rows[0]) if rows and has_more else None
+        else:
+            next_cursor = encode(rows[-1]) if rows and has_more else None
+            prev_cursor = encode(rows[0]) if rows and after else None
+
+        return {'items': rows, 'items_json': items_json, 'next_cursor': next_cursor, 'prev_cursor': prev_cursor, 'has_next': next_cursor is not None}
+
+    @staticmethod
+    def _keyset_q(sort_field, value, pk, greater):
+        op = 'gt' if greater else 'lt'
+        if sort_field == 'id':
+            return Q(**{f'id__{op}': pk})
+        return Q(**{f'{sort_field}__{op}': value}) | Q(**{sort_field: value, f'id__{op}': pk})
+
+    @staticmethod
+    def _empty_page(page, per_page):
+        return {
+            'items': [],
+            'total': 0,
+            'current_page': page,
+            'per_page': per_page,
+            'last_page': 0,
+            'has_next': False
+        }
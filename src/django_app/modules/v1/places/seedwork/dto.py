@@ -12,11 +12,26 @@ class ListInput(Generic[T]):
     sort: str = 'id'
     sort_dir: str = 'asc'
     filter: Dict[str, Any] = field(default_factory=dict)
+    pagination: str = 'offset'
+    after: Optional[str] = None
+    before: Optional[str] = None
+    count: str = 'exact'
+    assembly: str = 'python'
+    # Sparse fieldset: row keys to return, all of them when None
+    fields: Optional[List[str]] = None
 
 @dataclass
 class ListOutput(Generic[T]):
     items: List[T]
-    total: int
+    total: Optional[int]
     current_page: int
     per_page: int
-    last_page: int
\ No newline at end of file
+    last_page: Optional[int]
+    next_cursor: Optional[str] = None
+    prev_cursor: Optional[str] = None
+    has_next: Optional[bool] = None
+    count_strategy: str = 'exact'
+    # JSON array of the page rows built by the database, set instead of items when assembly='database'
+    items_json: Optional[bytes] = None
+    # max(updated_at) and count of the whole filtered set, for the list ETag; None unless counted exactly
+    validators: Optional[Dict[str, Any]] = None
\ No newline at end of file
@@ -1,9 +1,21 @@
 # django_app/modules/v1/places/serializers.py
 
 from rest_framework import serializers
+from rest_framework.renderers import JSONRenderer
 from rest_framework_gis.serializers import GeoFeatureModelSerializer
 from django.contrib.gis.geos import Point
+from django_app.__shared.conditional import ConditionalUtils
+from django_app.__shared.pagination import COUNT_STRATEGIES
+from django_app.__shared.serializers import SparseFieldsField, SparseFieldsMixin
+
 from .models import Place
+from .repositories import EXPORT_CHUNK_SIZE, GEOJSON_PRECISION, LIST_ROW_FIELDS, NEARBY_ROW_FIELDS, SEARCH_ROW_FIELDS
+from .utils import CursorUtils
+
+# Non-nullable columns that can back a keyset cursor
+CURSOR_SORT_FIELDS = ('id', 'uuid', 'name', 'slug', 'type', 'status', 'created_at', 'updated_at')
+
+BBOX_FIELDS = ('min_lat', 'min_lng', 'max_lat', 'max_lng')
 
 class PlaceIdSerializer(serializers.Serializer):
     id = serializers.IntegerField()
@@ -54,10 +66,70 @@ class PaginationRequestSerializer(serializers.Serializer):
     per_page = serializers.IntegerField(required=False, default=10)
     sort = serializers.CharField(required=False, default='id')
     sort_dir = serializers.ChoiceField(choices=['asc', 'desc'], required=False, default='asc')
+    pagination = serializers.ChoiceField(choices=['offset', 'cursor'], required=False, default='offset')
+    after = serializers.CharField(required=False)
+    before = serializers.CharField(required=False)
+    # Defaults to 'exact' for offset pages and to 'none' for cursor pages, see validate()
+    count = serializers.ChoiceField(choices=COUNT_STRATEGIES, required=False)
+    # 'database' has Postgres build the item JSON, which is passed through to the response untouched
+    assembly = serializers.ChoiceField(choices=['python', 'database'], required=False, default='python')
+    fields = SparseFieldsField(allowed=LIST_ROW_FIELDS, required=False)
+
+    def validate(self, data):
+        """Switch to cursor pagination when a cursor is given and check it matches the sort.
+
+        Cursor pages only need has_next, so unless a count is asked for they skip the exact
+        count and the validators that come with it. A conditional request still gets them,
+        since its ETag is built from them. Database assembly writes JSON itself, so it only
+        applies when the JSON renderer was negotiated (not e.g. ?format=api).
+        """
+        after = data.get('after')
+        before = data.get('before')
+
+        if after and before:
+            raise serializers.ValidationError("Only one of after and before can be provided")
+        if after or before:
+            data['pagination'] = 'cursor'
+
+        if data['pagination'] == 'cursor':
+            if data['sort'] not in CURSOR_SORT_FIELDS:
+                raise serializers.ValidationError(f"Cursor pagination supports sorting by: {', '.join(CURSOR_SORT_FIELDS)}")
+            if after or before:
+                try:
+                    CursorUtils.decode(after or before, data['sort'], data['sort_dir'])
+                except ValueError as e:
+                    raise serializers.ValidationError(str(e))
+
+        request = self.context.get('request')
+        if data['assembly'] == 'database' and not isinstance(getattr(request, 'accepted_renderer', None), JSONRenderer):
+            data['assembly'] = 'python'
+        if 'count' not in data:
+            conditional = ConditionalUtils.is_conditional(request)
+            data['count'] = 'none' if data['pagination'] == 'cursor' and not conditional else 'exact'
+        return data
 
 class PlaceSearchRequestSerializer(PaginationRequestSerializer):
     query = serializers.CharField()
-    field = serializers.ChoiceField(choices=['name', 'description', 'address', 'city', 'state', 'country'])
+    field = serializers.ChoiceField(choices=['name', 'description', 'address', 'city', 'state', 'country'], required=False)
+    mode = serializers.ChoiceField(choices=['contains', 'full_text'], required=False, default='contains')
+    fields = SparseFieldsField(allowed=SEARCH_ROW_FIELDS, required=False)
+
+    def validate(self, data):
+        """Require a field for substring search; full text search ranks by ts_rank unless sorted otherwise.
+
+        similarity and rank are only annotated when the results are sorted by them, so they
+        can only be requested as fields then.
+        """
+        if data['mode'] == 'contains' and not data.get('field'):
+            raise serializers.ValidationError("field is required for contains search")
+        if data['mode'] == 'full_text' and data['sort'] == 'id':
+            data['sort'] = 'rank'
+        fields = data.get('fields') or ()
+        if 'similarity' in fields and not (data['mode'] == 'contains' and data['sort'] == 'similarity'):
+            raise serializers.ValidationError("similarity is only available for contains search sorted by similarity")
+        if 'rank' in fields and not (data['mode'] == 'full_text' and data['sort'] == 'rank'):
+            raise serializers.ValidationError("rank is only available for full text search sorted by rank")
+        return super().validate(data)
 
 class PlaceFilterRequestSerializer(PaginationRequestSerializer):
     uuid = serializers.UUIDField(required=False)
@@ -69,7 +141,7 @@ class PlaceFilterRequestSerializer(PaginationRequestSerializer):
     type = serializers.IntegerField(required=False)
     status = serializers.IntegerField(required=False)
 
-class PlaceResponseSerializer(serializers.ModelSerializer):
+class PlaceResponseSerializer(SparseFieldsMixin, serializers.ModelSerializer):
     type_display = serializers.CharField(source='get_type_display', read_only=True)
     status_display = serializers.CharField(source='get_status_display', read_only=True)
     latitude = serializers.SerializerMethodField()
@@ -81,6 +153,8 @@ class PlaceResponseSerializer(serializers.ModelSerializer):
                   'country', 'postal_code', 'website', 'phone', 'email', 
                   'type', 'type_display', 'status', 'status_display',
                   'created_at', 'updated_at', 'latitude', 'longitude')
+        # Columns read by the method fields, for ProjectionUtils
+        field_sources = {'latitude': ('location',), 'longitude': ('location',)}
     
     def get_latitude(self, obj):
         return obj.latitude()
@@ -88,6 +162,9 @@ class PlaceResponseSerializer(serializers.ModelSerializer):
     def get_longitude(self, obj):
         return obj.longitude()
 
+class PlaceFieldsRequestSerializer(serializers.Serializer):
+    fields = SparseFieldsField(allowed=PlaceResponseSerializer.Meta.fields, required=False)
+
 class PlaceCreateResponseSerializer(serializers.ModelSerializer):
     type_display = serializers.CharField(source='get_type_display', read_only=True)
     status_display = serializers.CharField(source='get_status_display', read_only=True)
@@ -104,16 +181,28 @@ class PlaceCreateResponseSerializer(serializers.ModelSerializer):
     def get_longitude(self, obj):
         return obj.longitude()
 
+class PlaceRowErrorSerializer(serializers.Serializer):
+    index = serializers.IntegerField()
+    error = serializers.CharField()
+
+class PlaceCreateManyResponseSerializer(serializers.Serializer):
+    places = PlaceCreateResponseSerializer(many=True)
+    errors = PlaceRowErrorSerializer(many=True)
+
 class PlaceExistsResponseSerializer(serializers.Serializer):
     id = serializers.IntegerField()
     exists = serializers.BooleanField()
 
 class PaginationResponseSerializer(serializers.Serializer):
     items = serializers.ListField()
-    total = serializers.IntegerField()
+    total = serializers.IntegerField(allow_null=True)
     current_page = serializers.IntegerField()
     per_page = serializers.IntegerField()
-    last_page = serializers.IntegerField()
+    last_page = serializers.IntegerField(allow_null=True)
+    has_next = serializers.BooleanField(required=False)
+    count_strategy = serializers.ChoiceField(choices=COUNT_STRATEGIES, required=False)
+    next_cursor = serializers.CharField(allow_null=True, required=False)
+    prev_cursor = serializers.CharField(allow_null=True, required=False)
 
 class PlaceSerializer(serializers.ModelSerializer):
     type_display = serializers.CharField(source='get_type_display', read_only=True)
@@ -140,6 +229,7 @@ class NearbyPlacesRequestSerializer(PaginationRequestSerializer):
     latitude = serializers.FloatField()
     longitude = serializers.FloatField()
     radius = serializers.FloatField(required=False, default=5000)  # Default 5km radius
+    fields = SparseFieldsField(allowed=NEARBY_ROW_FIELDS, required=False)
 
 class WithinBoxRequestSerializer(PaginationRequestSerializer):
     min_lat = serializers.FloatField()
@@ -147,6 +237,101 @@ class WithinBoxRequestSerializer(PaginationRequestSerializer):
     max_lat = serializers.FloatField()
     max_lng = serializers.FloatField()
 
+class GeoJSONRequestSerializer(serializers.Serializer):
+    # Decimal places of the coordinates written by ST_AsGeoJSON
+    precision = serializers.IntegerField(required=False, default=GEOJSON_PRECISION, min_value=0, max_value=15)
+
+class KNearestRequestSerializer(serializers.Serializer):
+    latitude = serializers.FloatField(min_value=-90, max_value=90)
+    longitude = serializers.FloatField(min_value=-180, max_value=180)
+    k = serializers.IntegerField(required=False, default=10, min_value=1, max_value=1000)
+    max_distance = serializers.FloatField(required=False, min_value=0)  # Meters, unbounded if omitted
+    type = serializers.ChoiceField(choices=Place.PlaceType.choices, required=False)
+    status = serializers.ChoiceField(choices=Place.PlaceStatus.choices, required=False)
+
+class PlaceNearestResponseSerializer(PlaceResponseSerializer):
+    distance = serializers.SerializerMethodField()
+
+    class Meta(PlaceResponseSerializer.Meta):
+        fields = PlaceResponseSerializer.Meta.fields + ('distance',)
+
+    def get_distance(self, obj):
+        """Distance in meters from the query point."""
+        return getattr(obj.distance, 'm', None)
+
+class PlaceTileRequestSerializer(serializers.Serializer):
+    z = serializers.IntegerField(min_value=0, max_value=22)
+    x = serializers.IntegerField(min_value=0)
+    y = serializers.IntegerField(min_value=0)
+    type = serializers.MultipleChoiceField(choices=Place.PlaceType.choices, required=False)
+    status = serializers.MultipleChoiceField(choices=Place.PlaceStatus.choices, required=False)
+
+    def validate(self, data):
+        """Check that x and y address a tile that exists at zoom z."""
+        size = 2 ** data['z']
+        if data['x'] >= size or data['y'] >= size:
+            raise serializers.ValidationError(f"x and y must be lower than {size} at zoom {data['z']}")
+        data['type'] = sorted(data.get('type', []))
+        data['status'] = sorted(data.get('status', []))
+        return data
+
+class ClustersRequestSerializer(serializers.Serializer):
+    min_lat = serializers.FloatField()
+    min_lng = serializers.FloatField()
+    max_lat = serializers.FloatField()
+    max_lng = serializers.FloatField()
+    zoom = serializers.IntegerField(min_value=0, max_value=22)
+    type = serializers.MultipleChoiceField(choices=Place.PlaceType.choices, required=False)
+    status = serializers.MultipleChoiceField(choices=Place.PlaceStatus.choices, required=False)
+
+    def validate(self, data):
+        data['type'] = sorted(data.get('type', []))
+        data['status'] = sorted(data.get('status', []))
+        return data
+
+class PlaceExportRequestSerializer(serializers.Serializer):
+    # Output format is negotiated by DRF from ?format= or the Accept header
+    name = serializers.CharField(required=False)
+    description = serializers.CharField(required=False)
+    address = serializers.CharField(required=False)
+    city = serializers.CharField(required=False)
+    state = serializers.CharField(required=False)
+    country = serializers.CharField(required=False)
+    postal_code = serializers.CharField(required=False)
+    q = serializers.CharField(required=False)
+    type = serializers.MultipleChoiceField(choices=Place.PlaceType.choices, required=False)
+    status = serializers.MultipleChoiceField(choices=Place.PlaceStatus.choices, required=False)
+    has_website = serializers.BooleanField(required=False, allow_null=True, default=None)
+    has_phone = serializers.BooleanField(required=False, allow_null=True, default=None)
+    has_email = serializers.BooleanField(required=False, allow_null=True, default=None)
+    created_at_after = serializers.DateTimeField(required=False)
+    created_at_before = serializers.DateTimeField(required=False)
+    updated_at_after = serializers.DateTimeField(required=False)
+    updated_at_before = serializers.DateTimeField(required=False)
+    min_lat = serializers.FloatField(required=False, min_value=-90, max_value=90)
+    min_lng = serializers.FloatField(required=False, min_value=-180, max_value=180)
+    max_lat = serializers.FloatField(required=False, min_value=-90, max_value=90)
+    max_lng = serializers.FloatField(required=False, min_value=-180, max_value=180)
+    chunk_size = serializers.IntegerField(required=False, min_value=100, max_value=10000, default=EXPORT_CHUNK_SIZE)
+
+    def validate(self, data):
+        """Require the bounding box to be given completely or not at all."""
+        bbox = [data.get(key) for key in BBOX_FIELDS]
+        if any(value is not None for value in bbox) and any(value is None for value in bbox):
+            raise serializers.ValidationError(f"Bounding box requires all of {', '.join(BBOX_FIELDS)}")
+        if 'type' in data:
+            data['type'] = sorted(data['type'])
+        if 'status' in data:
+            data['status'] = sorted(data['status'])
+        return data
+
+class PlaceClusterResponseSerializer(serializers.Serializer):
+    latitude = serializers.FloatField()
+    longitude = serializers.FloatField()
+    count = serializers.IntegerField()
+    types = serializers.DictField(child=serializers.IntegerField())  # Place count per PlaceType value
+    id = serializers.IntegerField(allow_null=True)  # Set when the cluster is a single place
+
 class PlaceGeoFeatureSerializer(GeoFeatureModelSerializer):
     type_display = serializers.CharField(source='get_type_display', read_only=True)
     status_display = serializers.CharField(source='get_status_display', read_only=True)
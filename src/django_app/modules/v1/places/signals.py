@@ -0,0 +1,13 @@
+# django_app/modules/v1/places/signals.py
+
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from .cache import PlaceCache
+from .models import Place
+
+# Writes that bypass PlaceRepository (admin, shell, other apps) still evict the cached row
+@receiver(post_save, sender=Place, dispatch_uid='places_cache_post_save')
+@receiver(post_delete, sender=Place, dispatch_uid='places_cache_post_delete')
+def invalidate_place_cache(sender, instance, **kwargs):
+    PlaceCache().invalidate([instance.pk])
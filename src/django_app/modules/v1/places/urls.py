@@ -1,5 +1,6 @@
 # django_app/modules/v1/places/urls.py
 
+from django.urls import re_path
 from rest_framework.routers import DefaultRouter
 
 from .api import PlaceViewSet
@@ -7,4 +8,7 @@ from .api import PlaceViewSet
 router = DefaultRouter()
 router.register(r'', PlaceViewSet,  basename='places')
 
-urlpatterns = router.urls
+urlpatterns = [
+    # Tile clients request /tiles/{z}/{x}/{y}.mvt without the router's trailing slash
+    re_path(r'^tiles/(?P<z>\d+)/(?P<x>\d+)/(?P<y>\d+)\.mvt$', PlaceViewSet.as_view({'get': 'tiles'}, **PlaceViewSet.tiles.kwargs), name='places-tiles'),
+] + router.urls
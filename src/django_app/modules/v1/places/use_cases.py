@@ -1,13 +1,14 @@
 # django_app/modules/v1/places/use_cases.py
 
 from dataclasses import dataclass, asdict
-from typing import Optional, List, Dict, Any
+from datetime import datetime
+from typing import Optional, List, Dict, Any, Iterator, Tuple
 from rest_framework.exceptions import NotFound
 
 from .seedwork.dto import ListInput, ListOutput
 
 from .models import Place
-from .repositories import PlaceRepository
+from .repositories import PlaceRepository, BULK_BATCH_SIZE, EXPORT_CHUNK_SIZE, GEOJSON_PRECISION
 from .seedwork.use_cases import UseCases
 
 @dataclass(slots=True, frozen=True)
@@ -20,13 +21,14 @@ class FindOneUseCase(UseCases):
         uuid: Optional[str] = None
         slug: Optional[str] = None
         name: Optional[str] = None
+        columns: Optional[Tuple[str, ...]] = None
 
     @dataclass(slots=True, frozen=True)
     class Output:
         place: Optional[Place]
 
     def execute(self, input_param: 'Input') -> 'Output':
-        place = self.repository.find_one(params=input_param)
+        place = self.repository.find_one(params=input_param, columns=input_param.columns)
         if place is None:
             raise NotFound(detail="Place not found.")
         return self.Output(place=place)
@@ -38,7 +40,7 @@ class FindAllUseCase(UseCases):
     class Input(ListInput[dict]):
         pass
 
-    class Output(ListOutput[Place]):
+    class Output(ListOutput[Dict[str, Any]]):
         pass
 
     def execute(self, input_param: 'Input') -> 'Output':
@@ -47,7 +49,13 @@ class FindAllUseCase(UseCases):
             per_page=input_param.per_page,
             sort=input_param.sort,
             sort_dir=input_param.sort_dir,
-            filters=input_param.filter
+            filters=input_param.filter,
+            pagination=input_param.pagination,
+            after=input_param.after,
+            before=input_param.before,
+            count=input_param.count,
+            assembly=input_param.assembly,
+            fields=input_param.fields
         )
         return self.Output(**list_data)
 
@@ -89,14 +97,16 @@ class CreateManyUseCase(UseCases):
     @dataclass(slots=True, frozen=True)
     class Input:
         places: List[dict]
+        batch_size: int = BULK_BATCH_SIZE
 
     @dataclass(slots=True, frozen=True)
     class Output:
         places: List[Place]
+        errors: List[Dict[str, Any]]
 
     def execute(self, input_param: 'Input') -> 'Output':
-        places = self.repository.create_many(data_list=input_param.places)
-        return self.Output(places=places)
+        result = self.repository.create_many(data_list=input_param.places, batch_size=input_param.batch_size)
+        return self.Output(places=result['places'], errors=result['errors'])
 
 @dataclass(slots=True, frozen=True)
 class UpdateOneUseCase(UseCases):
@@ -139,13 +149,14 @@ class UpdateManyUseCase(UseCases):
     @dataclass(slots=True, frozen=True)
     class Input:
         places: List[dict]
+        batch_size: int = BULK_BATCH_SIZE
 
     @dataclass(slots=True, frozen=True)
     class Output:
         places: List[Place]
 
     def execute(self, input_param: 'Input') -> 'Output':
-        places = self.repository.update_many(places_data=input_param.places)
+        places = self.repository.update_many(places_data=input_param.places, batch_size=input_param.batch_size)
         return self.Output(places=places)
 
 @dataclass(slots=True, frozen=True)
@@ -176,22 +187,45 @@ class RemoveManyUseCase(UseCases):
 class SearchUseCase(UseCases):
     repository: PlaceRepository
 
-    @dataclass(slots=True, frozen=True)
+    @dataclass(slots=True, kw_only=True)
     class Input(ListInput[dict]):
         query: str
-        field: str
+        field: Optional[str] = None
+        mode: str = 'contains'
 
-    class Output(ListOutput[Place]):
+    class Output(ListOutput[Dict[str, Any]]):
         pass
 
     def execute(self, input_param: 'Input') -> 'Output':
+        if input_param.mode == 'full_text':
+            list_data = self.repository.full_text_search(
+                query=input_param.query,
+                page=input_param.page,
+                per_page=input_param.per_page,
+                sort=input_param.sort,
+                sort_dir=input_param.sort_dir,
+                pagination=input_param.pagination,
+                after=input_param.after,
+                before=input_param.before,
+                count=input_param.count,
+                assembly=input_param.assembly,
+                fields=input_param.fields
+            )
+            return self.Output(**list_data)
+
         list_data = self.repository.search(
             query=input_param.query,
             field=input_param.field,
             page=input_param.page,
             per_page=input_param.per_page,
             sort=input_param.sort,
-            sort_dir=input_param.sort_dir
+            sort_dir=input_param.sort_dir,
+            pagination=input_param.pagination,
+            after=input_param.after,
+            before=input_param.before,
+            count=input_param.count,
+            assembly=input_param.assembly,
+            fields=input_param.fields
         )
         return self.Output(**list_data)
 
@@ -202,7 +236,7 @@ class FilterUseCase(UseCases):
     class Input(ListInput[dict]):
         pass
 
-    class Output(ListOutput[Place]):
+    class Output(ListOutput[Dict[str, Any]]):
         pass
 
     def execute(self, input_param: 'Input') -> 'Output':
@@ -211,7 +245,13 @@ class FilterUseCase(UseCases):
             page=input_param.page,
             per_page=input_param.per_page,
             sort=input_param.sort,
-            sort_dir=input_param.sort_dir
+            sort_dir=input_param.sort_dir,
+            pagination=input_param.pagination,
+            after=input_param.after,
+            before=input_param.before,
+            count=input_param.count,
+            assembly=input_param.assembly,
+            fields=input_param.fields
         )
         return self.Output(**list_data)
 
@@ -222,13 +262,14 @@ class FindByIdUseCase(UseCases):
     @dataclass(slots=True, frozen=True)
     class Input:
         id: int
+        columns: Optional[Tuple[str, ...]] = None
 
     @dataclass(slots=True, frozen=True)
     class Output:
         place: Place
 
     def execute(self, input_param: 'Input') -> 'Output':
-        place = self.repository.find_by_id(place_id=input_param.id)
+        place = self.repository.find_by_id(place_id=input_param.id, columns=input_param.columns)
         if place is None:
             raise NotFound(detail="Place not found.")
         return self.Output(place=place)
@@ -240,13 +281,14 @@ class FindByIdsUseCase(UseCases):
     @dataclass(slots=True, frozen=True)
     class Input:
         ids: List[int]
+        columns: Optional[Tuple[str, ...]] = None
 
     @dataclass(slots=True, frozen=True)
     class Output:
         places: List[Place]
 
     def execute(self, input_param: 'Input') -> 'Output':
-        places = self.repository.find_by_ids(place_ids=input_param.ids)
+        places = self.repository.find_by_ids(place_ids=input_param.ids, columns=input_param.columns)
         return self.Output(places=places)
 
 @dataclass(slots=True, frozen=True)
@@ -288,13 +330,13 @@ class ExistsByIdsUseCase(UseCases):
 class NearbyPlacesUseCase(UseCases):
     repository: PlaceRepository
 
-    @dataclass(slots=True, frozen=True)
+    @dataclass(slots=True, kw_only=True)
     class Input(ListInput[dict]):
         latitude: float
         longitude: float
         radius: float = 5000  # Default 5km radius
 
-    class Output(ListOutput[Place]):
+    class Output(ListOutput[Dict[str, Any]]):
         pass
 
     def execute(self, input_param: 'Input') -> 'Output':
@@ -305,7 +347,13 @@ class NearbyPlacesUseCase(UseCases):
             page=input_param.page,
             per_page=input_param.per_page,
             sort=input_param.sort,
-            sort_dir=input_param.sort_dir
+            sort_dir=input_param.sort_dir,
+            pagination=input_param.pagination,
+            after=input_param.after,
+            before=input_param.before,
+            count=input_param.count,
+            assembly=input_param.assembly,
+            fields=input_param.fields
         )
         return self.Output(**list_data)
 
@@ -313,14 +361,14 @@ class NearbyPlacesUseCase(UseCases):
 class WithinBoxUseCase(UseCases):
     repository: PlaceRepository
 
-    @dataclass(slots=True, frozen=True)
+    @dataclass(slots=True, kw_only=True)
     class Input(ListInput[dict]):
         min_lat: float
         min_lng: float
         max_lat: float
         max_lng: float
 
-    class Output(ListOutput[Place]):
+    class Output(ListOutput[Dict[str, Any]]):
         pass
 
     def execute(self, input_param: 'Input') -> 'Output':
@@ -332,6 +380,227 @@ class WithinBoxUseCase(UseCases):
             page=input_param.page,
             per_page=input_param.per_page,
             sort=input_param.sort,
-            sort_dir=input_param.sort_dir
+            sort_dir=input_param.sort_dir,
+            pagination=input_param.pagination,
+            after=input_param.after,
+            before=input_param.before,
+            count=input_param.count,
+            assembly=input_param.assembly,
+            fields=input_param.fields
+        )
+        return self.Output(**list_data)
+
+@dataclass(slots=True, frozen=True)
+class KNearestUseCase(UseCases):
+    repository: PlaceRepository
+
+    @dataclass(slots=True, frozen=True)
+    class Input:
+        latitude: float
+        longitude: float
+        k: int = 10
+        max_distance: Optional[float] = None
+        type: Optional[int] = None
+        status: Optional[int] = None
+
+    @dataclass(slots=True, frozen=True)
+    class Output:
+        places: List[Place]
+
+    def execute(self, input_param: 'Input') -> 'Output':
+        places = self.repository.g_k_nearest(
+            latitude=input_param.latitude,
+            longitude=input_param.longitude,
+            k=input_param.k,
+            max_distance=input_param.max_distance,
+            filters={'type': input_param.type, 'status': input_param.status}
+        )
+        return self.Output(places=places)
+
+@dataclass(slots=True, frozen=True)
+class TileUseCase(UseCases):
+    repository: PlaceRepository
+
+    @dataclass(slots=True, frozen=True)
+    class Input:
+        z: int
+        x: int
+        y: int
+        type: Optional[List[int]] = None
+        status: Optional[List[int]] = None
+
+    @dataclass(slots=True, frozen=True)
+    class Output:
+        tile: bytes
+
+    def execute(self, input_param: 'Input') -> 'Output':
+        filters = {key: value for key, value in (('type', input_param.type), ('status', input_param.status)) if value}
+        tile = self.repository.g_tile(z=input_param.z, x=input_param.x, y=input_param.y, filters=filters)
+        return self.Output(tile=tile)
+
+@dataclass(slots=True, frozen=True)
+class ClustersUseCase(UseCases):
+    repository: PlaceRepository
+
+    @dataclass(slots=True, frozen=True)
+    class Input:
+        min_lat: float
+        min_lng: float
+        max_lat: float
+        max_lng: float
+        zoom: int
+        type: Optional[List[int]] = None
+        status: Optional[List[int]] = None
+
+    @dataclass(slots=True, frozen=True)
+    class Output:
+        clusters: List[Dict[str, Any]]
+
+    def execute(self, input_param: 'Input') -> 'Output':
+        filters = {key: value for key, value in (('type', input_param.type), ('status', input_param.status)) if value}
+        clusters = self.repository.g_cluster(
+            min_lat=input_param.min_lat,
+            min_lng=input_param.min_lng,
+            max_lat=input_param.max_lat,
+            max_lng=input_param.max_lng,
+            zoom=input_param.zoom,
+            filters=filters
+        )
+        return self.Output(clusters=clusters)
+
+@dataclass(slots=True, frozen=True)
+class ExportUseCase(UseCases):
+    repository: PlaceRepository
+
+    @dataclass(slots=True, frozen=True)
+    class Input:
+        name: Optional[str] = None
+        description: Optional[str] = None
+        address: Optional[str] = None
+        city: Optional[str] = None
+        state: Optional[str] = None
+        country: Optional[str] = None
+        postal_code: Optional[str] = None
+        q: Optional[str] = None
+        type: Optional[List[int]] = None
+        status: Optional[List[int]] = None
+        has_website: Optional[bool] = None
+        has_phone: Optional[bool] = None
+        has_email: Optional[bool] = None
+        created_at_after: Optional[datetime] = None
+        created_at_before: Optional[datetime] = None
+        updated_at_after: Optional[datetime] = None
+        updated_at_before: Optional[datetime] = None
+        min_lat: Optional[float] = None
+        min_lng: Optional[float] = None
+        max_lat: Optional[float] = None
+        max_lng: Optional[float] = None
+        chunk_size: int = EXPORT_CHUNK_SIZE
+
+    @dataclass(slots=True, frozen=True)
+    class Output:
+        rows: Iterator[Dict[str, Any]]
+
+    def execute(self, input_param: 'Input') -> 'Output':
+        # Everything except the bbox and chunk size is a PlaceFilter criterion
+        excluded = ('min_lat', 'min_lng', 'max_lat', 'max_lng', 'chunk_size')
+        filters = {
+            key: value for key, value in asdict(input_param).items()
+            if key not in excluded and value not in (None, [])
+        }
+        bbox = None
+        if input_param.min_lat is not None:
+            bbox = (input_param.min_lat, input_param.min_lng, input_param.max_lat, input_param.max_lng)
+        rows = self.repository.export(filters=filters, bbox=bbox, chunk_size=input_param.chunk_size)
+        return self.Output(rows=rows)
+
+@dataclass(slots=True, frozen=True)
+class FilterFeaturesUseCase(UseCases):
+    repository: PlaceRepository
+
+    @dataclass(slots=True, frozen=True)
+    class Input:
+        uuid: Optional[str] = None
+        name: Optional[str] = None
+        slug: Optional[str] = None
+        city: Optional[str] = None
+        state: Optional[str] = None
+        country: Optional[str] = None
+        type: Optional[int] = None
+        status: Optional[int] = None
+        sort: str = 'id'
+        sort_dir: str = 'asc'
+        precision: int = GEOJSON_PRECISION
+
+    @dataclass(slots=True, frozen=True)
+    class Output:
+        rows: Iterator[Dict[str, Any]]
+
+    def execute(self, input_param: 'Input') -> 'Output':
+        excluded = ('sort', 'sort_dir', 'precision')
+        filters = {key: value for key, value in asdict(input_param).items() if key not in excluded and value is not None}
+        rows = self.repository.filter_features(
+            filters=filters,
+            sort=input_param.sort,
+            sort_dir=input_param.sort_dir,
+            precision=input_param.precision
+        )
+        return self.Output(rows=rows)
+
+@dataclass(slots=True, frozen=True)
+class NearbyFeaturesUseCase(UseCases):
+    repository: PlaceRepository
+
+    @dataclass(slots=True, frozen=True)
+    class Input:
+        latitude: float
+        longitude: float
+        radius: float = 5000
+        sort: str = 'id'
+        sort_dir: str = 'asc'
+        precision: int = GEOJSON_PRECISION
+
+    @dataclass(slots=True, frozen=True)
+    class Output:
+        rows: Iterator[Dict[str, Any]]
+
+    def execute(self, input_param: 'Input') -> 'Output':
+        rows = self.repository.g_near_features(
+            latitude=input_param.latitude,
+            longitude=input_param.longitude,
+            radius=input_param.radius,
+            sort=input_param.sort,
+            sort_dir=input_param.sort_dir,
+            precision=input_param.precision
+        )
+        return self.Output(rows=rows)
+
+@dataclass(slots=True, frozen=True)
+class WithinBoxFeaturesUseCase(UseCases):
+    repository: PlaceRepository
+
+    @dataclass(slots=True, frozen=True)
+    class Input:
+        min_lat: float
+        min_lng: float
+        max_lat: float
+        max_lng: float
+        sort: str = 'id'
+        sort_dir: str = 'asc'
+        precision: int = GEOJSON_PRECISION
+
+    @dataclass(slots=True, frozen=True)
+    class Output:
+        rows: Iterator[Dict[str, Any]]
+
+    def execute(self, input_param: 'Input') -> 'Output':
+        rows = self.repository.g_within_box_features(
+            min_lat=input_param.min_lat,
+            min_lng=input_param.min_lng,
+            max_lat=input_param.max_lat,
+            max_lng=input_param.max_lng,
+            sort=input_param.sort,
+            sort_dir=input_param.sort_dir,
+            precision=input_param.precision
         )
-        return self.Output(**list_data)
\ No newline at end of file
+        return self.Output(rows=rows)
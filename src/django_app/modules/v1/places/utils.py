@@ -1,8 +1,63 @@
 # django_app/modules/v1/places/utils.py
 
+import base64
+import datetime
+import json
+
 from django.contrib.gis.geos import Point, Polygon, LineString, MultiPolygon, GEOSGeometry
 from django.contrib.gis.measure import D
+from django.db.models import F, FloatField, Func
+
+
+def json_default(value):
+    """JSON fallback for datetimes (full precision ISO 8601), UUIDs and decimals."""
+    if isinstance(value, (datetime.datetime, datetime.date)):
+        return value.isoformat()
+    return str(value)
+
+
+def datetime_representation(value):
+    """A datetime as DRF's DateTimeField writes it: ISO 8601 in UTC with a Z suffix, microseconds only when set."""
+    value = value.astimezone(datetime.timezone.utc).isoformat()
+    return value[:-6] + 'Z' if value.endswith('+00:00') else value
 
 
 class GeoUtils:
-    pass
\ No newline at end of file
+    @staticmethod
+    def longitude(field='location'):
+        """ST_X of a geography column, computed in the database."""
+        return Func(F(field), function='ST_X', template='%(function)s(%(expressions)s::geometry)', output_field=FloatField())
+
+    @staticmethod
+    def latitude(field='location'):
+        """ST_Y of a geography column, computed in the database."""
+        return Func(F(field), function='ST_Y', template='%(function)s(%(expressions)s::geometry)', output_field=FloatField())
+
+
+class CursorUtils:
+    """Opaque keyset cursors: the sort key value plus the row id of a page boundary."""
+
+    @staticmethod
+    def encode(sort, sort_dir, value, pk):
+        # Full precision datetimes so the boundary row compares equal on the way back in
+        payload = json.dumps({'s': sort, 'd': sort_dir, 'v': value, 'id': pk}, default=json_default, separators=(',', ':'))
+        return base64.urlsafe_b64encode(payload.encode()).decode().rstrip('=')
+
+    @staticmethod
+    def decode(cursor, sort, sort_dir):
+        """Decode a cursor, raising ValueError if it is malformed or was issued for another ordering."""
+        try:
+            padded = cursor + '=' * (-len(cursor) % 4)
+            payload = json.loads(base64.urlsafe_b64decode(padded.encode()))
+            value, pk = payload['v'], int(payload['id'])
+        except (ValueError, TypeError, KeyError) as e:
+            raise ValueError('Invalid cursor.') from e
+        if payload.get('s') != sort or payload.get('d') != sort_dir:
+            raise ValueError('Cursor does not match the requested sort.')
+        return value, pk
+
+    @staticmethod
+    def sort_value(obj, sort):
+        """Read the sort key of a row (dict or instance), unwrapping Distance annotations to meters."""
+        value = obj[sort] if isinstance(obj, dict) else getattr(obj, sort)
+        return getattr(value, 'm', value)
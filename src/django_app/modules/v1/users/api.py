@@ -9,12 +9,15 @@ from rest_framework.serializers import Serializer
 from rest_framework.permissions import IsAuthenticated
 from dependency_injector.wiring import inject, Provide
 from django_app.container import container 
+from django_app.__shared.conditional import ConditionalUtils
+from django_app.__shared.projection import ProjectionUtils
 from .serializers import (
     PaginationRequestSerializer,
     PaginationResponseSerializer,
     UserCreateRequestSerializer,
     UserCreateResponseSerializer,
     UserExistsResponseSerializer,
+    UserFieldsRequestSerializer,
     UserFilterRequestSerializer,
     UserResponseSerializer,
     UserSearchRequestSerializer,
@@ -58,11 +61,10 @@ class UserViewSet(viewsets.ModelViewSet):
     @action(detail=False, methods=['get'], permission_classes=[IsAuthenticated])
     @inject
     def find_all(self, request, find_all_use_case: FindAllUseCase = Provide[container.users.find_all_use_case]):
-        validated_data = self._validated_data(PaginationRequestSerializer, request.query_params)
+        validated_data = self._projected(self._validated_data(PaginationRequestSerializer, request.query_params))
         input_param = find_all_use_case.Input(**validated_data)
         output = find_all_use_case.execute(input_param)
-        data = self._to_response(PaginationResponseSerializer, output)
-        return Response(data, status=status.HTTP_200_OK)
+        return self._list_response(request, output)
 
     @action(detail=False, methods=["post"], permission_classes=[IsAuthenticated])
     @inject
@@ -119,29 +121,31 @@ class UserViewSet(viewsets.ModelViewSet):
     @action(detail=False, methods=["get"], permission_classes=[IsAuthenticated])
     @inject
     def search(self, request, search_use_case: SearchUseCase = Provide[container.users.search_use_case]):
-        validated_data = self._validated_data(UserSearchRequestSerializer, request.query_params)
+        validated_data = self._projected(self._validated_data(UserSearchRequestSerializer, request.query_params))
         input_data = search_use_case.Input(**validated_data)
         output = search_use_case.execute(input_data)
-        data = self._to_response(PaginationResponseSerializer, output)
-        return Response(data, status=status.HTTP_200_OK)
+        return self._list_response(request, output)
 
     @action(detail=False, methods=["get"], permission_classes=[IsAuthenticated])
     @inject
     def filter(self, request, filter_use_case: FilterUseCase = Provide[container.users.filter_use_case]):
-        validated_data = self._validated_data(UserFilterRequestSerializer, request.query_params)
+        validated_data = self._projected(self._validated_data(UserFilterRequestSerializer, request.query_params))
         input_data = filter_use_case.Input(**validated_data)
         output = filter_use_case.execute(input_data)
-        data = self._to_response(PaginationResponseSerializer, output)
-        return Response(data, status=status.HTTP_200_OK)
+        return self._list_response(request, output)
 
     @action(detail=False, methods=["get"], permission_classes=[IsAuthenticated])
     @inject
     def find_by_id(self, request, find_by_id_use_case: FindByIdUseCase = Provide[container.users.find_by_id_use_case]):
         validated_data = self._validated_data(UserIdSerializer, request.query_params)
-        input_data = find_by_id_use_case.Input(**validated_data)
+        fields = self._validated_data(UserFieldsRequestSerializer, request.query_params).get('fields')
+        columns = ProjectionUtils.columns(UserResponseSerializer, fields)
+        if columns:
+            # The validators are read even when they are not rendered
+            columns = (*columns, 'updated_at', 'last_login')
+        input_data = find_by_id_use_case.Input(**validated_data, columns=columns)
         output = find_by_id_use_case.execute(input_data)
-        data = self._to_response(UserResponseSerializer, output)
-        return Response(data, status=status.HTTP_200_OK)
+        return self._user_response(request, output.user, fields=fields)
 
     @action(detail=False, methods=["get"], permission_classes=[IsAuthenticated])
     @inject
@@ -178,6 +182,35 @@ class UserViewSet(viewsets.ModelViewSet):
         data = UserViewSet._to_response(output_serializer, output, **kwargs)
         return Response(data, status=status_code)
     
+    def _user_response(self, request, user, fields=None) -> Response:
+        """Serialize one user, or answer 304 if the client's copy is still current."""
+        last_modified = max(user.updated_at, user.last_login or user.updated_at)
+        etag = ConditionalUtils.etag('user', user.id, last_modified, fields, request.accepted_renderer.media_type)
+        not_modified = ConditionalUtils.not_modified(request, etag, last_modified)
+        if not_modified is not None:
+            return not_modified
+        data = self._to_response(UserResponseSerializer, user, fields=fields)
+        return ConditionalUtils.with_validators(Response(data, status=status.HTTP_200_OK), etag, last_modified)
+
+    def _list_response(self, request, output) -> Response:
+        validators = output.validators
+        if validators is None:
+            return Response(self._to_response(PaginationResponseSerializer, output), status=status.HTTP_200_OK)
+
+        # The query string covers page, sort, fields and filters; the validators cover the data
+        etag = ConditionalUtils.etag('users', validators['last_modified'], validators['count'], request.get_full_path(), request.accepted_renderer.media_type)
+        not_modified = ConditionalUtils.not_modified(request, etag, validators['last_modified'])
+        if not_modified is not None:
+            return not_modified
+        data = self._to_response(PaginationResponseSerializer, output)
+        return ConditionalUtils.with_validators(Response(data, status=status.HTTP_200_OK), etag, validators['last_modified'])
+
+    @staticmethod
+    def _projected(validated_data: dict[str, Any]) -> dict[str, Any]:
+        # ?fields= narrows the columns read for list items; without it every response field is read
+        validated_data['columns'] = ProjectionUtils.columns(UserResponseSerializer, validated_data.pop('fields', None))
+        return validated_data
+
     @staticmethod
     def _validated_data(serializer_class: Type[Serializer], data: dict[str, Any] | List[dict[str, Any]] | Any, **kwargs) -> Any:
         serializer = serializer_class(data=data, **kwargs)
@@ -9,6 +9,7 @@ class UsersConfig(AppConfig):
     verbose_name = 'Users'
 
     def ready(self):
+        from . import signals  # noqa: F401
         from django_app.container import container
         container.wire(modules=[
             'django_app.modules.v1.users.api',
@@ -0,0 +1,109 @@
+# django_app/modules/v1/users/cache.py
+
+import pickle
+import time
+import uuid
+from typing import Dict, Iterable, Optional, Tuple
+
+from django.conf import settings
+from django.core.cache import caches
+from django.db import transaction
+
+from django_app.__shared.cache import CacheUtils
+
+from .models import User
+
+# Seconds a resolved user stays in the shared cache; any change to the user retires it earlier. 0 disables
+# the cache, and so does a per-process backend (LocMem), where a change could not reach the other workers
+USER_CACHE_TIMEOUT = getattr(settings, 'USER_CACHE_TIMEOUT', 60)
+# Seconds a worker reuses a user without asking the shared cache, which bounds how long
+# another process may see a change late. 0 disables the per-process level
+USER_CACHE_LOCAL_TIMEOUT = getattr(settings, 'USER_CACHE_LOCAL_TIMEOUT', 5)
+USER_CACHE_ALIAS = getattr(settings, 'USER_CACHE_ALIAS', 'default')
+# Bump when the cached entry layout changes so old entries are never read
+USER_CACHE_PREFIX = 'users:v1'
+# Per-process entries kept before the local level is emptied
+LOCAL_MAX_ENTRIES = 10000
+
+class UserCache:
+    """Two-level cache of the users that authentication resolves from tokens.
+
+    Every user has a version: a random token replaced whenever the user, its groups or its
+    permissions change. Shared entries are pickled users tagged with the version seen before
+    they were loaded, and are only served while that is still the current version, so a
+    change never has to find and delete the entries it makes stale. A per-process level
+    skips the shared round trip for USER_CACHE_LOCAL_TIMEOUT seconds.
+
+    Only enabled on a backend every worker shares, otherwise a password change, deactivation
+    or permission change would only reach the worker that made it.
+    """
+
+    # str(user id) -> (monotonic expiry, pickled user); token claims carry the id as a string
+    _local: Dict[str, Tuple[float, bytes]] = {}
+
+    def __init__(self, alias=USER_CACHE_ALIAS, timeout=USER_CACHE_TIMEOUT, local_timeout=USER_CACHE_LOCAL_TIMEOUT):
+        self.alias = alias
+        self.timeout = timeout
+        self.local_timeout = local_timeout
+
+    @property
+    def enabled(self):
+        return self.timeout != 0 and CacheUtils.is_shared(self.alias)
+
+    @property
+    def backend(self):
+        return caches[self.alias]
+
+    def lookup(self, user_id) -> Tuple[Optional[User], Optional[str]]:
+        """Return (user, None) on a hit, or (None, version) to tag the user loaded on a miss."""
+        if not self.enabled:
+            return None, None
+        local = self._local.get(str(user_id))
+        if local is not None and local[0] > time.monotonic():
+            return pickle.loads(local[1]), None
+
+        version_key, entry_key = self._key('version', user_id), self._key('user', user_id)
+        values = self.backend.get_many([version_key, entry_key])
+        version, entry = values.get(version_key), values.get(entry_key)
+        if version is not None and entry is not None and entry[0] == version:
+            self._remember(user_id, entry[1])
+            return pickle.loads(entry[1]), None
+
+        if version is None:
+            # First sight of this user, or its version was evicted: start a new one
+            version = uuid.uuid4().hex
+            if not self.backend.add(version_key, version, timeout=None):
+                version = self.backend.get(version_key)
+        return None, version
+
+    def store(self, user: User, version: Optional[str]) -> None:
+        """Cache a user loaded from the database under the version returned by lookup()."""
+        if not self.enabled or version is None:
+            return
+        data = pickle.dumps(user, pickle.HIGHEST_PROTOCOL)
+        self.backend.set(self._key('user', user.pk), (version, data), timeout=self.timeout)
+        self._remember(user.pk, data)
+
+    def bump(self, user_ids: Iterable[int]) -> None:
+        """Retire the cached entries of these users once the current transaction commits."""
+        user_ids = list(user_ids)
+        if not self.enabled or not user_ids:
+            return
+
+        def retire():
+            self.backend.set_many({self._key('version', user_id): uuid.uuid4().hex for user_id in user_ids}, timeout=None)
+            for user_id in user_ids:
+                self._local.pop(str(user_id), None)
+
+        transaction.on_commit(retire)
+
+    def _remember(self, user_id, data):
+        if not self.local_timeout:
+            return
+        if len(self._local) >= LOCAL_MAX_ENTRIES:
+            self._local.clear()
+        self._local[str(user_id)] = (time.monotonic() + self.local_timeout, data)
+
+    @staticmethod
+    def _key(kind, user_id):
+        return f'{USER_CACHE_PREFIX}:{kind}:{user_id}'
@@ -0,0 +1,66 @@
+# django_app/modules/v1/users/management/commands/benchmark_hashing.py
+
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from django.contrib.auth import hashers
+from django.core.management.base import BaseCommand
+from django_app.modules.v1.users.services import PASSWORD_HASHING_WORKERS, PasswordHashingService
+
+class Command(BaseCommand):
+    help = 'Compares inline and pooled password hashing: password checks per second (the cost of a login) and bulk hashing'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--logins',
+            type=int,
+            default=200,
+            help='Password checks per run',
+        )
+        parser.add_argument(
+            '--threads',
+            type=int,
+            nargs='+',
+            default=[1, 4],
+            help='Request threads per worker to simulate (one run per value)',
+        )
+        parser.add_argument(
+            '--workers',
+            type=int,
+            default=PASSWORD_HASHING_WORKERS or os.cpu_count() or 1,
+            help='Hashing pool processes (default: PASSWORD_HASHING_WORKERS, or one per CPU when that is 0)',
+        )
+
+    def _rate(self, threads, count, func):
+        started = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=threads) as executor:
+            list(executor.map(lambda _: func(), range(count)))
+        return count / (time.perf_counter() - started)
+
+    def handle(self, *args, **options):
+        logins = options['logins']
+        service = PasswordHashingService(workers=options['workers'])
+        password = 'User@123'
+        encoded = hashers.make_password(password)
+        # Start the pool outside the timed runs
+        service.hash_many([password] * service.workers)
+
+        self.stdout.write(f"{hashers.identify_hasher(encoded).algorithm}, {logins} checks per run, pool of {service.workers} processes")
+        for threads in options['threads']:
+            inline = self._rate(threads, logins, lambda: hashers.check_password(password, encoded))
+            pooled = self._rate(threads, logins, lambda: service.verify(password, encoded)[0])
+            self.stdout.write(
+                f"logins  {threads:>2} threads   inline {inline:8.1f}/s   pooled {pooled:8.1f}/s   {pooled / inline:5.1f}x"
+            )
+
+        started = time.perf_counter()
+        for _ in range(logins):
+            hashers.make_password(password)
+        inline = logins / (time.perf_counter() - started)
+        started = time.perf_counter()
+        service.hash_many([password] * logins)
+        pooled = logins / (time.perf_counter() - started)
+        self.stdout.write(f"bulk hash             inline {inline:8.1f}/s   pooled {pooled:8.1f}/s   {pooled / inline:5.1f}x")
+        if service.workers:
+            service.executor.shutdown()
@@ -1,17 +1,24 @@
 # django_app/modules/v1/users/management/commands/seed_users.py
 
 import random
+import time
+from itertools import chain, islice
 from faker import Faker
 
 from django.core.management.base import BaseCommand
 from django.db import transaction
+from django.utils.text import slugify
 from django_app.modules.v1.users.repositories import UserRepository
+from django_app.modules.v1.users.services import password_hashing
 
 from allauth.account.models import EmailAddress
 from django.contrib.auth import get_user_model
 
 User = get_user_model()
 
+# Distinct first and last names drawn from Faker for bulk seeding
+FAKER_POOL_SIZE = 1000
+
 class Command(BaseCommand):
     help = 'Seeds the database with initial user data'
 
@@ -28,6 +35,17 @@ class Command(BaseCommand):
             default=10,
             help='Number of users to create (only in development mode)',
         )
+        parser.add_argument(
+            '--bulk',
+            action='store_true',
+            help='Fast development seeding: shared password hash, bulk inserts, no per-user output',
+        )
+        parser.add_argument(
+            '--chunk-size',
+            type=int,
+            default=5000,
+            help='Users inserted per transaction in bulk mode',
+        )
 
     def _generate_random_password(self, length=12):
         chars = 'abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789!@#$%^&*()'
@@ -84,30 +102,91 @@ class Command(BaseCommand):
 
         if users_to_create:
             with transaction.atomic():
-                created_users = []
-                for user_data in users_to_create:
-                    user = user_repo.create_one(
-                        username=user_data['username'],
-                        email=user_data['email'],
-                        password=user_data['password'],
-                        first_name=user_data['first_name'],
-                        last_name=user_data['last_name'],
-                    )
-                    user.is_staff = user_data.get('is_staff', False)
-                    user.is_superuser = user_data.get('is_superuser', False)
-                    user.save()
-                    created_users.append(user)
-
-                    EmailAddress.objects.create(
-                        user=user,
-                        email=user.email,
-                        verified=True,
-                        primary=True,
-                    )
-                    self.stdout.write(self.style.SUCCESS(f"Created user: {user.username}"))
+                # One create_many call hashes every password, in parallel when the hashing pool is on
+                created_users = user_repo.create_many(users_to_create)
+                EmailAddress.objects.bulk_create([
+                    EmailAddress(user=user, email=user.email, verified=True, primary=True)
+                    for user in created_users
+                ])
+            for user in created_users:
+                self.stdout.write(self.style.SUCCESS(f"Created user: {user.username}"))
         else:
             self.stdout.write(self.style.WARNING("No new users to create. All already exist."))
 
+    def _unique_users(self, fake, count, taken):
+        """Yield fake users whose usernames are unique among themselves and `taken`, without a query.
+
+        Names come from pools drawn from Faker once, since per-user Faker calls dominate at scale;
+        repeated usernames get a numeric suffix and emails are derived from the username.
+        """
+        first_names = [fake.first_name() for _ in range(FAKER_POOL_SIZE)]
+        last_names = [fake.last_name() for _ in range(FAKER_POOL_SIZE)]
+        domains = [fake.free_email_domain() for _ in range(10)]
+        # Next suffix to try per base name, so repeated names do not rescan from 2 each time
+        suffixes = {}
+        for _ in range(count):
+            first_name, last_name = random.choice(first_names), random.choice(last_names)
+            base = slugify(f"{first_name}{last_name}")[:140] or 'user'
+            username = base
+            while username in taken:
+                suffixes[base] = suffixes.get(base, 1) + 1
+                username = f"{base}{suffixes[base]}"
+            taken.add(username)
+
+            yield {
+                'username': username,
+                'email': f"{username}@{random.choice(domains)}",
+                'password': 'User@123',
+                'first_name': first_name,
+                'last_name': last_name,
+                'is_staff': False,
+                'is_superuser': False,
+            }
+
+    def _seed_development_bulk(self, count, chunk_size):
+        user_repo = UserRepository()
+        fake = Faker()
+        hashes = {}
+
+        def hashed(password):
+            # One PBKDF2 run per distinct password instead of one per user
+            if password not in hashes:
+                hashes[password] = password_hashing.hash(password)
+            return hashes[password]
+
+        fixed_users = [self._create_admin_user(), self._create_test_user()]
+        taken = {user['username'] for user in fixed_users}
+        users_data = chain(fixed_users, self._unique_users(fake, count, taken))
+
+        created = 0
+        started = time.monotonic()
+        while True:
+            chunk = list(islice(users_data, chunk_size))
+            if not chunk:
+                break
+
+            with transaction.atomic():
+                existing_usernames = set(
+                    User.objects.filter(username__in=[u['username'] for u in chunk]).values_list('username', flat=True)
+                )
+                rows = [
+                    {**user_data, 'password': hashed(user_data['password'])}
+                    for user_data in chunk
+                    if user_data['username'] not in existing_usernames
+                ]
+                users = user_repo.create_many(rows, passwords_hashed=True)
+                EmailAddress.objects.bulk_create([
+                    EmailAddress(user=user, email=user.email, verified=True, primary=True)
+                    for user in users
+                ])
+
+            created += len(users)
+            rate = created / max(time.monotonic() - started, 1e-6)
+            self.stdout.write(f"Created {created} users ({rate:,.0f} users/s)")
+
+        if not created:
+            self.stdout.write(self.style.WARNING("No new users to create. All already exist."))
+
     def _seed_production(self):
         user_repo = UserRepository()
         admin_data = self._create_admin_user()
@@ -138,10 +217,13 @@ class Command(BaseCommand):
     def handle(self, *args, **options):
         mode = options['mode']
         count = options['count']
+        bulk = options['bulk']
 
         self.stdout.write(self.style.SUCCESS(f"Starting user seeding in {mode} mode"))
 
-        if mode == 'development':
+        if mode == 'development' and bulk:
+            self._seed_development_bulk(count, options['chunk_size'])
+        elif mode == 'development':
             self._seed_development(count)
         elif mode == 'production':
             self._seed_production()
@@ -0,0 +1,40 @@
+# Generated by Django 5.2 on 2026-10-18 12:00
+
+from django.db import migrations
+
+# Columns searched with icontains (UserFilter, UserRepository.search). Django compiles that
+# to UPPER(col) LIKE UPPER(%s), so the trigram indexes are built on UPPER(col).
+TRIGRAM_SEARCH_FIELDS = ('username', 'email', 'first_name', 'last_name')
+
+
+def create_trigram_indexes(apps, schema_editor):
+    # pg_trgm is Postgres only; SQLite development databases keep plain scans
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    table = apps.get_model('users', 'User')._meta.db_table
+    schema_editor.execute('CREATE EXTENSION IF NOT EXISTS pg_trgm')
+    for field in TRIGRAM_SEARCH_FIELDS:
+        schema_editor.execute(
+            f'CREATE INDEX CONCURRENTLY IF NOT EXISTS users_{field}_trgm '
+            f'ON {schema_editor.quote_name(table)} USING gin (UPPER({schema_editor.quote_name(field)}) gin_trgm_ops)'
+        )
+
+
+def drop_trigram_indexes(apps, schema_editor):
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    for field in TRIGRAM_SEARCH_FIELDS:
+        schema_editor.execute(f'DROP INDEX CONCURRENTLY IF EXISTS users_{field}_trgm')
+
+
+class Migration(migrations.Migration):
+    # CREATE INDEX CONCURRENTLY cannot run inside a transaction
+    atomic = False
+
+    dependencies = [
+        ('users', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.RunPython(create_trigram_indexes, drop_trigram_indexes),
+    ]
@@ -6,6 +6,8 @@ from django.contrib.auth.models import AbstractUser
 
 class User(AbstractUser):
     uuid = models.UUIDField(unique=True, default=uuid.uuid4, editable=False)
+    # Bumped on every save(); bulk writes stamp it explicitly. Drives ETag/Last-Modified
+    updated_at = models.DateTimeField(auto_now=True)
     
     groups = models.ManyToManyField(
         'auth.Group',
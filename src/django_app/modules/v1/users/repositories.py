@@ -1,14 +1,31 @@
 # django_app/modules/v1/users/repositories.py
 
+from collections import defaultdict
 from dataclasses import asdict
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, Sequence
 
 from django.core.paginator import Paginator, EmptyPage, PageNotAnInteger
+from django.db import transaction
 from django.db.models import QuerySet
+from django.db.models.functions import Coalesce, Greatest
+from django.utils import timezone
 
+from django_app.__shared.conditional import ConditionalUtils
+from django_app.__shared.pagination import CountUtils
+from django_app.__shared.search import SearchUtils
+
+from .cache import UserCache
 from .filters import UserFilter
 from .models import User
 from .seedwork.repositories import Repositories
+from .services import password_hashing
+
+# Rows per UPDATE statement in update_many
+BULK_BATCH_SIZE = 1000
+# Fields update_many may write
+UPDATABLE_FIELDS = ('username', 'email', 'first_name', 'last_name')
+# When a user's representation last changed: any save() bumps updated_at, logins only last_login
+LAST_MODIFIED = Greatest('updated_at', Coalesce('last_login', 'updated_at'))
 
 # find_one, find_all, create_one, create_many, update_one, update_many, remove_one, remove_many, search, filter, find_by_id, find_by_ids, exists_by_id, exists_by_ids
 
@@ -20,12 +37,12 @@ class UserRepository(Repositories):
         except User.DoesNotExist: # pylint: disable=no-member
             return None
 
-    def find_all(self, page: Optional[int] = None, per_page: Optional[int] = None, sort: Optional[str] = None, sort_dir: Optional[str] = None, filters: Optional[dict] = None) -> Dict:
+    def find_all(self, page: Optional[int] = None, per_page: Optional[int] = None, sort: Optional[str] = None, sort_dir: Optional[str] = None, filters: Optional[dict] = None, count: Optional[str] = None, columns: Optional[Sequence[str]] = None) -> Dict:
         queryset = User.objects.all()
         ordering = UserRepository._build_ordering(sort, sort_dir)
         if ordering:
             queryset = queryset.order_by(ordering)
-        return self._paginate_queryset(queryset, page, per_page)
+        return self._paginate_queryset(queryset, page, per_page, count, columns)
 
     def create_one(self, username, email, password, first_name, last_name) -> User:
         user = User.objects.create_user(
@@ -37,8 +54,13 @@ class UserRepository(Repositories):
         )
         return user
 
-    def create_many(self, users_data: List[dict]) -> List[User]:
+    def create_many(self, users_data: List[dict], passwords_hashed: bool = False) -> List[User]:
         users = [User(**data) for data in users_data]
+        if not passwords_hashed:
+            # bulk_create skips set_password, so hash the raw passwords here (in parallel when the pool is on).
+            # A missing password becomes unusable rather than the hash of ''
+            for user, password in zip(users, password_hashing.hash_many(user.password or None for user in users)):
+                user.password = password
         return User.objects.bulk_create(users)
 
     def update_one(self, id: int, username: Optional[str] = None, email: Optional[str] = None, first_name: Optional[str] = None, last_name: Optional[str] = None) -> Optional[User]:
@@ -57,20 +79,35 @@ class UserRepository(Repositories):
         except User.DoesNotExist: # pylint: disable=no-member
             return None
 
-    def update_many(self, users_data: List[dict]) -> List[User]:
-        updated_users = []
+    def update_many(self, users_data: List[dict], batch_size: int = BULK_BATCH_SIZE) -> List[User]:
+        changes: Dict[int, dict] = {}
         for data in users_data:
-            user_id = data.pop('id', None)
+            user_id = data.get('id')
             if user_id:
-                try:
-                    user = User.objects.get(id=user_id)
-                    for key, value in data.items():
-                        setattr(user, key, value)
-                    updated_users.append(user)
-                except User.DoesNotExist: # pylint: disable=no-member
-                    pass # Handle as needed
-        User.objects.bulk_update(updated_users, fields=['username', 'email', 'first_name', 'last_name'])
-        return updated_users
+                changes.setdefault(user_id, {}).update({k: v for k, v in data.items() if k in UPDATABLE_FIELDS})
+
+        users = User.objects.in_bulk(list(changes))
+        now = timezone.now()
+        # Group users by the exact set of fields that changed, so each group is one bulk UPDATE
+        groups: Dict[frozenset, List[User]] = defaultdict(list)
+        for user_id, data in changes.items():
+            user = users.get(user_id)
+            if user is None:
+                continue
+            changed = {key for key, value in data.items() if getattr(user, key) != value}
+            for key in changed:
+                setattr(user, key, data[key])
+            if changed:
+                # bulk_update skips auto_now, so stamp it explicitly
+                user.updated_at = now
+                groups[frozenset(changed)].append(user)
+
+        with transaction.atomic():
+            for fields, group in groups.items():
+                User.objects.bulk_update(group, fields=[*sorted(fields), 'updated_at'], batch_size=batch_size)
+            # bulk_update sends no post_save, so retire the cached users here
+            UserCache().bump(user.pk for group in groups.values() for user in group)
+        return [users[user_id] for user_id in changes if user_id in users]
 
     def remove_one(self, id: int) -> bool:
         try:
@@ -83,32 +120,38 @@ class UserRepository(Repositories):
     def remove_many(self, ids: List[int]) -> None:
         User.objects.filter(id__in=ids).delete()
 
-    def search(self, query: str, field: str, page: Optional[int] = None, per_page: Optional[int] = None, sort: Optional[str] = None, sort_dir: Optional[str] = None, filters: Optional[dict] = None) -> Dict:
+    def search(self, query: str, field: str, page: Optional[int] = None, per_page: Optional[int] = None, sort: Optional[str] = None, sort_dir: Optional[str] = None, filters: Optional[dict] = None, count: Optional[str] = None, columns: Optional[Sequence[str]] = None) -> Dict:
+        # Served by the UPPER(field) gin_trgm_ops index on Postgres
         queryset = User.objects.filter(**{f'{field}__icontains': query})
         if filters:
             queryset = queryset.filter(**filters)
-        ordering = UserRepository._build_ordering(sort, sort_dir)
+        if sort == 'similarity' and SearchUtils.is_postgres(queryset):
+            queryset = SearchUtils.annotate_similarity(queryset, [field], query).order_by('-similarity', 'id')
+            return self._paginate_queryset(queryset, page, per_page, count, columns)
+        ordering = UserRepository._build_ordering(sort if sort != 'similarity' else 'id', sort_dir)
         if ordering:
             queryset = queryset.order_by(ordering)
-        return self._paginate_queryset(queryset, page, per_page)
+        return self._paginate_queryset(queryset, page, per_page, count, columns)
 
-    def filter(self, page: Optional[int] = None, per_page: Optional[int] = None, sort: Optional[str] = None, sort_dir: Optional[str] = None, filters: Optional[dict] = None) -> Dict:
+    def filter(self, page: Optional[int] = None, per_page: Optional[int] = None, sort: Optional[str] = None, sort_dir: Optional[str] = None, filters: Optional[dict] = None, count: Optional[str] = None, columns: Optional[Sequence[str]] = None) -> Dict:
         queryset = User.objects.all()
         user_filter = UserFilter(filters, queryset=queryset)
         queryset = user_filter.qs
         ordering = UserRepository._build_ordering(sort, sort_dir)
         if ordering:
             queryset = queryset.order_by(ordering)
-        return self._paginate_queryset(queryset, page, per_page)
+        return self._paginate_queryset(queryset, page, per_page, count, columns)
 
-    def find_by_id(self, id: int) -> Optional[User]:
+    def find_by_id(self, id: int, columns: Optional[Sequence[str]] = None) -> Optional[User]:
+        queryset = User.objects.only(*columns) if columns else User.objects.all()
         try:
-            return User.objects.get(id=id)
+            return queryset.get(id=id)
         except User.DoesNotExist: # pylint: disable=no-member
             return None
 
-    def find_by_ids(self, ids: List[int]) -> List[User]:
-        return list(User.objects.filter(id__in=ids))
+    def find_by_ids(self, ids: List[int], columns: Optional[Sequence[str]] = None) -> List[User]:
+        queryset = User.objects.only(*columns) if columns else User.objects.all()
+        return list(queryset.filter(id__in=ids))
 
     def exists_by_id(self, id: int) -> bool:
         return User.objects.filter(id=id).exists()
@@ -117,9 +160,17 @@ class UserRepository(Repositories):
         existing_ids = set(User.objects.filter(id__in=ids).values_list('id', flat=True))
         return {user_id: user_id in existing_ids for user_id in ids}
 
-    def _paginate_queryset(self, queryset: QuerySet, page: Optional[int] = None, per_page: Optional[int] = None) -> Dict:
+    def _paginate_queryset(self, queryset: QuerySet, page: Optional[int] = None, per_page: Optional[int] = None, count: Optional[str] = None, columns: Optional[Sequence[str]] = None) -> Dict:
+        if columns:
+            # Select only the columns the response renders; items come back as dicts
+            queryset = queryset.values(*columns)
+        if per_page and count not in (None, 'exact'):
+            return UserRepository._build_probed_response(queryset, page or 1, per_page, count)
+        # One aggregate gives the exact total and the list's conditional GET validators
+        validators = ConditionalUtils.validators(queryset, LAST_MODIFIED)
         if per_page:
             paginator = Paginator(queryset, per_page)
+            paginator.count = validators['count']
             try:
                 page_number = page if page is not None else 1
                 users_page = paginator.page(page_number)
@@ -127,19 +178,22 @@ class UserRepository(Repositories):
                 users_page = paginator.page(1)
             except EmptyPage:
                 users_page = paginator.page(paginator.num_pages)
-            return UserRepository._build_pagination_response(users_page, paginator)
+            return UserRepository._build_pagination_response(users_page, paginator, validators)
         else:
-            return UserRepository._build_pagination_response(queryset, None)
+            return UserRepository._build_pagination_response(queryset, None, validators)
 
     @staticmethod
-    def _build_pagination_response(users_page: Any, paginator: Optional[Paginator]) -> Dict:
+    def _build_pagination_response(users_page: Any, paginator: Optional[Paginator], validators: Optional[Dict] = None) -> Dict:
         if paginator:
             return {
                 'items': list(users_page.object_list),
                 'total': paginator.count,
                 'current_page': users_page.number,
                 'per_page': paginator.per_page,
-                'last_page': paginator.num_pages
+                'last_page': paginator.num_pages,
+                'has_next': users_page.has_next(),
+                'count_strategy': 'exact',
+                'validators': validators
             }
         else:
             return {
@@ -147,9 +201,28 @@ class UserRepository(Repositories):
                 'total': len(users_page),
                 'current_page': 1,
                 'per_page': len(users_page) if len(users_page) > 0 else 1,
-                'last_page': 1
+                'last_page': 1,
+                'has_next': False,
+                'count_strategy': 'exact',
+                'validators': validators
             }
 
+    @staticmethod
+    def _build_probed_response(queryset: QuerySet, page: int, per_page: int, count: str) -> Dict:
+        total, count_strategy = CountUtils.count(queryset, count)
+        offset = (page - 1) * per_page
+        # Fetch one extra row so has_next does not depend on the (possibly skipped) count
+        users = list(queryset[offset:offset + per_page + 1])
+        return {
+            'items': users[:per_page],
+            'total': total,
+            'current_page': page,
+            'per_page': per_page,
+            'last_page': (total + per_page - 1) // per_page if total is not None else None,
+            'has_next': len(users) > per_page,
+            'count_strategy': count_strategy
+        }
+
     @staticmethod
     def _build_ordering(sort_field: Optional[str], sort_direction: Optional[str]) -> Optional[str]:
         if sort_field:
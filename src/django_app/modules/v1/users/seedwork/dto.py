@@ -1,7 +1,7 @@
 # django_app/modules/v1/users/seedwork/dto.py
 
 from dataclasses import dataclass
-from typing import Generic, List, Optional, TypeVar
+from typing import Generic, List, Optional, Tuple, TypeVar
 
 Filter = TypeVar('Filter')
 Item = TypeVar('Item')
@@ -9,10 +9,14 @@ Item = TypeVar('Item')
 @dataclass(slots=True, frozen=True)
 class ListOutput(Generic[Item]):
     items: List[Item]
-    total: int
+    total: Optional[int]
     current_page: int
     per_page: int
-    last_page: int
+    last_page: Optional[int]
+    has_next: Optional[bool] = None
+    count_strategy: str = 'exact'
+    # Newest modification time and count of the filtered set, for the list ETag; None unless counted exactly
+    validators: Optional[dict] = None
 
 @dataclass(slots=True, frozen=True)
 class ListInput(Generic[Filter]):
@@ -20,4 +24,7 @@ class ListInput(Generic[Filter]):
     per_page: Optional[int] = None
     sort: Optional[str] = None
     sort_dir: Optional[str] = None
-    filter: Optional[Filter] = None
\ No newline at end of file
+    filter: Optional[Filter] = None
+    count: Optional[str] = None
+    # Model columns to select; list items are then plain dicts with just these keys
+    columns: Optional[Tuple[str, ...]] = None
\ No newline at end of file
@@ -1,7 +1,7 @@
 # django_app/modules/v1/users/seedwork/repositories.py
 
 from abc import ABC, abstractmethod
-from typing import Dict, Generic, List, Optional, TypeVar, Any
+from typing import Dict, Generic, List, Optional, Sequence, TypeVar, Any
 
 Params = TypeVar('Params')
 Output = TypeVar('Output')
@@ -13,7 +13,7 @@ class Repositories(ABC, Generic[Params, Output]):
         raise NotImplementedError()
 
     @abstractmethod
-    def find_all(self, page: Optional[int] = None, per_page: Optional[int] = None, sort: Optional[str] = None, sort_dir: Optional[str] = None, filters: Optional[dict] = None) -> Dict:
+    def find_all(self, page: Optional[int] = None, per_page: Optional[int] = None, sort: Optional[str] = None, sort_dir: Optional[str] = None, filters: Optional[dict] = None, count: Optional[str] = None, columns: Optional[Sequence[str]] = None) -> Dict:
         raise NotImplementedError()
 
     @abstractmethod
@@ -41,19 +41,19 @@ class Repositories(ABC, Generic[Params, Output]):
         raise NotImplementedError()
 
     @abstractmethod
-    def search(self, query: str, field: str, page: Optional[int] = None, per_page: Optional[int] = None, sort: Optional[str] = None, sort_dir: Optional[str] = None, filters: Optional[dict] = None) -> Dict:
+    def search(self, query: str, field: str, page: Optional[int] = None, per_page: Optional[int] = None, sort: Optional[str] = None, sort_dir: Optional[str] = None, filters: Optional[dict] = None, count: Optional[str] = None, columns: Optional[Sequence[str]] = None) -> Dict:
         raise NotImplementedError()
 
     @abstractmethod
-    def filter(self, page: Optional[int] = None, per_page: Optional[int] = None, sort: Optional[str] = None, sort_dir: Optional[str] = None, filters: Optional[dict] = None) -> Dict:
+    def filter(self, page: Optional[int] = None, per_page: Optional[int] = None, sort: Optional[str] = None, sort_dir: Optional[str] = None, filters: Optional[dict] = None, count: Optional[str] = None, columns: Optional[Sequence[str]] = None) -> Dict:
         raise NotImplementedError()
 
     @abstractmethod
-    def find_by_id(self, id: int) -> Optional[Output]:
+    def find_by_id(self, id: int, columns: Optional[Sequence[str]] = None) -> Optional[Output]:
         raise NotImplementedError()
 
     @abstractmethod
-    def find_by_ids(self, ids: List[int]) -> List[Output]:
+    def find_by_ids(self, ids: List[int], columns: Optional[Sequence[str]] = None) -> List[Output]:
         raise NotImplementedError()
 
     @abstractmethod
@@ -1,8 +1,14 @@
 # django_app/modules/v1/users/serializers.py
 
 from rest_framework import serializers
+from django_app.__shared.pagination import COUNT_STRATEGIES
+from django_app.__shared.serializers import SparseFieldsField, SparseFieldsMixin
+
 from .models import User
 
+# Fields of UserResponseSerializer, also the names accepted by ?fields=
+USER_RESPONSE_FIELDS = ('id', 'username', 'email', 'first_name', 'last_name', 'date_joined', 'last_login')
+
 class UserIdSerializer(serializers.Serializer):
     id = serializers.IntegerField()
 
@@ -43,6 +49,11 @@ class PaginationRequestSerializer(serializers.Serializer):
     per_page = serializers.IntegerField(required=False, default=10)
     sort = serializers.CharField(required=False, default='id')
     sort_dir = serializers.ChoiceField(choices=['asc', 'desc'], required=False, default='asc')
+    count = serializers.ChoiceField(choices=COUNT_STRATEGIES, required=False, default='exact')
+    fields = SparseFieldsField(allowed=USER_RESPONSE_FIELDS, required=False)
+
+class UserFieldsRequestSerializer(serializers.Serializer):
+    fields = SparseFieldsField(allowed=USER_RESPONSE_FIELDS, required=False)
 
 class UserSearchRequestSerializer(PaginationRequestSerializer):
     query = serializers.CharField()
@@ -55,10 +66,10 @@ class UserFilterRequestSerializer(PaginationRequestSerializer):
     first_name = serializers.CharField(required=False)
     last_name = serializers.CharField(required=False)
 
-class UserResponseSerializer(serializers.ModelSerializer):
+class UserResponseSerializer(SparseFieldsMixin, serializers.ModelSerializer):
     class Meta:
         model = User
-        fields = ('id', 'username', 'email', 'first_name', 'last_name', 'date_joined', 'last_login')
+        fields = USER_RESPONSE_FIELDS
 
 class UserCreateResponseSerializer(serializers.ModelSerializer):
     class Meta:
@@ -71,10 +82,12 @@ class UserExistsResponseSerializer(serializers.Serializer):
 
 class PaginationResponseSerializer(serializers.Serializer):
     items = serializers.ListField()
-    total = serializers.IntegerField()
+    total = serializers.IntegerField(allow_null=True)
     current_page = serializers.IntegerField()
     per_page = serializers.IntegerField()
-    last_page = serializers.IntegerField()
+    last_page = serializers.IntegerField(allow_null=True)
+    has_next = serializers.BooleanField(required=False)
+    count_strategy = serializers.ChoiceField(choices=COUNT_STRATEGIES, required=False)
 
 # serializers.py
 class UserQuerySerializer(serializers.Serializer):
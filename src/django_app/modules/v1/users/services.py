@@ -1,4 +1,71 @@
-# django_app/modules/v1/places/services.py
+# django_app/modules/v1/users/services.py
+
+import multiprocessing
+import os
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from typing import Iterable, List, Optional, Tuple
+
+from django.conf import settings
+from django.contrib.auth import hashers
+
+# Worker processes for bulk password hashing; 0 (the default) hashes on the calling thread
+PASSWORD_HASHING_WORKERS = getattr(settings, 'PASSWORD_HASHING_WORKERS', 0)
+
+def _init_hashing_worker(password_hashers):
+    # Hashing needs the hasher list only, so a worker never loads apps or opens connections
+    if not settings.configured:
+        settings.configure(PASSWORD_HASHERS=password_hashers)
 
 class UserService:
-    pass
\ No newline at end of file
+    pass
+
+class PasswordHashingService:
+    """Hashes batches of passwords in parallel on a process pool, for bulk user creation.
+
+    Single logins and password changes stay on the model's inline set_password/check_password:
+    a request would block on the pool's result anyway and pays an IPC round trip for it. The
+    pool is opt-in (PASSWORD_HASHING_WORKERS) and starts on first use in each process.
+    """
+
+    def __init__(self, workers=PASSWORD_HASHING_WORKERS):
+        self.workers = workers
+        self._executor = None
+        self._pid = None
+        self._lock = threading.Lock()
+
+    @property
+    def executor(self) -> ProcessPoolExecutor:
+        if self._executor is None or self._pid != os.getpid():
+            with self._lock:
+                if self._executor is None or self._pid != os.getpid():
+                    self._executor = ProcessPoolExecutor(
+                        max_workers=self.workers,
+                        # Forking a threaded server process is unsafe; spawn starts clean workers
+                        mp_context=multiprocessing.get_context('spawn'),
+                        initializer=_init_hashing_worker,
+                        initargs=(list(settings.PASSWORD_HASHERS),),
+                    )
+                    self._pid = os.getpid()
+        return self._executor
+
+    def hash(self, password: Optional[str]) -> str:
+        if password is None or not self.workers:
+            return hashers.make_password(password)
+        return self.executor.submit(hashers.make_password, password).result()
+
+    def hash_many(self, passwords: Iterable[Optional[str]]) -> List[str]:
+        passwords = list(passwords)
+        if not self.workers or len(passwords) < 2:
+            return [hashers.make_password(password) for password in passwords]
+        # A few chunks per worker keeps them all busy without one round trip per password
+        chunksize = max(1, len(passwords) // (self.workers * 4))
+        return list(self.executor.map(hashers.make_password, passwords, chunksize=chunksize))
+
+    def verify(self, password: Optional[str], encoded: str) -> Tuple[bool, bool]:
+        """(is_correct, must_update), as django.contrib.auth.hashers.verify_password."""
+        if not self.workers:
+            return hashers.verify_password(password, encoded)
+        return self.executor.submit(hashers.verify_password, password, encoded).result()
+
+password_hashing = PasswordHashingService()
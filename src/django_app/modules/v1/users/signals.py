@@ -0,0 +1,43 @@
+# django_app/modules/v1/users/signals.py
+
+from django.contrib.auth.models import Group
+from django.db.models.signals import m2m_changed, post_delete, post_save
+from django.dispatch import receiver
+
+from .cache import UserCache
+from .models import User
+
+# Any save retires the cached user: authentication re-checks is_active and the password hash,
+# and views such as the user details endpoint render every other field from the same object
+@receiver(post_save, sender=User, dispatch_uid='users_cache_post_save')
+@receiver(post_delete, sender=User, dispatch_uid='users_cache_post_delete')
+def bump_user_cache(sender, instance, **kwargs):
+    UserCache().bump([instance.pk])
+
+# Group and permission changes alter what a cached user is allowed to do
+@receiver(m2m_changed, sender=User.groups.through, dispatch_uid='users_cache_groups_changed')
+@receiver(m2m_changed, sender=User.user_permissions.through, dispatch_uid='users_cache_permissions_changed')
+def bump_user_cache_on_relations(sender, instance, action, reverse, pk_set, **kwargs):
+    if not reverse:
+        if action.startswith('post_'):
+            UserCache().bump([instance.pk])
+    elif action == 'pre_clear':
+        # Clearing from the group/permission side carries no pk_set, so collect its users first
+        field = 'groups' if sender is User.groups.through else 'user_permissions'
+        UserCache().bump(User.objects.filter(**{field: instance}).values_list('pk', flat=True))
+    elif action in ('post_add', 'post_remove'):
+        UserCache().bump(pk_set or [])
+
+@receiver(m2m_changed, sender=Group.permissions.through, dispatch_uid='users_cache_group_permissions_changed')
+def bump_group_members(sender, instance, action, reverse, pk_set, **kwargs):
+    if not reverse:
+        if not action.startswith('post_'):
+            return
+        members = User.objects.filter(groups=instance)
+    elif action == 'pre_clear':
+        members = User.objects.filter(groups__permissions=instance)
+    elif action in ('post_add', 'post_remove'):
+        members = User.objects.filter(groups__in=pk_set or [])
+    else:
+        return
+    UserCache().bump(members.values_list('pk', flat=True).distinct())
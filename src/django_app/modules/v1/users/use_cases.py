@@ -1,7 +1,7 @@
 # django_app/modules/v1/users/use_cases.py
 
 from dataclasses import dataclass, asdict
-from typing import Optional, List
+from typing import Any, Dict, Optional, List, Tuple
 from rest_framework.exceptions import NotFound
 
 from .seedwork.dto import ListInput, ListOutput
@@ -38,7 +38,7 @@ class FindAllUseCase(UseCases):
     class Input(ListInput[dict]):
         pass
 
-    class Output(ListOutput[User]):
+    class Output(ListOutput[Dict[str, Any]]):
         pass
 
     def execute(self, input_param: 'Input') -> 'Output':
@@ -47,7 +47,9 @@ class FindAllUseCase(UseCases):
             per_page=input_param.per_page,
             sort=input_param.sort,
             sort_dir=input_param.sort_dir,
-            filters=input_param.filter
+            filters=input_param.filter,
+            count=input_param.count,
+            columns=input_param.columns
         )
         return self.Output(**list_data)
 
@@ -177,7 +179,7 @@ class SearchUseCase(UseCases):
         query: str
         field: str
 
-    class Output(ListOutput[User]):
+    class Output(ListOutput[Dict[str, Any]]):
         pass
 
     def execute(self, input_param: 'Input') -> 'Output':
@@ -188,7 +190,9 @@ class SearchUseCase(UseCases):
             per_page=input_param.per_page,
             sort=input_param.sort,
             sort_dir=input_param.sort_dir,
-            filters=input_param.filter
+            filters=input_param.filter,
+            count=input_param.count,
+            columns=input_param.columns
         )
         return self.Output(**list_data)
 
@@ -203,17 +207,19 @@ class FilterUseCase(UseCases):
         first_name: Optional[str] = None
         last_name: Optional[str] = None
 
-    class Output(ListOutput[User]):
+    class Output(ListOutput[Dict[str, Any]]):
         pass
 
     def execute(self, input_param: 'Input') -> 'Output':
-        filters = {k: v for k, v in asdict(input_param).items() if v is not None and k not in ['page', 'per_page', 'sort', 'sort_dir']}
+        filters = {k: v for k, v in asdict(input_param).items() if v is not None and k not in ['page', 'per_page', 'sort', 'sort_dir', 'count', 'columns']}
         list_data = self.repository.filter(
             filters=filters,
             page=input_param.page,
             per_page=input_param.per_page,
             sort=input_param.sort,
-            sort_dir=input_param.sort_dir
+            sort_dir=input_param.sort_dir,
+            count=input_param.count,
+            columns=input_param.columns
         )
         return self.Output(**list_data)
 
@@ -224,13 +230,14 @@ class FindByIdUseCase(UseCases):
     @dataclass(slots=True, frozen=True)
     class Input:
         id: int
+        columns: Optional[Tuple[str, ...]] = None
 
     @dataclass(slots=True, frozen=True)
     class Output:
         user: Optional[User]
 
     def execute(self, input_param: 'Input') -> 'Output':
-        user = self.repository.find_by_id(id=input_param.id)
+        user = self.repository.find_by_id(id=input_param.id, columns=input_param.columns)
         if user is None:
             raise NotFound(detail="User not found.")
         return self.Output(user=user)
@@ -242,13 +249,14 @@ class FindByIdsUseCase(UseCases):
     @dataclass(slots=True, frozen=True)
     class Input:
         ids: List[int]
+        columns: Optional[Tuple[str, ...]] = None
 
     @dataclass(slots=True, frozen=True)
     class Output:
         users: List[User]
 
     def execute(self, input_param: 'Input') -> 'Output':
-        users = self.repository.find_by_ids(ids=input_param.ids)
+        users = self.repository.find_by_ids(ids=input_param.ids, columns=input_param.columns)
         if not users:
             raise NotFound("No users found.")
         return self.Output(users=users)
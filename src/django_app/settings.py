@@ -97,6 +97,20 @@ DATABASES = {
     'default': config.DATABASE_CONFIG
 }
 
+# Cache
+# https://docs.djangoproject.com/en/5.2/topics/cache/
+
+CACHES = {
+    'default': config.CACHE_CONFIG
+}
+
+PLACE_CACHE_TIMEOUT = config.PLACE_CACHE_TIMEOUT
+USER_CACHE_TIMEOUT = config.USER_CACHE_TIMEOUT
+USER_CACHE_LOCAL_TIMEOUT = config.USER_CACHE_LOCAL_TIMEOUT
+TOKEN_BLACKLIST_SYNC_INTERVAL = config.TOKEN_BLACKLIST_SYNC_INTERVAL
+TOKEN_WRITE_FLUSH_INTERVAL = config.TOKEN_WRITE_FLUSH_INTERVAL
+PASSWORD_HASHING_WORKERS = config.PASSWORD_HASHING_WORKERS
+
 AUTH_USER_MODEL = 'users.User'
 
 # Password validation
@@ -146,7 +160,18 @@ from datetime import timedelta
 REST_FRAMEWORK = {
     "DEFAULT_AUTHENTICATION_CLASSES": [
         # 'dj_rest_auth.jwt_auth.JWTCookieAuthentication',
-        "rest_framework_simplejwt.authentication.JWTAuthentication", # Use this to allow only Authorization Header
+        # "rest_framework_simplejwt.authentication.JWTAuthentication", # Use this to allow only Authorization Header
+        "django_app.modules.v1.auth.authentication.CachedJWTAuthentication", # Same header, user resolved from the cache
+    ],
+    # orjson-backed JSON in and out; both fall back to DRF's stdlib implementation if orjson is missing
+    "DEFAULT_RENDERER_CLASSES": [
+        "django_app.__shared.renderers.ORJSONRenderer",
+        "rest_framework.renderers.BrowsableAPIRenderer",
+    ],
+    "DEFAULT_PARSER_CLASSES": [
+        "django_app.__shared.parsers.ORJSONParser",
+        "rest_framework.parsers.FormParser",
+        "rest_framework.parsers.MultiPartParser",
     ],
 }
 
@@ -163,7 +188,8 @@ REST_AUTH = {
     # "JWT_AUTH_REFRESH_COOKIE": "_refresh",
     "JWT_AUTH_HTTPONLY": False,  # Makes sure refresh token is sent
     "PASSWORD_RESET_USE_SITES_DOMAIN": config.PASSWORD_RESET_USE_SITES_DOMAIN,
-    'PASSWORD_RESET_SERIALIZER': 'django_app.modules.v1.auth.serializers.CustomPasswordResetSerializer'
+    'PASSWORD_RESET_SERIALIZER': 'django_app.modules.v1.auth.serializers.CustomPasswordResetSerializer',
+    'JWT_TOKEN_CLAIMS_SERIALIZER': 'django_app.modules.v1.auth.serializers.CustomTokenObtainPairSerializer',
 }
 
 RESET_PASSWORD_REDIRECT_URL = config.RESET_PASSWORD_REDIRECT_URL
@@ -195,6 +221,11 @@ SIMPLE_JWT = {
     "TOKEN_TYPE_CLAIM": "token_type",
     "TOKEN_USER_CLASS": "rest_framework_simplejwt.models.TokenUser",
 
+    "TOKEN_OBTAIN_SERIALIZER": "django_app.modules.v1.auth.serializers.CustomTokenObtainPairSerializer",
+    "TOKEN_REFRESH_SERIALIZER": "django_app.modules.v1.auth.serializers.CustomTokenRefreshSerializer",
+    "TOKEN_VERIFY_SERIALIZER": "django_app.modules.v1.auth.serializers.CustomTokenVerifySerializer",
+    "TOKEN_BLACKLIST_SERIALIZER": "django_app.modules.v1.auth.serializers.CustomTokenBlacklistSerializer",
+
     "JTI_CLAIM": "jti",
 
     "SLIDING_TOKEN_REFRESH_EXP_CLAIM": "refresh_exp",